@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Houston 100 Faith AI Assistant - LLM Admission Control
+
+Admission controller in front of run_conversation's model calls:
+- Requests-per-minute and tokens-per-minute budgets, refilled continuously,
+  granted together so a request never holds one budget while waiting on the other
+- A bounded priority queue: Kingdom members ahead of Builder, Builder ahead
+  of Steward, anonymous sessions last; first come first served within a tier
+- Load shedding: a request still queued at its deadline is rejected with a
+  clear error instead of piling onto an overloaded provider
+- Queue depth, wait time and shed counts per tier for the health metrics
+
+Token cost is estimated up front (prompt characters / 4 plus the completion
+budget) and one model call is reserved. Callers report the real token usage
+and model-call count on the ticket; release settles the difference, refunding
+unused tokens and charging tokens and calls beyond the reservation.
+"""
+
+import math
+import time
+import heapq
+import itertools
+import threading
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Iterator, Optional
+
+# Lower ranks are served first
+TIER_PRIORITY = {"Kingdom": 0, "Builder": 1, "Steward": 2}
+ANONYMOUS_PRIORITY = len(TIER_PRIORITY)
+ANONYMOUS_TIER = "anonymous"
+CHARS_PER_TOKEN = 4
+WAIT_SAMPLES = 1000  # Recent wait times kept per tier for percentiles
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is shed because the queue is full or its deadline passed"""
+
+    def __init__(self, message: str, reason: str, retry_after_seconds: float):
+        super().__init__(message)
+        self.reason = reason
+        self.retry_after_seconds = retry_after_seconds
+
+
+def estimate_tokens(prompt: str, max_completion_tokens: int) -> int:
+    return math.ceil(len(prompt) / CHARS_PER_TOKEN) + max_completion_tokens
+
+
+class _Budget:
+    """Per-minute allowance refilled continuously; not locked, the controller's lock guards it"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.available = self.capacity
+        self.updated_at = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.available = min(self.capacity, self.available + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def seconds_until(self, amount: float) -> float:
+        shortfall = min(amount, self.capacity) - self.available
+        return shortfall / self.rate if shortfall > 0 else 0.0
+
+
+@dataclass(order=True)
+class AdmissionTicket:
+    """A queued or admitted request"""
+    priority: int
+    sequence: int
+    tier: str = field(compare=False)
+    tokens: int = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    deadline: float = field(compare=False)
+    admitted_at: Optional[float] = field(default=None, compare=False)
+    cancelled: bool = field(default=False, compare=False)
+    used_tokens: Optional[int] = field(default=None, compare=False)
+    used_requests: int = field(default=1, compare=False)
+
+    def record_usage(self, tokens: int, requests: int = 1) -> None:
+        """Actual tokens and model calls used; settled against the reservation on release"""
+        self.used_tokens = tokens
+        self.used_requests = requests
+
+    @property
+    def wait_seconds(self) -> float:
+        return (self.admitted_at or time.monotonic()) - self.enqueued_at
+
+
+@dataclass
+class _TierStats:
+    admitted: int = 0
+    shed: int = 0
+    rejected: int = 0
+    waits: deque = field(default_factory=lambda: deque(maxlen=WAIT_SAMPLES))
+
+
+class AdmissionController:
+    """Token-aware, tier-priority admission for LLM calls"""
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float,
+                 max_queue_depth: int = 200, queue_timeout_seconds: float = 30.0):
+        self.requests = _Budget(requests_per_minute)
+        self.tokens = _Budget(tokens_per_minute)
+        self.max_queue_depth = max_queue_depth
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self._queue: List[AdmissionTicket] = []
+        self._queued = 0
+        self._peak_depth = 0
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._stats: Dict[str, _TierStats] = {
+            tier: _TierStats() for tier in [*TIER_PRIORITY, ANONYMOUS_TIER]
+        }
+
+    @staticmethod
+    def _tier_name(tier: Optional[str]) -> str:
+        return tier if tier in TIER_PRIORITY else ANONYMOUS_TIER
+
+    def _head(self) -> Optional[AdmissionTicket]:
+        while self._queue and self._queue[0].cancelled:
+            heapq.heappop(self._queue)
+        return self._queue[0] if self._queue else None
+
+    def _shed_lowest(self, incoming_priority: int) -> bool:
+        """Make room for a higher-priority request by shedding the lowest queued one"""
+        candidates = [ticket for ticket in self._queue if not ticket.cancelled]
+        if not candidates:
+            return False
+        lowest = max(candidates)
+        if lowest.priority <= incoming_priority:
+            return False
+        lowest.cancelled = True
+        self._queued -= 1
+        self._stats[lowest.tier].rejected += 1
+        return True
+
+    def acquire(self, tokens: int, tier: Optional[str] = None,
+                timeout: Optional[float] = None) -> AdmissionTicket:
+        """Queue for admission; blocks until both budgets allow the request or raises AdmissionRejected"""
+        tier = self._tier_name(tier)
+        tokens = int(min(tokens, self.tokens.capacity))
+        now = time.monotonic()
+        ticket = AdmissionTicket(
+            priority=TIER_PRIORITY.get(tier, ANONYMOUS_PRIORITY),
+            sequence=next(self._sequence),
+            tier=tier,
+            tokens=tokens,
+            enqueued_at=now,
+            deadline=now + (self.queue_timeout_seconds if timeout is None else timeout)
+        )
+
+        with self._condition:
+            if self._queued >= self.max_queue_depth and not self._shed_lowest(ticket.priority):
+                self._stats[tier].rejected += 1
+                raise AdmissionRejected(
+                    f"Request queue is full ({self.max_queue_depth} waiting)",
+                    reason="queue_full",
+                    retry_after_seconds=self._retry_after()
+                )
+            heapq.heappush(self._queue, ticket)
+            self._queued += 1
+            self._peak_depth = max(self._peak_depth, self._queued)
+            self._condition.notify_all()
+
+            while True:
+                if ticket.cancelled:
+                    # Displaced by a higher-priority request while queued
+                    raise AdmissionRejected(
+                        "Request was displaced by higher-priority traffic",
+                        reason="displaced",
+                        retry_after_seconds=self._retry_after()
+                    )
+                now = time.monotonic()
+                wait = ticket.deadline - now
+                if self._head() is ticket:
+                    self.requests.refill(now)
+                    self.tokens.refill(now)
+                    budget_wait = max(self.requests.seconds_until(1), self.tokens.seconds_until(tokens))
+                    if budget_wait == 0:
+                        heapq.heappop(self._queue)
+                        self._queued -= 1
+                        self.requests.available -= 1
+                        self.tokens.available -= tokens
+                        ticket.admitted_at = now
+                        stats = self._stats[tier]
+                        stats.admitted += 1
+                        stats.waits.append(ticket.wait_seconds)
+                        self._condition.notify_all()
+                        return ticket
+                    wait = min(wait, budget_wait)
+
+                if now >= ticket.deadline:
+                    ticket.cancelled = True
+                    self._queued -= 1
+                    self._stats[tier].shed += 1
+                    self._condition.notify_all()
+                    raise AdmissionRejected(
+                        f"Request waited {now - ticket.enqueued_at:.1f}s without capacity and was shed",
+                        reason="deadline_exceeded",
+                        retry_after_seconds=self._retry_after()
+                    )
+                self._condition.wait(max(wait, 0.0))
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        """Settle a ticket's recorded usage against its reservation
+
+        Unused estimated tokens are refunded; tokens and model calls beyond
+        the reservation are charged, which can leave a budget in debt that
+        later requests wait out.
+        """
+        token_refund = 0 if ticket.used_tokens is None else ticket.tokens - ticket.used_tokens
+        extra_requests = max(0, ticket.used_requests - 1)
+        if not token_refund and not extra_requests:
+            return
+        with self._condition:
+            now = time.monotonic()
+            self.tokens.refill(now)
+            self.requests.refill(now)
+            self.tokens.available = min(self.tokens.capacity, self.tokens.available + token_refund)
+            self.requests.available -= extra_requests
+            self._condition.notify_all()
+
+    @contextmanager
+    def admit(self, tokens: int, tier: Optional[str] = None,
+              timeout: Optional[float] = None) -> Iterator[AdmissionTicket]:
+        ticket = self.acquire(tokens, tier, timeout)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    def _retry_after(self) -> float:
+        """Rough time for the current backlog to drain at the request budget"""
+        return round(max(1.0, self._queued / self.requests.rate if self.requests.rate else 1.0), 1)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._condition:
+            now = time.monotonic()
+            self.requests.refill(now)
+            self.tokens.refill(now)
+            by_tier = {}
+            for tier, stats in self._stats.items():
+                waits = sorted(stats.waits)
+                by_tier[tier] = {
+                    "queued": sum(1 for ticket in self._queue if ticket.tier == tier and not ticket.cancelled),
+                    "admitted": stats.admitted,
+                    "shed": stats.shed,
+                    "rejected": stats.rejected,
+                    "wait_ms_p50": round(waits[len(waits) // 2] * 1000, 1) if waits else 0.0,
+                    "wait_ms_p95": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))] * 1000, 1) if waits else 0.0,
+                    "wait_ms_max": round(waits[-1] * 1000, 1) if waits else 0.0
+                }
+            return {
+                "queue_depth": self._queued,
+                "peak_queue_depth": self._peak_depth,
+                "max_queue_depth": self.max_queue_depth,
+                "requests_budget_remaining": round(self.requests.available, 1),
+                "tokens_budget_remaining": round(self.tokens.available),
+                "by_tier": by_tier
+            }
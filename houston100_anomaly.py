@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Houston 100 Faith AI Assistant - Streaming Anomaly Detection
+
+Constant-memory detectors for live latency and error-rate metrics:
+- An EWMA mean/variance baseline per metric with a k-sigma band; a fast
+  EWMA of band-clipped points must stay outside its (narrower) band for
+  most of the last few points to flag a level shift, so a single spike,
+  which can move the fast average by at most one clipped step, never alerts
+- A log-bucketed quantile sketch (1% relative accuracy, bounded bins) of
+  the metric's whole history; drift is flagged when the baseline itself
+  climbs clearly past the long-run 95th percentile, which catches
+  degradation too gradual to ever leave the band. The margin (with
+  hysteresis) keeps a baseline still decaying back after one blip on a
+  mostly-zero series, whose p95 is 0, from counting as drift
+- Error rates are rolled up into fixed intervals before detection
+- One alert per anomaly episode, cleared when the metric recovers
+
+Metric names are "<kind>" or "<kind>:<instance>" (e.g. "tool_latency_ms:
+system_health_check"); the kind selects the detector profile.
+"""
+
+import math
+import time
+import logging
+import datetime
+import threading
+from collections import deque
+from typing import Dict, List, Any, Optional, Tuple
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BINS = 2048
+DRIFT_REFRESH_EVERY = 32  # Observations between long-run quantile refreshes
+RECENT_ANOMALIES = 200
+SHIFTED_LEARNING_FACTOR = 0.1  # Baseline learning rate multiplier while a shift is under way
+DRIFT_OPEN_MARGIN = 0.5  # Fast-band widths the baseline must clear past the long-run quantile to open drift
+DRIFT_CLOSE_MARGIN = 0.1  # Fast-band widths within which it must fall back to close drift
+
+# Detector settings per metric kind; "direction" is the side that counts as worse
+METRIC_PROFILES: Dict[str, Dict[str, Any]] = {
+    "response_time_ms": {"direction": "upper", "min_std": 5.0},
+    "error_rate": {"direction": "upper", "min_std": 0.5, "warmup": 10, "drift_warmup": 60},
+    "tool_latency_ms": {"direction": "upper", "min_std": 1.0},
+    "integration_sync_rate": {"direction": "lower", "min_std": 1.0, "warmup": 10, "drift_warmup": 60},
+}
+DEFAULT_PROFILE: Dict[str, Any] = {"direction": "upper"}
+
+
+class QuantileSketch:
+    """Streaming quantiles with bounded relative error in bounded memory
+
+    Values share a bucket when they are within ``relative_accuracy`` of each
+    other (logarithmic buckets). Past ``max_bins`` the lowest buckets are
+    merged, so only the low tail loses accuracy. Values at or below zero
+    are counted in a separate zero bucket.
+    """
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+                 max_bins: int = DEFAULT_MAX_BINS):
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.max_bins = max_bins
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        if value <= 0:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        bins = self.bins
+        if key in bins:
+            bins[key] += 1
+            return
+        bins[key] = 1
+        if len(bins) > self.max_bins:
+            lowest = min(bins)
+            merged = bins.pop(lowest)
+            bins[min(bins)] += merged
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if rank < seen:
+                # Bucket midpoint: within relative_accuracy of every value in it
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.bins) / (self.gamma + 1)
+
+
+class StreamingDetector:
+    """EWMA band plus long-run quantile drift detector for one metric"""
+
+    def __init__(self, metric: str, direction: str = "upper", alpha: float = 0.05,
+                 fast_alpha: float = 0.3, band_sigmas: float = 4.0, window: int = 5, persistence: int = 4,
+                 warmup: int = 30, drift_quantile: float = 0.95, drift_warmup: int = 200,
+                 min_std: float = 0.0):
+        self.metric = metric
+        self.direction = direction
+        self.alpha = alpha
+        self.fast_alpha = fast_alpha
+        # Standard deviation of an EWMA relative to that of the points it averages
+        self._fast_scale = math.sqrt(fast_alpha / (2 - fast_alpha))
+        self.band_sigmas = band_sigmas
+        self.persistence = persistence
+        self.warmup = warmup
+        self.drift_quantile = drift_quantile if direction != "lower" else 1 - drift_quantile
+        self.drift_warmup = drift_warmup
+        self.min_std = min_std
+        self._window_mask = (1 << window) - 1
+        self.sketch = QuantileSketch()
+        self.count = 0
+        self.mean = 0.0
+        self.variance = 0.0
+        self.fast_mean = 0.0
+        self.last_value: Optional[float] = None
+        self._recent = 0  # Bit i set when the fast average left its band i observations ago
+        self._drift_threshold: Optional[float] = None
+        self.active: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def std(self) -> float:
+        return max(math.sqrt(self.variance), self.min_std, abs(self.mean) * 0.01)
+
+    def band(self) -> Tuple[float, float]:
+        width = self.band_sigmas * self.std
+        return self.mean - width, self.mean + width
+
+    def update(self, value: float) -> List[Dict[str, Any]]:
+        """Add one observation; returns anomalies that started with it"""
+        self.count += 1
+        self.last_value = value
+        self.sketch.add(value)
+        if self.count == 1:
+            self.mean = self.fast_mean = value
+            return []
+
+        warm = self.count > self.warmup
+        # Outliers count clipped to the band edge so one spike cannot widen the band
+        width = self.band_sigmas * self.std
+        deviation = value - self.mean
+        clipped = self.mean + max(-width, min(width, deviation)) if warm else value
+        self.fast_mean += self.fast_alpha * (clipped - self.fast_mean)
+
+        fast_deviation = self.fast_mean - self.mean
+        fast_width = width * self._fast_scale
+        if self.direction == "upper":
+            outside = fast_deviation > fast_width
+        elif self.direction == "lower":
+            outside = fast_deviation < -fast_width
+        else:
+            outside = abs(fast_deviation) > fast_width
+        outside = outside and warm
+        self._recent = ((self._recent << 1) | outside) & self._window_mask
+
+        # The baseline learns slowly while the recent average is out of band, so a shift is
+        # reported before it is absorbed yet a lasting new level becomes the norm eventually
+        if not warm:
+            alpha = max(self.alpha, 1 / self.count)  # Plain running mean until the EWMA has history
+        elif outside:
+            alpha = self.alpha * SHIFTED_LEARNING_FACTOR
+        else:
+            alpha = self.alpha
+        diff = clipped - self.mean
+        increment = alpha * diff
+        self.mean += increment
+        self.variance = (1 - alpha) * (self.variance + diff * increment)
+
+        if not warm:
+            return []
+
+        started = []
+        out_count = bin(self._recent).count("1")
+        if out_count >= self.persistence:
+            if "level_shift" not in self.active:
+                started.append(self._open("level_shift", value))
+        elif out_count == 0 and "level_shift" in self.active:
+            self._close("level_shift")
+
+        if self.count >= self.drift_warmup:
+            if self._drift_threshold is None or self.count % DRIFT_REFRESH_EVERY == 0:
+                self._drift_threshold = self.sketch.quantile(self.drift_quantile)
+            fast_width = self.band_sigmas * self.std * self._fast_scale
+            margin = fast_width * (DRIFT_CLOSE_MARGIN if "drift" in self.active else DRIFT_OPEN_MARGIN)
+            drifting = (self.mean > self._drift_threshold + margin if self.direction != "lower"
+                        else self.mean < self._drift_threshold - margin)
+            if drifting and "drift" not in self.active:
+                started.append(self._open("drift", value))
+            elif not drifting and "drift" in self.active:
+                self._close("drift")
+        return started
+
+    def _open(self, kind: str, value: float) -> Dict[str, Any]:
+        if kind == "level_shift":
+            tolerance = self.band_sigmas * self.std * self._fast_scale
+            message = (f"{self.metric} recent average {self.fast_mean:.2f} has shifted away from its "
+                       f"baseline {self.mean:.2f} +/- {tolerance:.2f} (latest {value:.2f})")
+        else:
+            message = (f"{self.metric} baseline {self.mean:.2f} has drifted past its long-run "
+                       f"p{round(self.drift_quantile * 100)} of {self._drift_threshold:.2f}")
+        anomaly = {
+            "severity": "MEDIUM" if kind == "level_shift" else "LOW",
+            "component": "anomaly_detection",
+            "metric": self.metric,
+            "kind": kind,
+            "value": round(value, 3),
+            "baseline": round(self.mean, 3),
+            "message": message,
+            "timestamp": datetime.datetime.now().isoformat()
+        }
+        self.active[kind] = anomaly
+        return anomaly
+
+    def _close(self, kind: str) -> None:
+        self.active.pop(kind, None)
+
+    def summary(self) -> Dict[str, Any]:
+        low, high = self.band()
+        return {
+            "observations": self.count,
+            "latest": None if self.last_value is None else round(self.last_value, 3),
+            "ewma": round(self.mean, 3),
+            "recent_ewma": round(self.fast_mean, 3),
+            "band": [round(low, 3), round(high, 3)],
+            "p50": self._rounded_quantile(0.5),
+            "p95": self._rounded_quantile(0.95),
+            "p99": self._rounded_quantile(0.99),
+            "active_anomalies": sorted(self.active)
+        }
+
+    def _rounded_quantile(self, q: float) -> Optional[float]:
+        value = self.sketch.quantile(q)
+        return None if value is None else round(value, 3)
+
+
+class _IntervalRate:
+    """Bad-event percentage over fixed intervals, emitted when an interval closes"""
+
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self.epoch: Optional[int] = None
+        self.total = 0
+        self.bad = 0
+
+    def add(self, bad: bool, now: float) -> Optional[float]:
+        epoch = int(now // self.interval_seconds)
+        closed = None
+        if epoch != self.epoch:
+            if self.total:
+                closed = self.bad / self.total * 100
+            self.epoch, self.total, self.bad = epoch, 0, 0
+        self.total += 1
+        self.bad += bad
+        return closed
+
+
+class AnomalyMonitor:
+    """Registry of streaming detectors feeding the health monitor's alerts"""
+
+    def __init__(self, interval_seconds: float = 60.0,
+                 profiles: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.interval_seconds = interval_seconds
+        self.profiles = dict(METRIC_PROFILES if profiles is None else profiles)
+        self.detectors: Dict[str, StreamingDetector] = {}
+        self.recent: deque = deque(maxlen=RECENT_ANOMALIES)
+        self.logger = logging.getLogger(__name__)
+        self._rates: Dict[str, _IntervalRate] = {}
+        self._lock = threading.Lock()
+
+    def _detector(self, metric: str) -> StreamingDetector:
+        detector = self.detectors.get(metric)
+        if detector is None:
+            profile = self.profiles.get(metric.split(":", 1)[0], DEFAULT_PROFILE)
+            detector = self.detectors[metric] = StreamingDetector(metric, **profile)
+        return detector
+
+    def observe(self, metric: str, value: float) -> List[Dict[str, Any]]:
+        """Feed one observation; returns anomalies that started with it"""
+        with self._lock:
+            anomalies = self._detector(metric).update(value)
+            if anomalies:
+                self.recent.extend(anomalies)
+        for anomaly in anomalies:
+            self.logger.warning("Anomaly detected: %s", anomaly["message"])
+        return anomalies
+
+    def observe_outcome(self, metric: str, bad: bool, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Count one event toward ``metric``'s interval error rate (in percent)"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            rate = self._rates.get(metric)
+            if rate is None:
+                rate = self._rates[metric] = _IntervalRate(self.interval_seconds)
+            closed = rate.add(bad, now)
+        return [] if closed is None else self.observe(metric, closed)
+
+    def active_anomalies(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [anomaly for detector in self.detectors.values() for anomaly in detector.active.values()]
+
+    def is_anomalous(self, *kinds: str) -> bool:
+        """Whether any metric of the given kinds has an open anomaly"""
+        with self._lock:
+            return any(
+                detector.active for metric, detector in self.detectors.items()
+                if metric.split(":", 1)[0] in kinds
+            )
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "metrics": {metric: detector.summary() for metric, detector in sorted(self.detectors.items())},
+                "recent_anomalies": list(self.recent)[-20:]
+            }
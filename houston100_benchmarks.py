@@ -0,0 +1,609 @@
+#!/usr/bin/env python3
+"""
+Houston 100 Faith AI Assistant - Micro-Benchmark Suite
+
+Seeded synthetic-data benchmarks with JSON baselines and regression checks:
+- analyzer: KingdomInvestmentAnalyzer.analyze_investment and its sub-steps
+  at 1k, 100k and 1M records, with tracemalloc allocation tracking
+- money: portfolio sums, allocation percentages and AUM roll-ups through the
+  Decimal, float and fixed-point int64-cents paths
+- anomaly: per-observation cost of the streaming anomaly detectors, sketch
+  quantile accuracy, and detection delay for level shifts and slow drift
+- tracing: analyze_investment with tracing off, on but not sampled, and
+  fully sampled to a trace file, plus the cost of a disabled span
+- spatial: property grid index bulk load, incremental inserts, and radius,
+  bounding-box and k-nearest queries against a numpy brute-force scan
+
+Usage:
+    python houston100_benchmarks.py analyzer --save baselines/analyzer.json
+    python houston100_benchmarks.py analyzer --sizes 1000,100000 --compare baselines/analyzer.json
+    python houston100_benchmarks.py money --sizes 1000,1000000
+    python houston100_benchmarks.py anomaly --sizes 100000
+    python houston100_benchmarks.py spatial --sizes 100000
+"""
+
+import sys
+import json
+import math
+import time
+import random
+import argparse
+import platform
+import datetime
+import tempfile
+import tracemalloc
+from decimal import Decimal
+from typing import Dict, List, Any, Iterator, Callable, Optional
+
+import numpy as np
+
+from houston100_agent import (
+    Houston100Config,
+    KingdomPrinciples,
+    InvestmentType,
+    InvestmentData,
+    KingdomInvestmentAnalyzer
+)
+from houston100_money import (
+    aum_rollup,
+    exact_sum,
+    cents_to_decimal,
+    decimals_to_cents_array
+)
+from houston100_anomaly import METRIC_PROFILES, AnomalyMonitor, QuantileSketch, StreamingDetector
+from houston100_tracing import ChromeTraceExporter, tracer
+from houston100_geo import CITY_CENTERS, GridSpatialIndex, Property, haversine_km
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+DEFAULT_ALLOCATION_SAMPLE = 10_000
+DEFAULT_REGRESSION_THRESHOLD = 0.10  # Flag anything more than 10% slower/larger
+
+KINGDOM_SCORE_SHAPES = ["complete", "partial", "empty", "extreme", "with_overall"]
+COMMUNITY_IMPACT_SHAPES = ["empty", "counts", "full"]
+
+
+class SyntheticInvestmentGenerator:
+    """Seeded generator of InvestmentData covering every investment type and data shape"""
+
+    def __init__(self, seed: int = 100):
+        self.seed = seed
+
+    def generate(self, count: int) -> Iterator[InvestmentData]:
+        """Lazily yield ``count`` investments so 1M-record runs stay within memory"""
+        rng = random.Random(self.seed)
+        investment_types = list(InvestmentType)
+
+        for index in range(count):
+            # Cycle types and shapes so every combination appears in every run size
+            investment_type = investment_types[index % len(investment_types)]
+            score_shape = KINGDOM_SCORE_SHAPES[index % len(KINGDOM_SCORE_SHAPES)]
+            impact_shape = COMMUNITY_IMPACT_SHAPES[index % len(COMMUNITY_IMPACT_SHAPES)]
+
+            yield InvestmentData(
+                id=f"synthetic-{index:07d}",
+                name=f"Synthetic {investment_type.value.replace('_', ' ').title()} {index}",
+                investment_type=investment_type,
+                total_investment=Decimal(rng.randrange(25_000_00, 10_000_000_00)).scaleb(-2),
+                projected_irr=round(rng.uniform(2.0, 24.0), 2),
+                investment_timeline=rng.choice(["3-5 years", "5-7 years", "7-10 years", "10 years"]),
+                kingdom_scores=self._kingdom_scores(rng, score_shape),
+                community_impact=self._community_impact(rng, impact_shape)
+            )
+
+    def _kingdom_scores(self, rng: random.Random, shape: str) -> Dict[str, int]:
+        principle_ids = [principle.principle_id for principle in KingdomPrinciples]
+
+        if shape == "empty":
+            return {}
+        if shape == "partial":
+            return {pid: rng.randint(40, 100) for pid in rng.sample(principle_ids, rng.randint(1, 4))}
+        if shape == "extreme":
+            return {pid: rng.choice([0, 100]) for pid in principle_ids}
+
+        scores = {pid: rng.randint(40, 100) for pid in principle_ids}
+        if shape == "with_overall":
+            scores["overall_score"] = rng.randint(50, 100)
+        return scores
+
+    def _community_impact(self, rng: random.Random, shape: str) -> Dict[str, Any]:
+        if shape == "empty":
+            return {}
+
+        impact = {
+            "families_impacted": rng.randint(0, 250),
+            "jobs_created": rng.randint(0, 120),
+            "businesses_supported": rng.randint(0, 30)
+        }
+        if shape == "full":
+            impact.update({
+                "community_services": rng.sample(
+                    ["After-school care", "Job training", "Health clinic", "Food pantry", "Counseling"], 3
+                ),
+                "long_term_transformation": "Neighborhood stability and economic mobility",
+                "ministry_opportunities": ["Church partnership", "Youth ministry"],
+                "measurable_outcomes": {"stability_improvement_pct": rng.randint(5, 80)}
+            })
+        return impact
+
+
+def _analyzer_sub_steps(analyzer: KingdomInvestmentAnalyzer) -> Dict[str, Callable[[InvestmentData, Dict], Any]]:
+    """Sub-steps of analyze_investment in call order; each may read earlier outputs"""
+    return {
+        "calculate_kingdom_impact_score": lambda inv, out: analyzer._calculate_kingdom_impact_score(inv),
+        "analyze_financial_performance": lambda inv, out: analyzer._analyze_financial_performance(inv),
+        "assess_biblical_alignment": lambda inv, out: analyzer._assess_biblical_alignment(inv),
+        "evaluate_community_impact": lambda inv, out: analyzer._evaluate_community_impact(inv),
+        "generate_investment_recommendation": lambda inv, out: analyzer._generate_investment_recommendation(
+            out["calculate_kingdom_impact_score"],
+            out["analyze_financial_performance"],
+            out["assess_biblical_alignment"]
+        ),
+        "identify_risk_factors": lambda inv, out: analyzer._identify_risk_factors(inv),
+        "calculate_kingdom_roi": lambda inv, out: analyzer._calculate_kingdom_roi(inv),
+    }
+
+
+def _timing(total_ns: int, count: int) -> Dict[str, float]:
+    return {
+        "total_s": round(total_ns / 1e9, 6),
+        "per_record_us": round(total_ns / count / 1e3, 4),
+        "records_per_s": round(count / (total_ns / 1e9), 1) if total_ns else 0.0
+    }
+
+
+def run_analyzer_suite(sizes: List[int], seed: int = 100,
+                       allocation_sample: int = DEFAULT_ALLOCATION_SAMPLE, **_) -> Dict[str, Any]:
+    """Time analyze_investment and its sub-steps at each record count"""
+    analyzer = KingdomInvestmentAnalyzer(Houston100Config())
+    generator = SyntheticInvestmentGenerator(seed)
+    sub_steps = _analyzer_sub_steps(analyzer)
+    results = {}
+
+    for size in sizes:
+        # End-to-end analyze_investment
+        total_ns = 0
+        for investment in generator.generate(size):
+            started = time.perf_counter_ns()
+            analyzer.analyze_investment(investment)
+            total_ns += time.perf_counter_ns() - started
+
+        # Individual sub-steps (includes ~0.1us timer overhead per call)
+        step_ns = dict.fromkeys(sub_steps, 0)
+        for investment in generator.generate(size):
+            outputs = {}
+            for step_name, step in sub_steps.items():
+                started = time.perf_counter_ns()
+                outputs[step_name] = step(investment, outputs)
+                step_ns[step_name] += time.perf_counter_ns() - started
+
+        # Allocations on a capped sample; tracemalloc slows execution several-fold
+        sample_size = min(size, allocation_sample)
+        sample = list(generator.generate(sample_size))
+        call_peaks = [0] * sample_size
+        tracemalloc.start()
+        try:
+            baseline_current, _ = tracemalloc.get_traced_memory()
+            for index, investment in enumerate(sample):
+                tracemalloc.reset_peak()
+                before, _ = tracemalloc.get_traced_memory()
+                analyzer.analyze_investment(investment)
+                _, call_peak = tracemalloc.get_traced_memory()
+                call_peaks[index] = call_peak - before
+            retained, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        results[str(size)] = {
+            "analyze_investment": _timing(total_ns, size),
+            "sub_steps": {name: _timing(ns, size) for name, ns in step_ns.items()},
+            "memory": {
+                "sample_records": sample_size,
+                "mean_call_peak_bytes": round(sum(call_peaks) / sample_size, 1),
+                "max_call_peak_bytes": max(call_peaks),
+                "retained_bytes": retained - baseline_current
+            }
+        }
+
+    return results
+
+
+def _timed(function: Callable[[], Any]) -> tuple:
+    started = time.perf_counter_ns()
+    value = function()
+    return value, time.perf_counter_ns() - started
+
+
+def run_money_suite(sizes: List[int], seed: int = 100, **_) -> Dict[str, Any]:
+    """Compare Decimal, float and int64-cents paths for sums, allocations and AUM roll-ups"""
+    investment_types = [investment_type.value for investment_type in InvestmentType]
+    results = {}
+
+    for size in sizes:
+        rng = np.random.default_rng(seed)
+        cents = rng.integers(25_000_00, 10_000_000_00, size=size, dtype=np.int64)
+        type_codes = rng.integers(0, len(investment_types), size=size, dtype=np.uint8)
+        amounts = [cents_to_decimal(value) for value in cents.tolist()]
+        codes = type_codes.tolist()
+        floats = [float(amount) for amount in amounts]
+
+        decimal_total, decimal_sum_ns = _timed(lambda: sum(amounts, Decimal(0)))
+        float_total, float_sum_ns = _timed(lambda: sum(floats))
+        fixed_total, fixed_sum_ns = _timed(lambda: exact_sum(cents))
+
+        def decimal_rollup() -> Dict[str, Decimal]:
+            totals = dict.fromkeys(range(len(investment_types)), Decimal(0))
+            for code, amount in zip(codes, amounts):
+                totals[code] += amount
+            grand_total = sum(totals.values(), Decimal(0))
+            return {code: (total / grand_total * 100).quantize(Decimal("0.01")) for code, total in totals.items()}
+
+        def float_rollup() -> Dict[int, float]:
+            totals = np.bincount(type_codes, weights=cents / 100, minlength=len(investment_types))
+            return dict(enumerate(np.round(totals / totals.sum() * 100, 2).tolist()))
+
+        _, decimal_rollup_ns = _timed(decimal_rollup)
+        float_allocations, float_rollup_ns = _timed(float_rollup)
+        fixed_rollup, fixed_rollup_ns = _timed(lambda: aum_rollup(type_codes, cents, investment_types))
+        _, conversion_ns = _timed(lambda: decimals_to_cents_array(amounts))
+
+        results[str(size)] = {
+            "sum": {
+                "decimal_per_record_ns": round(decimal_sum_ns / size, 2),
+                "float_per_record_ns": round(float_sum_ns / size, 2),
+                "int64_cents_per_record_ns": round(fixed_sum_ns / size, 2)
+            },
+            "aum_rollup": {
+                "decimal_per_record_ns": round(decimal_rollup_ns / size, 2),
+                "float_per_record_ns": round(float_rollup_ns / size, 2),
+                "int64_cents_per_record_ns": round(fixed_rollup_ns / size, 2)
+            },
+            "decimal_to_cents_per_record_ns": round(conversion_ns / size, 2),
+            "accuracy": {
+                "exact_total": str(decimal_total),
+                "int64_cents_exact": cents_to_decimal(fixed_total) == decimal_total,
+                "float_error_cents": float(abs(Decimal(float_total) - decimal_total) * 100),
+                "float_allocation_sum_pct": round(sum(float_allocations.values()), 6),
+                "int64_cents_allocation_sum_bps": sum(
+                    group["allocation_basis_points"] for group in fixed_rollup["groups"].values()
+                )
+            }
+        }
+
+    return results
+
+
+def _first_anomaly(values: List[float], kind: str) -> Optional[int]:
+    """Index of the observation that opened the first ``kind`` anomaly"""
+    detector = StreamingDetector("benchmark", **METRIC_PROFILES["response_time_ms"])
+    for index, value in enumerate(values):
+        if any(anomaly["kind"] == kind for anomaly in detector.update(value)):
+            return index
+    return None
+
+
+def run_anomaly_suite(sizes: List[int], seed: int = 100, **_) -> Dict[str, Any]:
+    """Time the streaming anomaly detectors per observation and check what they flag"""
+    results = {}
+
+    for size in sizes:
+        rng = np.random.default_rng(seed)
+        latencies = rng.lognormal(math.log(180), 0.25, size=size).tolist()
+
+        def loop_only() -> None:
+            for value in latencies:
+                pass
+
+        sketch = QuantileSketch()
+        detector = StreamingDetector("benchmark", **METRIC_PROFILES["response_time_ms"])
+        monitor = AnomalyMonitor()
+
+        def feed_sketch() -> None:
+            for value in latencies:
+                sketch.add(value)
+
+        def feed_detector() -> None:
+            for value in latencies:
+                detector.update(value)
+
+        def feed_monitor() -> None:
+            for value in latencies:
+                monitor.observe("response_time_ms", value)
+
+        _, loop_ns = _timed(loop_only)
+        _, sketch_ns = _timed(feed_sketch)
+        _, detector_ns = _timed(feed_detector)
+        _, monitor_ns = _timed(feed_monitor)
+
+        exact = dict(zip(("p50", "p95", "p99"), np.percentile(latencies, [50, 95, 99]).tolist()))
+        sketch_errors = {
+            name: round(abs(sketch.quantile(int(name[1:]) / 100) - value) / value * 100, 3)
+            for name, value in exact.items()
+        }
+
+        # Behaviour on the same series: isolated spikes, a late step up, a slow ramp
+        spiked = list(latencies)
+        for index in range(500, size, 1000):
+            spiked[index] *= 20
+        spike_detector = StreamingDetector("benchmark", **METRIC_PROFILES["response_time_ms"])
+        spike_alerts = sum(len(spike_detector.update(value)) for value in spiked)
+
+        onset = size * 3 // 4
+        stepped = latencies[:onset] + [value * 2 for value in latencies[onset:]]
+        ramp_start = size // 2
+        ramped = latencies[:ramp_start] + [
+            value * (1 + (index + 1) / (size - ramp_start))
+            for index, value in enumerate(latencies[ramp_start:])
+        ]
+        step_index = _first_anomaly(stepped, "level_shift")
+        drift_index = _first_anomaly(ramped, "drift")
+
+        results[str(size)] = {
+            "per_observation_ns": {
+                "loop_baseline": round(loop_ns / size, 2),
+                "quantile_sketch": round(sketch_ns / size, 2),
+                "detector": round(detector_ns / size, 2),
+                "monitor_observe": round(monitor_ns / size, 2)
+            },
+            "memory": {
+                "sketch_bins": len(sketch.bins),
+                "max_sketch_bins": sketch.max_bins
+            },
+            "sketch_relative_error_pct": sketch_errors,
+            "detection": {
+                "isolated_spikes": len(range(500, size, 1000)),
+                "spike_alerts": spike_alerts,
+                "level_shift_delay_points": None if step_index is None else step_index - onset,
+                "drift_detected_at_ramp_pct": None if drift_index is None else round(
+                    (drift_index - ramp_start) / (size - ramp_start) * 100, 1
+                )
+            }
+        }
+
+    return results
+
+
+def run_tracing_suite(sizes: List[int], seed: int = 100, **_) -> Dict[str, Any]:
+    """Cost of span tracing on analyze_investment in each tracing mode"""
+    generator = SyntheticInvestmentGenerator(seed)
+    saved = (tracer.sample_rate, tracer.exporter)
+    results = {}
+
+    def disabled_span() -> None:
+        with tracer.span("benchmark"):
+            pass
+
+    try:
+        with tempfile.TemporaryDirectory() as trace_dir:
+            for size in sizes:
+                investments = list(generator.generate(size))
+                modes = {}
+                # Analyzers are instrumented at construction, so each mode builds its own
+                for mode, sample_rate in (("disabled", 0.0), ("unsampled", 1e-12), ("sampled", 1.0)):
+                    exporter = ChromeTraceExporter(f"{trace_dir}/{mode}-{size}.json") if sample_rate else None
+                    tracer.configure(sample_rate, exporter)
+                    analyzer = KingdomInvestmentAnalyzer(Houston100Config())
+
+                    def analyze_all() -> None:
+                        for investment in investments:
+                            analyzer.analyze_investment(investment)
+
+                    _, total_ns = _timed(analyze_all)
+                    modes[mode] = _timing(total_ns, size)
+                    if exporter is not None:
+                        exporter.close()
+                        modes[mode]["exported_spans"] = exporter.exported_spans
+
+                tracer.configure(0.0, None)
+                _, span_ns = _timed(lambda: [disabled_span() for _ in range(size)])
+                baseline_us = modes["disabled"]["per_record_us"]
+                results[str(size)] = {
+                    "analyze_investment": modes,
+                    "overhead_pct": {
+                        mode: round((modes[mode]["per_record_us"] / baseline_us - 1) * 100, 2)
+                        for mode in ("unsampled", "sampled")
+                    },
+                    "disabled_span_ns": round(span_ns / size, 2)
+                }
+    finally:
+        tracer.configure(*saved)
+
+    return results
+
+
+def _synthetic_properties(size: int, rng: np.random.Generator) -> List[Property]:
+    """Properties clustered around the Texas metros, with a tenth scattered statewide"""
+    centers = np.array(list(CITY_CENTERS.values()))
+    clustered = centers[rng.integers(0, len(centers), size=size)] + rng.normal(0, 0.25, size=(size, 2))
+    scattered = np.column_stack((rng.uniform(25.8, 36.5, size), rng.uniform(-106.6, -93.5, size)))
+    coordinates = np.where((rng.random(size) < 0.1)[:, None], scattered, clustered)
+    return [
+        Property(f"prop-{index}", f"Property {index}", latitude, longitude)
+        for index, (latitude, longitude) in enumerate(coordinates.tolist())
+    ]
+
+
+def run_spatial_suite(sizes: List[int], seed: int = 100, queries: int = 500, **_) -> Dict[str, Any]:
+    """Time the property grid index against a brute-force scan and check they agree"""
+    results = {}
+
+    for size in sizes:
+        rng = np.random.default_rng(seed)
+        properties = _synthetic_properties(size, rng)
+        latitudes = np.array([prop.latitude for prop in properties])
+        longitudes = np.array([prop.longitude for prop in properties])
+        origins = [(prop.latitude, prop.longitude) for prop in
+                   (properties[index] for index in rng.integers(0, size, size=queries).tolist())]
+
+        index = GridSpatialIndex()
+        _, bulk_ns = _timed(lambda: index.bulk_load(properties))
+        incremental = GridSpatialIndex()
+        inserted = properties[:min(size, 100_000)]
+        _, insert_ns = _timed(lambda: [incremental.insert(prop) for prop in inserted])
+
+        def radius_queries(radius_km: float) -> List:
+            return [index.within_radius(latitude, longitude, radius_km) for latitude, longitude in origins]
+
+        def brute_radius(radius_km: float) -> List:
+            matches = []
+            for latitude, longitude in origins:
+                distances = haversine_km(latitude, longitude, latitudes, longitudes)
+                inside = np.flatnonzero(distances <= radius_km)
+                order = inside[np.argsort(distances[inside], kind="stable")]
+                matches.append([(properties[slot], distances[slot]) for slot in order.tolist()])
+            return matches
+
+        def bbox_queries() -> List:
+            return [index.bounding_box(latitude - 0.1, longitude - 0.1, latitude + 0.1, longitude + 0.1)
+                    for latitude, longitude in origins]
+
+        def brute_bbox() -> List:
+            return [[properties[slot] for slot in np.flatnonzero(
+                (latitudes >= latitude - 0.1) & (latitudes <= latitude + 0.1)
+                & (longitudes >= longitude - 0.1) & (longitudes <= longitude + 0.1)
+            ).tolist()] for latitude, longitude in origins]
+
+        def nearest_queries() -> List:
+            return [index.nearest(latitude, longitude, 10) for latitude, longitude in origins]
+
+        def brute_nearest() -> List:
+            matches = []
+            for latitude, longitude in origins:
+                distances = haversine_km(latitude, longitude, latitudes, longitudes)
+                nearest = np.argpartition(distances, 9)[:10]
+                nearest = nearest[np.argsort(distances[nearest], kind="stable")]
+                matches.append([(properties[slot], distances[slot]) for slot in nearest.tolist()])
+            return matches
+
+        def property_ids(matches: List) -> List[str]:
+            return sorted((match[0] if isinstance(match, tuple) else match).property_id for match in matches)
+
+        timings, agreement = {}, {}
+        for name, indexed, brute in (
+            ("radius_5km", lambda: radius_queries(5.0), lambda: brute_radius(5.0)),
+            ("radius_25km", lambda: radius_queries(25.0), lambda: brute_radius(25.0)),
+            ("bounding_box", bbox_queries, brute_bbox),
+            ("nearest_10", nearest_queries, brute_nearest),
+        ):
+            found, indexed_ns = _timed(indexed)
+            expected, brute_ns = _timed(brute)
+            timings[name] = {
+                "index_per_query_us": round(indexed_ns / queries / 1e3, 2),
+                "brute_force_per_query_us": round(brute_ns / queries / 1e3, 2),
+                "speedup": round(brute_ns / indexed_ns, 2),
+                "mean_matches": round(sum(len(matches) for matches in found) / queries, 1)
+            }
+            # Nearest-neighbour ties may resolve to different properties; compare distances there
+            agreement[name] = all(
+                np.allclose([distance for _, distance in got], [distance for _, distance in want])
+                if name.startswith("nearest") else property_ids(got) == property_ids(want)
+                for got, want in zip(found, expected)
+            )
+
+        results[str(size)] = {
+            "build": {
+                "bulk_load": _timing(bulk_ns, size),
+                "incremental_insert": _timing(insert_ns, len(inserted))
+            },
+            "queries": timings,
+            "matches_brute_force": agreement,
+            "index": index.stats()
+        }
+
+    return results
+
+
+BENCHMARK_SUITES: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "analyzer": run_analyzer_suite,
+    "money": run_money_suite,
+    "anomaly": run_anomaly_suite,
+    "tracing": run_tracing_suite,
+    "spatial": run_spatial_suite,
+}
+
+
+def build_report(suite: str, results: Dict[str, Any], seed: int) -> Dict[str, Any]:
+    """Wrap suite results with environment metadata"""
+    return {
+        "suite": suite,
+        "created_at": datetime.datetime.now().isoformat(),
+        "seed": seed,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results
+    }
+
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = DEFAULT_REGRESSION_THRESHOLD) -> List[Dict[str, Any]]:
+    """Compare lower-is-better metrics (``*_us``, ``*_ns``, ``*_bytes``) against a baseline"""
+    comparisons = []
+
+    def walk(base_node: Any, current_node: Any, path: str) -> None:
+        if isinstance(base_node, dict) and isinstance(current_node, dict):
+            for key in base_node:
+                if key in current_node:
+                    walk(base_node[key], current_node[key], f"{path}.{key}" if path else key)
+            return
+
+        metric = path.rsplit(".", 1)[-1]
+        if not metric.endswith(("_us", "_ns", "_bytes")):
+            return
+        if not isinstance(base_node, (int, float)) or not isinstance(current_node, (int, float)):
+            return
+
+        change = (current_node - base_node) / base_node if base_node else 0.0
+        comparisons.append({
+            "metric": path,
+            "baseline": base_node,
+            "current": current_node,
+            "change_pct": round(change * 100, 2),
+            "regression": change > threshold
+        })
+
+    walk(baseline.get("results", {}), current.get("results", {}), "")
+    return comparisons
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Houston 100 micro-benchmarks")
+    parser.add_argument("suite", choices=sorted(BENCHMARK_SUITES))
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES),
+                        help="Comma-separated record counts")
+    parser.add_argument("--seed", type=int, default=100)
+    parser.add_argument("--allocation-sample", type=int, default=DEFAULT_ALLOCATION_SAMPLE)
+    parser.add_argument("--save", help="Write results to this JSON baseline file")
+    parser.add_argument("--compare", help="Baseline JSON file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help="Relative slowdown that counts as a regression (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    results = BENCHMARK_SUITES[args.suite](
+        sizes, seed=args.seed, allocation_sample=args.allocation_sample
+    )
+    report = build_report(args.suite, results, args.seed)
+    print(json.dumps(report, indent=2))
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as baseline_file:
+            json.dump(report, baseline_file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        comparisons = compare_reports(baseline, report, args.threshold)
+        regressions = [item for item in comparisons if item["regression"]]
+
+        print(f"\nCompared {len(comparisons)} metrics against {args.compare}")
+        for item in regressions:
+            print(f"  REGRESSION {item['metric']}: {item['baseline']} -> {item['current']} "
+                  f"(+{item['change_pct']}%)")
+        if regressions:
+            return 1
+        print("  No regressions detected")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
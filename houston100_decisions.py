@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Houston 100 Faith AI Assistant - Recommendation Decision Tables
+
+Versioned, data-defined recommendation policy compiled to vectorized checks:
+- Ordered rules of threshold conditions; the first matching rule fires
+- Tables load from JSON so policy tweaks need no code changes
+- One deal or a whole book of deals evaluated in a single call, reporting
+  which rule fired for each
+
+Any mapping of column name to array works as batch input, including a
+PortfolioSnapshot (kingdom_score, projected_irr, biblical_alignment_score).
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+
+import numpy as np
+
+# Tier ranks, worst to best
+TIER_RANKING = ["AVOID", "HOLD", "FURTHER ANALYSIS REQUIRED", "CONSIDER", "BUY", "STRONG BUY"]
+
+OPERATORS = (">=", ">", "<", "<=")
+
+DEFAULT_DECISION_TABLE: Dict[str, Any] = {
+    "version": "2024.1",
+    "fields": ["kingdom_score", "projected_irr", "biblical_alignment_score"],
+    "rules": [
+        {
+            "name": "strong_buy",
+            "tier": "STRONG BUY",
+            "message": "Exceptional Kingdom impact with superior financial returns and strong Biblical alignment",
+            "match": "all",
+            "conditions": [
+                ["kingdom_score", ">=", 90], ["projected_irr", ">=", 12], ["biblical_alignment_score", ">=", 85]
+            ]
+        },
+        {
+            "name": "buy",
+            "tier": "BUY",
+            "message": "Strong Kingdom impact with solid financial returns and good Biblical alignment",
+            "match": "all",
+            "conditions": [
+                ["kingdom_score", ">=", 80], ["projected_irr", ">=", 10], ["biblical_alignment_score", ">=", 75]
+            ]
+        },
+        {
+            "name": "consider",
+            "tier": "CONSIDER",
+            "message": "Moderate Kingdom impact with acceptable returns, requires further analysis",
+            "match": "all",
+            "conditions": [
+                ["kingdom_score", ">=", 70], ["projected_irr", ">=", 8], ["biblical_alignment_score", ">=", 65]
+            ]
+        },
+        {
+            "name": "avoid_insufficient_alignment",
+            "tier": "AVOID",
+            "message": "Insufficient Kingdom alignment regardless of financial metrics",
+            "match": "any",
+            "conditions": [["kingdom_score", "<", 60], ["biblical_alignment_score", "<", 50]]
+        },
+        {
+            "name": "hold_low_returns",
+            "tier": "HOLD",
+            "message": "Review financial projections before proceeding",
+            "match": "all",
+            "conditions": [["projected_irr", "<", 6]]
+        }
+    ],
+    "default": {
+        "name": "further_analysis",
+        "tier": "FURTHER ANALYSIS REQUIRED",
+        "message": "Mixed indicators require additional evaluation"
+    }
+}
+
+
+@dataclass
+class DecisionRule:
+    """One row of a decision table"""
+    name: str
+    tier: str
+    message: str
+    match: str = "all"
+    conditions: List[Tuple[str, str, float]] = field(default_factory=list)
+
+    @property
+    def recommendation(self) -> str:
+        return f"{self.tier} - {self.message}"
+
+
+@dataclass
+class Decision:
+    """The rule that fired for a single deal"""
+    rule: str
+    tier: str
+    recommendation: str
+    table_version: str
+
+
+class DecisionTable:
+    """An ordered, versioned decision table compiled to NumPy threshold matrices"""
+
+    def __init__(self, version: str, fields: List[str], rules: List[DecisionRule], default: DecisionRule):
+        self.version = version
+        self.fields = list(fields)
+        self.rules = list(rules) + [default]
+        self._validate()
+        self._compile()
+
+    @classmethod
+    def from_dict(cls, spec: Dict[str, Any]) -> "DecisionTable":
+        rules = [
+            DecisionRule(
+                name=rule["name"],
+                tier=rule["tier"],
+                message=rule["message"],
+                match=rule.get("match", "all"),
+                conditions=[tuple(condition) for condition in rule["conditions"]]
+            )
+            for rule in spec["rules"]
+        ]
+        default = DecisionRule(name=spec["default"]["name"], tier=spec["default"]["tier"],
+                               message=spec["default"]["message"])
+        return cls(str(spec["version"]), spec["fields"], rules, default)
+
+    def _validate(self) -> None:
+        for rule in self.rules:
+            if rule.tier not in TIER_RANKING:
+                raise ValueError(f"Rule {rule.name}: unknown tier {rule.tier!r}")
+            if rule.match not in ("all", "any"):
+                raise ValueError(f"Rule {rule.name}: match must be 'all' or 'any'")
+            for field_name, operator, _ in rule.conditions:
+                if field_name not in self.fields:
+                    raise ValueError(f"Rule {rule.name}: unknown field {field_name!r}")
+                if operator not in OPERATORS:
+                    raise ValueError(f"Rule {rule.name}: unsupported operator {operator!r}")
+
+    def _compile(self) -> None:
+        """Lower every condition to ``x >= lower`` or ``x < upper`` threshold matrices
+
+        ``x > v`` and ``x <= v`` use the next float above ``v``, which is
+        exactly equivalent for float64 inputs.
+        """
+        shape = (len(self.rules), len(self.fields))
+        self._lower = np.full(shape, -np.inf)
+        self._upper = np.full(shape, np.inf)
+        self._has_lower = np.zeros(shape, dtype=bool)
+        self._has_upper = np.zeros(shape, dtype=bool)
+
+        for row, rule in enumerate(self.rules):
+            for field_name, operator, value in rule.conditions:
+                column = self.fields.index(field_name)
+                value = float(value)
+                if operator in (">", "<="):
+                    value = np.nextafter(value, np.inf)
+                # Repeated bounds on one field tighten for "all" rules and loosen for "any" rules
+                tighten = rule.match == "all"
+                if operator in (">=", ">"):
+                    current = self._lower[row, column] if self._has_lower[row, column] else value
+                    self._lower[row, column] = max(current, value) if tighten else min(current, value)
+                    self._has_lower[row, column] = True
+                else:
+                    current = self._upper[row, column] if self._has_upper[row, column] else value
+                    self._upper[row, column] = min(current, value) if tighten else max(current, value)
+                    self._has_upper[row, column] = True
+
+        self._match_any = np.array([rule.match == "any" for rule in self.rules])
+        # Plain-Python form of the same bounds; a single deal is faster without array overhead
+        self._scalar_rules = [
+            (rule.match == "any", [
+                (column,
+                 float(self._lower[row, column]) if self._has_lower[row, column] else None,
+                 float(self._upper[row, column]) if self._has_upper[row, column] else None)
+                for column in range(len(self.fields))
+                if self._has_lower[row, column] or self._has_upper[row, column]
+            ])
+            for row, rule in enumerate(self.rules)
+        ]
+        self.tier_ranks = np.array([TIER_RANKING.index(rule.tier) for rule in self.rules])
+
+    def thresholds(self, field_name: str) -> List[float]:
+        """Every threshold the table applies to ``field_name``, ascending"""
+        column = self.fields.index(field_name)
+        values = set(self._lower[self._has_lower[:, column], column])
+        values |= set(self._upper[self._has_upper[:, column], column])
+        return sorted(float(value) for value in values)
+
+    def evaluate(self, columns: Mapping[str, Any]) -> np.ndarray:
+        """Index of the rule that fired for every deal (the default rule is last)"""
+        values = np.stack([np.asarray(columns[name], dtype=float).reshape(-1) for name in self.fields])
+
+        # (rules, fields, deals) comparisons
+        above = values[None, :, :] >= self._lower[:, :, None]
+        below = values[None, :, :] < self._upper[:, :, None]
+        has_lower = self._has_lower[:, :, None]
+        has_upper = self._has_upper[:, :, None]
+
+        all_match = ((above | ~has_lower) & (below | ~has_upper)).all(axis=1)
+        any_match = ((above & has_lower) | (below & has_upper)).any(axis=1)
+        matched = np.where(self._match_any[:, None], any_match, all_match)
+
+        # First matching rule wins; the trailing default has no conditions and always matches
+        return matched.argmax(axis=0)
+
+    def _rule_index(self, row_values: List[float]) -> int:
+        for index, (match_any, bounds) in enumerate(self._scalar_rules):
+            hits = (
+                (lower is not None and row_values[column] >= lower)
+                or (upper is not None and row_values[column] < upper)
+                if match_any else
+                (lower is None or row_values[column] >= lower) and (upper is None or row_values[column] < upper)
+                for column, lower, upper in bounds
+            )
+            if (any if match_any else all)(hits):
+                return index
+        return len(self.rules) - 1
+
+    def evaluate_one(self, **values: float) -> Decision:
+        """Decision for a single deal, with the same semantics as evaluate()"""
+        rule = self.rules[self._rule_index([float(values.get(name, 0)) for name in self.fields])]
+        return Decision(rule=rule.name, tier=rule.tier, recommendation=rule.recommendation,
+                        table_version=self.version)
+
+    def describe(self, rule_indexes: np.ndarray) -> List[Dict[str, str]]:
+        """Rule name and tier for each evaluated deal"""
+        return [{"rule": self.rules[index].name, "tier": self.rules[index].tier} for index in rule_indexes]
+
+
+def load_decision_table(path: Optional[str] = None) -> DecisionTable:
+    """Load a decision table from JSON, or the built-in default table"""
+    if not path:
+        return DecisionTable.from_dict(DEFAULT_DECISION_TABLE)
+    with open(path, encoding="utf-8") as table_file:
+        return DecisionTable.from_dict(json.load(table_file))
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Houston 100 Faith AI Assistant - Property Spatial Index
+
+Geospatial search over property coordinates:
+- A uniform latitude/longitude grid; each occupied cell lists its properties
+- Vectorized bulk loading plus incremental insert, move and remove
+- Radius (great-circle), bounding-box and k-nearest queries that only
+  visit the cells a query can reach, then filter exactly with numpy
+- Named city centers (Houston, Dallas, Austin, ...) as query origins
+
+Coordinates are decimal degrees. The grid does not wrap at the
+antimeridian, which no Texas market comes near.
+"""
+
+import os
+import json
+import math
+import threading
+from array import array
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LATITUDE = math.pi * EARTH_RADIUS_KM / 180
+DEFAULT_CELL_DEGREES = 0.05  # About 5.5 km north-south
+
+CITY_CENTERS: Dict[str, Tuple[float, float]] = {
+    "houston": (29.7604, -95.3698),
+    "dallas": (32.7767, -96.7970),
+    "austin": (30.2672, -97.7431),
+    "san antonio": (29.4241, -98.4936),
+    "fort worth": (32.7555, -97.3308),
+}
+
+
+@dataclass
+class Property:
+    """A tracked real-estate property and its coordinates"""
+    property_id: str
+    name: str
+    latitude: float
+    longitude: float
+    city: str = ""
+    status: str = "active"
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "Property":
+        latitude = float(record.get("latitude", record.get("lat")))
+        longitude = float(record.get("longitude", record.get("lng", record.get("lon"))))
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+            raise ValueError(f"Invalid coordinates ({latitude}, {longitude}) for property {record.get('id')}")
+        return cls(
+            property_id=str(record.get("property_id", record.get("id"))),
+            name=record.get("name", ""),
+            latitude=latitude,
+            longitude=longitude,
+            city=record.get("city", ""),
+            status=record.get("status", "active")
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def haversine_km(latitude: float, longitude: float, latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """Great-circle distances from one point to arrays of points"""
+    lat1, lng1 = math.radians(latitude), math.radians(longitude)
+    lat2, lng2 = np.radians(latitudes), np.radians(longitudes)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def resolve_location(location: str) -> Tuple[float, float]:
+    """A named city center or a "latitude,longitude" pair"""
+    key = location.strip().lower()
+    if key in CITY_CENTERS:
+        return CITY_CENTERS[key]
+    parts = [part.strip() for part in key.split(",")]
+    if len(parts) == 2:
+        try:
+            return float(parts[0]), float(parts[1])
+        except ValueError:
+            pass
+    raise ValueError(f"Unknown location '{location}'; use a city ({', '.join(sorted(CITY_CENTERS))}) "
+                     f"or 'latitude,longitude'")
+
+
+def load_properties(path: str) -> List[Property]:
+    """Properties from a JSON file holding a list or {"properties": [...]}"""
+    if not path or not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as property_file:
+        data = json.load(property_file)
+    records = data.get("properties", []) if isinstance(data, dict) else data
+    return [Property.from_record(record) for record in records]
+
+
+class GridSpatialIndex:
+    """Thread-safe grid index over property coordinates
+
+    Coordinates live in growable numpy arrays addressed by slot; each
+    occupied cell keeps its slots in a typed array so a query gathers its
+    candidates with one buffer concatenation. Removed slots are not reused.
+    """
+
+    def __init__(self, cell_degrees: float = DEFAULT_CELL_DEGREES, capacity: int = 1024):
+        self.cell_degrees = cell_degrees
+        self._lock = threading.RLock()
+        self._latitudes = np.empty(capacity)
+        self._longitudes = np.empty(capacity)
+        self._items: List[Optional[Property]] = []
+        self._slots: Dict[str, int] = {}
+        self._cells: Dict[Tuple[int, int], array] = {}
+        # Occupied extent: rows/columns that bound nearest() ring search, widest latitude for its stop test
+        self._bounds: Optional[List[int]] = None  # [min_row, max_row, min_column, max_column]
+        self._max_abs_latitude = 0.0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def _cell(self, latitude: float, longitude: float) -> Tuple[int, int]:
+        return math.floor(latitude / self.cell_degrees), math.floor(longitude / self.cell_degrees)
+
+    def _reserve(self, count: int) -> None:
+        needed = len(self._items) + count
+        if needed > len(self._latitudes):
+            capacity = max(needed, 2 * len(self._latitudes))
+            for name in ("_latitudes", "_longitudes"):
+                grown = np.empty(capacity)
+                grown[:len(self._items)] = getattr(self, name)[:len(self._items)]
+                setattr(self, name, grown)
+
+    def _extend_bounds(self, min_row: int, max_row: int, min_column: int, max_column: int,
+                       max_abs_latitude: float) -> None:
+        if self._bounds is None:
+            self._bounds = [min_row, max_row, min_column, max_column]
+        else:
+            bounds = self._bounds
+            bounds[0], bounds[1] = min(bounds[0], min_row), max(bounds[1], max_row)
+            bounds[2], bounds[3] = min(bounds[2], min_column), max(bounds[3], max_column)
+        self._max_abs_latitude = max(self._max_abs_latitude, max_abs_latitude)
+
+    def _unindex(self, property_id: str) -> None:
+        slot = self._slots.pop(property_id, None)
+        if slot is None:
+            return
+        cell = self._cell(self._latitudes[slot], self._longitudes[slot])
+        self._cells[cell].remove(slot)
+        if not self._cells[cell]:
+            del self._cells[cell]
+        self._items[slot] = None
+
+    def bulk_load(self, properties: Iterable[Property]) -> int:
+        """Index many properties at once; existing IDs are replaced"""
+        properties = list(properties)
+        if not properties:
+            return 0
+        with self._lock:
+            for prop in properties:
+                self._unindex(prop.property_id)
+            self._reserve(len(properties))
+            base = len(self._items)
+            latitudes = np.fromiter((prop.latitude for prop in properties), float, len(properties))
+            longitudes = np.fromiter((prop.longitude for prop in properties), float, len(properties))
+            self._latitudes[base:base + len(properties)] = latitudes
+            self._longitudes[base:base + len(properties)] = longitudes
+            self._items.extend(properties)
+            live = np.ones(len(properties), dtype=bool)
+            for offset, prop in enumerate(properties):
+                # A repeated ID within the batch keeps its last occurrence
+                previous = self._slots.get(prop.property_id)
+                if previous is not None:
+                    self._items[previous] = None
+                    live[previous - base] = False
+                self._slots[prop.property_id] = base + offset
+
+            # Group slots by cell with one sort instead of a dict update per property
+            rows = np.floor(latitudes / self.cell_degrees).astype(np.int64)
+            columns = np.floor(longitudes / self.cell_degrees).astype(np.int64)
+            order = np.lexsort((columns, rows))
+            order = order[live[order]]
+            sorted_rows, sorted_columns = rows[order], columns[order]
+            boundaries = np.flatnonzero((sorted_rows[1:] != sorted_rows[:-1])
+                                        | (sorted_columns[1:] != sorted_columns[:-1])) + 1
+            starts = np.concatenate(([0], boundaries)).tolist()
+            for start, group in zip(starts, np.split(order + base, boundaries)):
+                cell = (int(sorted_rows[start]), int(sorted_columns[start]))
+                cell_slots = self._cells.get(cell)
+                if cell_slots is None:
+                    self._cells[cell] = array("q", group.tobytes())
+                else:
+                    cell_slots.frombytes(group.tobytes())
+            self._extend_bounds(int(rows.min()), int(rows.max()), int(columns.min()), int(columns.max()),
+                                float(np.abs(latitudes).max()))
+        return len(properties)
+
+    def insert(self, prop: Property) -> None:
+        """Index one property, moving it if its ID is already indexed"""
+        with self._lock:
+            self._unindex(prop.property_id)
+            self._reserve(1)
+            slot = len(self._items)
+            self._latitudes[slot] = prop.latitude
+            self._longitudes[slot] = prop.longitude
+            self._items.append(prop)
+            self._slots[prop.property_id] = slot
+            row, column = self._cell(prop.latitude, prop.longitude)
+            cell_slots = self._cells.get((row, column))
+            if cell_slots is None:
+                self._cells[row, column] = array("q", (slot,))
+            else:
+                cell_slots.append(slot)
+            self._extend_bounds(row, row, column, column, abs(prop.latitude))
+
+    def remove(self, property_id: str) -> bool:
+        with self._lock:
+            found = property_id in self._slots
+            self._unindex(property_id)
+            return found
+
+    def get(self, property_id: str) -> Optional[Property]:
+        slot = self._slots.get(property_id)
+        return None if slot is None else self._items[slot]
+
+    def _gather(self, cells: Iterable[Tuple[int, int]]) -> np.ndarray:
+        found = [self._cells.get(cell) for cell in cells]
+        views = [np.frombuffer(cell_slots, dtype=np.int64) for cell_slots in found if cell_slots]
+        return np.concatenate(views) if views else np.empty(0, dtype=np.int64)
+
+    def _slots_in_cells(self, min_row: int, max_row: int, min_column: int, max_column: int) -> np.ndarray:
+        if (max_row - min_row + 1) * (max_column - min_column + 1) > len(self._cells):
+            # Query covers more cells than are occupied: walk the occupied ones
+            return self._gather([
+                (row, column) for row, column in self._cells
+                if min_row <= row <= max_row and min_column <= column <= max_column
+            ])
+        return self._gather([
+            (row, column) for row in range(min_row, max_row + 1) for column in range(min_column, max_column + 1)
+        ])
+
+    def _results(self, slots: np.ndarray, distances: np.ndarray,
+                 limit: Optional[int]) -> List[Tuple[Property, float]]:
+        """(property, distance) pairs, nearest first, at most ``limit`` of them"""
+        if limit is not None and limit < len(slots):
+            nearest = np.argpartition(distances, limit - 1)[:limit] if limit > 0 else np.empty(0, dtype=np.int64)
+            slots, distances = slots[nearest], distances[nearest]
+        order = np.argsort(distances, kind="stable")
+        items = self._items
+        return [(items[slot], distance) for slot, distance in zip(slots[order].tolist(), distances[order].tolist())]
+
+    def bounding_box(self, min_latitude: float, min_longitude: float,
+                     max_latitude: float, max_longitude: float, status: Optional[str] = None) -> List[Property]:
+        """Properties inside the box, edges included"""
+        with self._lock:
+            min_row, min_column = self._cell(min_latitude, min_longitude)
+            max_row, max_column = self._cell(max_latitude, max_longitude)
+            slots = self._with_status(self._slots_in_cells(min_row, max_row, min_column, max_column), status)
+            latitudes, longitudes = self._latitudes[slots], self._longitudes[slots]
+            inside = ((latitudes >= min_latitude) & (latitudes <= max_latitude)
+                      & (longitudes >= min_longitude) & (longitudes <= max_longitude))
+            items = self._items
+            return [items[slot] for slot in slots[inside].tolist()]
+
+    def _with_status(self, slots: np.ndarray, status: Optional[str]) -> np.ndarray:
+        """Slots whose property has ``status`` (case-insensitive); all of them when status is empty"""
+        if not status or not len(slots):
+            return slots
+        wanted = status.lower()
+        items = self._items
+        keep = np.fromiter((items[slot].status.lower() == wanted for slot in slots.tolist()), bool, len(slots))
+        return slots[keep]
+
+    def within_radius(self, latitude: float, longitude: float, radius_km: float,
+                      limit: Optional[int] = None, status: Optional[str] = None) -> List[Tuple[Property, float]]:
+        """Properties within ``radius_km`` of the point, nearest first, with distances"""
+        latitude_span = radius_km / KM_PER_DEGREE_LATITUDE
+        widest = min(89.9, abs(latitude) + latitude_span)
+        longitude_span = min(180.0, radius_km / (KM_PER_DEGREE_LATITUDE * math.cos(math.radians(widest))))
+        with self._lock:
+            min_row, min_column = self._cell(latitude - latitude_span, longitude - longitude_span)
+            max_row, max_column = self._cell(latitude + latitude_span, longitude + longitude_span)
+            slots = self._with_status(self._slots_in_cells(min_row, max_row, min_column, max_column), status)
+            distances = haversine_km(latitude, longitude, self._latitudes[slots], self._longitudes[slots])
+            inside = distances <= radius_km
+            return self._results(slots[inside], distances[inside], limit)
+
+    def nearest(self, latitude: float, longitude: float, k: int,
+                status: Optional[str] = None) -> List[Tuple[Property, float]]:
+        """The ``k`` properties closest to the point, nearest first, with distances
+
+        With ``status``, the ring search only counts matching properties, so
+        it keeps widening until ``k`` of them are found.
+        """
+        with self._lock:
+            if k <= 0 or not self._slots:
+                return []
+            row, column = self._cell(latitude, longitude)
+            min_row, max_row, min_column, max_column = self._bounds
+            max_ring = max(row - min_row, max_row - row, column - min_column, max_column - column, 0)
+            # Cells outside ring r lie at least r cell widths away (narrowest at the highest latitude)
+            widest = min(89.9, max(abs(latitude), self._max_abs_latitude))
+            cell_km = self.cell_degrees * KM_PER_DEGREE_LATITUDE * math.cos(math.radians(widest))
+
+            slot_parts, distance_parts = [], []
+            found = 0
+            ring = 0
+            while True:
+                if (2 * ring + 1) ** 2 > len(self._cells):
+                    # Sparse index: scanning every occupied cell beats walking more empty rings
+                    slots = self._with_status(self._gather(list(self._cells)), status)
+                    distances = haversine_km(latitude, longitude, self._latitudes[slots], self._longitudes[slots])
+                    return self._results(slots, distances, k)
+                if ring == 0:
+                    cells = [(row, column)]
+                else:
+                    cells = [(row - ring, column + offset) for offset in range(-ring, ring + 1)]
+                    cells += [(row + ring, column + offset) for offset in range(-ring, ring + 1)]
+                    cells += [(row + offset, column - ring) for offset in range(-ring + 1, ring)]
+                    cells += [(row + offset, column + ring) for offset in range(-ring + 1, ring)]
+                slots = self._with_status(self._gather(cells), status)
+                if len(slots):
+                    slot_parts.append(slots)
+                    distance_parts.append(
+                        haversine_km(latitude, longitude, self._latitudes[slots], self._longitudes[slots])
+                    )
+                    found += len(slots)
+                if found >= k or ring >= max_ring:
+                    slots, distances = np.concatenate(slot_parts), np.concatenate(distance_parts)
+                    if len(slot_parts) > 1:
+                        slot_parts, distance_parts = [slots], [distances]
+                    if ring >= max_ring or np.partition(distances, k - 1)[k - 1] <= ring * cell_km:
+                        return self._results(slots, distances, k)
+                ring += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            sizes = [len(slots) for slots in self._cells.values()]
+            return {
+                "properties": len(self._slots),
+                "cell_degrees": self.cell_degrees,
+                "occupied_cells": len(sizes),
+                "max_per_cell": max(sizes) if sizes else 0,
+                "mean_per_cell": round(sum(sizes) / len(sizes), 2) if sizes else 0.0
+            }
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Houston 100 Faith AI Assistant - Streaming Kingdom Impact Aggregator
+
+Incrementally maintained Kingdom-impact statistics fed by completed
+analyses, so analyze_kingdom_impact reads a live aggregate instead of
+re-scanning history:
+- Running count, mean, min and max per Biblical principle and overall
+- Bounded top-k heaps of the best-scoring investments per principle, indexed
+  by investment id so a re-analysis repositions its entry in O(log k)
+- Re-analysis of an investment replaces its previous contribution
+"""
+
+import itertools
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple
+
+DEFAULT_TOP_K = 5
+
+
+@dataclass
+class RunningStat:
+    """Sum/count statistic that supports replacing an earlier observation"""
+    count: int = 0
+    total: float = 0.0
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+
+    def add(self, value: float, previous: Optional[float] = None) -> None:
+        if previous is None:
+            self.count += 1
+        else:
+            self.total -= previous
+        self.total += value
+        # Bounds only ever widen; a downgraded re-analysis keeps the historical extreme
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class TopK:
+    """Bounded min-heap of (score, sequence, investment_id, investment_name) entries
+
+    A position index keyed by investment id lets an entry be replaced in
+    place and sifted in O(log k); the root is evicted first.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self.entries: List[Tuple[int, int, str, str]] = []
+        self._positions: Dict[str, int] = {}
+
+    def offer(self, entry: Tuple[int, int, str, str]) -> None:
+        investment_id = entry[2]
+        index = self._positions.get(investment_id)
+        if index is not None:
+            self.entries[index] = entry
+            self._sift_down(self._sift_up(index))
+        elif len(self.entries) < self.k:
+            self.entries.append(entry)
+            self._positions[investment_id] = len(self.entries) - 1
+            self._sift_up(len(self.entries) - 1)
+        elif self.entries and entry[0] > self.entries[0][0]:
+            del self._positions[self.entries[0][2]]
+            self.entries[0] = entry
+            self._positions[investment_id] = 0
+            self._sift_down(0)
+
+    def _swap(self, i: int, j: int) -> None:
+        entries = self.entries
+        entries[i], entries[j] = entries[j], entries[i]
+        self._positions[entries[i][2]] = i
+        self._positions[entries[j][2]] = j
+
+    def _sift_up(self, index: int) -> int:
+        while index:
+            parent = (index - 1) // 2
+            if self.entries[index] >= self.entries[parent]:
+                break
+            self._swap(index, parent)
+            index = parent
+        return index
+
+    def _sift_down(self, index: int) -> int:
+        size = len(self.entries)
+        while True:
+            smallest = index
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < size and self.entries[child] < self.entries[smallest]:
+                    smallest = child
+            if smallest == index:
+                return index
+            self._swap(index, smallest)
+            index = smallest
+
+
+@dataclass
+class PrincipleAggregate:
+    """Running statistics and top-k investments for one Biblical principle"""
+    scripture_foundation: str = ""
+    stat: RunningStat = field(default_factory=RunningStat)
+    top: Optional[TopK] = None
+
+
+class KingdomImpactAggregator:
+    """Thread-safe streaming aggregate of Kingdom impact scores
+
+    Each update costs O(log k) per principle for the top-k heaps plus O(1)
+    for the running statistics, independent of how many analyses have
+    been recorded. Top-k lists are best-effort for
+    investments whose re-analysis lowers their score: an investment that
+    was evicted earlier cannot re-enter until it is analyzed again.
+    """
+
+    def __init__(self, top_k: int = DEFAULT_TOP_K):
+        self.top_k = top_k
+        self.principles: Dict[str, PrincipleAggregate] = {}
+        self.overall = RunningStat()
+        self.analyses_recorded = 0
+        self._latest_scores: Dict[str, Dict[str, int]] = {}
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def record(self, analysis: Dict[str, Any]) -> None:
+        """Fold one analyze_investment result into the aggregate"""
+        if analysis.get("status") == "error":
+            return
+
+        investment_id = analysis["investment_id"]
+        investment_name = analysis.get("investment_name") or investment_id
+        kingdom_score = analysis["kingdom_impact_score"]
+        breakdown = kingdom_score["principle_breakdown"]
+
+        with self._lock:
+            previous = self._latest_scores.get(investment_id)
+            self.overall.add(kingdom_score["overall_score"], previous and previous["overall_score"])
+
+            latest = {"overall_score": kingdom_score["overall_score"]}
+            for principle_id, detail in breakdown.items():
+                score = detail["raw_score"]
+                latest[principle_id] = score
+                aggregate = self.principles.get(principle_id)
+                if aggregate is None:
+                    aggregate = self.principles[principle_id] = PrincipleAggregate(
+                        scripture_foundation=detail.get("biblical_reference", ""),
+                        top=TopK(self.top_k)
+                    )
+                aggregate.stat.add(score, previous.get(principle_id) if previous else None)
+                aggregate.top.offer((score, next(self._sequence), investment_id, investment_name))
+
+            self._latest_scores[investment_id] = latest
+            self.analyses_recorded += 1
+
+    def principle_performance(self) -> Dict[str, Dict[str, Any]]:
+        """Current per-principle averages and top investments"""
+        with self._lock:
+            return {
+                principle_id: {
+                    "average_score": round(aggregate.stat.mean, 1),
+                    "min_score": aggregate.stat.minimum,
+                    "max_score": aggregate.stat.maximum,
+                    "investments_scored": aggregate.stat.count,
+                    "top_performing_investments": [
+                        {"investment_id": investment_id, "name": name, "score": score}
+                        for score, _, investment_id, name in sorted(aggregate.top.entries, reverse=True)
+                    ],
+                    "scripture_foundation": aggregate.scripture_foundation
+                }
+                for principle_id, aggregate in self.principles.items()
+            }
+
+    def overall_summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "investments_scored": self.overall.count,
+                "analyses_recorded": self.analyses_recorded,
+                "average_kingdom_score": round(self.overall.mean, 1),
+                "min_kingdom_score": self.overall.minimum,
+                "max_kingdom_score": self.overall.maximum
+            }
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Houston 100 Faith AI Assistant - Leadership Insight Views
+
+Materialized CEO/COO/CTO/general insight views computed from live data:
+- Each view declares the sources it reads (portfolio, Kingdom impact,
+  members, system health) and is rebuilt only when one of them changed
+- A background scheduler refreshes stale views on an interval, so the
+  leadership insights tool answers from a prebuilt view instantly
+- Every view records when it was built and how long the rebuild took
+
+Sources expose a cheap version marker (a snapshot generation, an analysis
+counter, a CRM refresh timestamp). Sources without one, such as the health
+probes, return a new marker on every refresh and are always reloaded.
+"""
+
+import time
+import logging
+import datetime
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Callable, Hashable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from houston100_agent import Houston100Config, SystemHealthMonitor
+    from houston100_impact import KingdomImpactAggregator
+    from houston100_members import MemberStore
+    from houston100_nav import NavTimeSeriesStore
+    from houston100_snapshot import SnapshotReader
+
+DEFAULT_REFRESH_SECONDS = 300
+
+
+@dataclass
+class InsightSource:
+    """A data source read by one or more views"""
+    name: str
+    version: Callable[[], Hashable]
+    load: Callable[[], Any]
+
+
+@dataclass
+class MaterializedView:
+    """A built view and its build metadata"""
+    name: str
+    data: Dict[str, Any]
+    built_at: datetime.datetime
+    build_seconds: float
+    source_versions: Dict[str, Hashable] = field(default_factory=dict)
+    builds: int = 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **self.data,
+            "view_metadata": {
+                "view": self.name,
+                "built_at": self.built_at.isoformat(),
+                "build_duration_ms": round(self.build_seconds * 1000, 3),
+                "builds": self.builds
+            }
+        }
+
+
+@dataclass
+class _ViewDefinition:
+    sources: List[str]
+    builder: Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+class MaterializedViewSet:
+    """Views over shared sources, rebuilt incrementally on a background schedule"""
+
+    def __init__(self, refresh_seconds: float = DEFAULT_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self.sources: Dict[str, InsightSource] = {}
+        self.last_refresh: Optional[Dict[str, Any]] = None
+        self._definitions: Dict[str, _ViewDefinition] = {}
+        self._views: Dict[str, MaterializedView] = {}
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.logger = logging.getLogger(__name__)
+
+    def add_source(self, source: InsightSource) -> None:
+        self.sources[source.name] = source
+
+    def register(self, name: str, sources: List[str],
+                 builder: Callable[[Dict[str, Any]], Dict[str, Any]]) -> None:
+        """Define a view built by ``builder`` from the loaded ``sources``"""
+        unknown = [source for source in sources if source not in self.sources]
+        if unknown:
+            raise ValueError(f"View {name}: unknown sources {unknown}")
+        self._definitions[name] = _ViewDefinition(list(sources), builder)
+
+    def get(self, name: str) -> Optional[MaterializedView]:
+        return self._views.get(name)
+
+    def refresh(self, force: bool = False) -> List[str]:
+        """Rebuild views whose sources changed; each source loads at most once"""
+        with self._refresh_lock:
+            started = time.perf_counter()
+            versions = {name: source.version() for name, source in self.sources.items()}
+            loaded: Dict[str, Any] = {}
+            rebuilt = []
+
+            for name, definition in self._definitions.items():
+                current = self._views.get(name)
+                wanted = {source: versions[source] for source in definition.sources}
+                if not force and current is not None and current.source_versions == wanted:
+                    continue
+
+                build_started = time.perf_counter()
+                for source in definition.sources:
+                    if source not in loaded:
+                        loaded[source] = self.sources[source].load()
+                try:
+                    data = definition.builder({source: loaded[source] for source in definition.sources})
+                except Exception as e:
+                    # Keep serving the previous build rather than failing the tool
+                    self.logger.error("Error building %s insight view: %s", name, e)
+                    continue
+                # A single reference swap publishes the new view to readers
+                self._views[name] = MaterializedView(
+                    name=name,
+                    data=data,
+                    built_at=datetime.datetime.now(),
+                    build_seconds=time.perf_counter() - build_started,
+                    source_versions=wanted,
+                    builds=current.builds + 1 if current else 1
+                )
+                rebuilt.append(name)
+
+            self.last_refresh = {
+                "refreshed_at": datetime.datetime.now().isoformat(),
+                "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+                "views_rebuilt": rebuilt,
+                "sources_loaded": sorted(loaded)
+            }
+            return rebuilt
+
+    def start(self) -> "MaterializedViewSet":
+        """Build every view now, then keep them fresh from a daemon thread"""
+        if self._thread is not None:
+            return self
+        self.refresh()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="insight-view-refresh", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.refresh_seconds):
+            try:
+                self.refresh()
+            except Exception as e:
+                self.logger.error("Error refreshing insight views: %s", e)
+
+
+def _portfolio_source(config: "Houston100Config", snapshots: "SnapshotReader",
+                      nav_history: "NavTimeSeriesStore") -> InsightSource:
+    def version() -> Hashable:
+        snapshot = snapshots.reload_if_newer()
+        portfolio = nav_history.get("portfolio")
+        return (snapshot.generation if snapshot is not None else None,
+                portfolio.length if portfolio is not None else 0)
+
+    def load() -> Dict[str, Any]:
+        snapshot = snapshots.reload_if_newer()
+        if snapshot is not None and len(snapshot):
+            summary, data_source = snapshot.summary(), "portfolio_snapshot"
+        else:
+            summary = {
+                "total_aum": float(config.TOTAL_AUM),
+                "investments": config.ACTIVE_PROPERTIES,
+                "average_returns": config.AVERAGE_RETURNS
+            }
+            data_source = "configured_baseline"
+        return {
+            "summary": summary,
+            "data_source": data_source,
+            "breakdown": snapshot.portfolio_breakdown() if data_source == "portfolio_snapshot" else {},
+            "performance": nav_history.performance_history()
+        }
+
+    return InsightSource("portfolio", version, load)
+
+
+def _impact_source(aggregator: "KingdomImpactAggregator") -> InsightSource:
+    return InsightSource(
+        "impact",
+        lambda: aggregator.analyses_recorded,
+        lambda: {"overall": aggregator.overall_summary(), "principles": aggregator.principle_performance()}
+    )
+
+
+def _member_source(member_store: "MemberStore") -> InsightSource:
+    return InsightSource(
+        "members",
+        lambda: (len(member_store), member_store.last_refreshed_at),
+        lambda: {
+            "total": len(member_store),
+            "by_tier": member_store.tier_counts(),
+            "last_refreshed_at": member_store.last_refreshed_at
+        }
+    )
+
+
+def _health_source(health_monitor: "SystemHealthMonitor") -> InsightSource:
+    return InsightSource("health", time.monotonic, health_monitor.comprehensive_health_check)
+
+
+def _average_kingdom_score(config: "Houston100Config", impact: Dict[str, Any]) -> float:
+    overall = impact["overall"]
+    return overall["average_kingdom_score"] if overall["investments_scored"] else float(config.AVERAGE_KINGDOM_SCORE)
+
+
+def _strongest_principle(impact: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    principles = impact["principles"]
+    if not principles:
+        return None
+    principle_id = max(principles, key=lambda pid: principles[pid]["average_score"])
+    return {"principle": principle_id, "average_score": principles[principle_id]["average_score"]}
+
+
+def _build_ceo_view(config: "Houston100Config", inputs: Dict[str, Any]) -> Dict[str, Any]:
+    portfolio, impact, members = inputs["portfolio"], inputs["impact"], inputs["members"]
+    largest_category = max(portfolio["breakdown"].items(),
+                           key=lambda item: item[1]["allocation_percentage"], default=(None, None))[0]
+    return {
+        "leader": config.LEADERSHIP_TEAM["ceo"],
+        "strategic_insights": {
+            "kingdom_impact": {
+                "average_kingdom_score": _average_kingdom_score(config, impact),
+                "investments_scored": impact["overall"]["investments_scored"],
+                "strongest_biblical_principle": _strongest_principle(impact)
+            },
+            "portfolio_scale": {
+                "total_aum": portfolio["summary"]["total_aum"],
+                "investments": portfolio["summary"]["investments"],
+                "largest_allocation": largest_category,
+                "data_source": portfolio["data_source"]
+            },
+            "member_base": {
+                "dhap_members": members["total"],
+                "members_by_tier": members["by_tier"]
+            },
+            "partnership_potential": f"{config.CHURCHES_SUPPORTED} churches supported"
+        },
+        "key_decisions_needed": [
+            "Geographic expansion strategy (Dallas, Austin markets identified)",
+            "Additional investment categories (healthcare ministry, education)",
+            "Enterprise licensing partnerships with other faith-based organizations",
+            "Public speaking and thought leadership opportunities"
+        ]
+    }
+
+
+def _build_coo_view(config: "Houston100Config", inputs: Dict[str, Any]) -> Dict[str, Any]:
+    members, health = inputs["members"], inputs["health"]
+    integrations = health.get("integration_health", {})
+    success_rates = [report["sync_success_rate"] for report in integrations.values()
+                     if report.get("sync_success_rate") is not None]
+    return {
+        "leader": config.LEADERSHIP_TEAM["coo"],
+        "operational_insights": {
+            "dhap_members": members["total"],
+            "members_by_tier": members["by_tier"],
+            "member_data_refreshed_at": members["last_refreshed_at"],
+            "integration_sync_success_rate": round(sum(success_rates) / len(success_rates), 2) if success_rates else None,
+            "integrations_with_errors": sorted(name for name, report in integrations.items() if report.get("last_error")),
+            "active_alerts": len(health.get("active_alerts", []))
+        },
+        "operational_priorities": [
+            "Scale member onboarding process for growth",
+            "Optimize property management operations",
+            "Implement advanced reporting automation",
+            "Enhance member communication systems"
+        ]
+    }
+
+
+def _build_cto_view(config: "Houston100Config", inputs: Dict[str, Any]) -> Dict[str, Any]:
+    health = inputs["health"]
+    platform = health.get("platform_performance", {})
+    engines = health.get("ai_engine_status", {})
+    vulnerabilities = health.get("security_compliance", {}).get("vulnerability_management", {})
+    accuracies = [engine["accuracy_score"] for engine in engines.values() if "accuracy_score" in engine]
+    return {
+        "leader": config.LEADERSHIP_TEAM["cto"],
+        "technical_insights": {
+            "overall_health_score": health.get("overall_health_score"),
+            "system_status": health.get("system_status"),
+            # Platform figures are None while no conversations ran in the last hour
+            "platform_status": platform.get("status", "No data"),
+            "uptime_percentage": platform.get("uptime_percentage"),
+            "average_response_time_ms": platform.get("average_response_time_ms"),
+            "error_rate_percentage": platform.get("error_rate_percentage"),
+            "conversations_last_hour": platform.get("api_requests_per_hour", 0),
+            "average_ai_accuracy": round(sum(accuracies) / len(accuracies), 1) if accuracies else None,
+            "ai_engines_online": sum(1 for engine in engines.values() if engine.get("status") == "Online"),
+            "critical_vulnerabilities": vulnerabilities.get("critical_vulnerabilities"),
+            "high_vulnerabilities": vulnerabilities.get("high_vulnerabilities"),
+            "active_alerts": health.get("active_alerts", [])
+        },
+        "technical_priorities": [
+            "Deploy advanced predictive analytics for market trends",
+            "Enhance mobile app features and performance",
+            "Implement blockchain for investment transparency",
+            "Develop API ecosystem for partner integrations"
+        ]
+    }
+
+
+def _build_general_view(config: "Houston100Config", inputs: Dict[str, Any]) -> Dict[str, Any]:
+    portfolio, impact = inputs["portfolio"], inputs["impact"]
+    performance = portfolio["performance"] or {}
+    return {
+        "company_health": {
+            "financial_performance": {
+                "average_projected_returns": portfolio["summary"].get("average_returns"),
+                "ytd_returns": performance.get("ytd_returns"),
+                "1_year_returns": performance.get("1_year_returns"),
+                "inception_returns": performance.get("inception_returns")
+            },
+            "growth_trajectory": {
+                "total_aum": portfolio["summary"]["total_aum"],
+                "active_investments": portfolio["summary"]["investments"],
+                "lives_impacted": config.LIVES_IMPACTED
+            },
+            "average_kingdom_score": _average_kingdom_score(config, impact),
+            "data_source": portfolio["data_source"]
+        },
+        "strategic_opportunities": [
+            "Enterprise licensing to other investment groups",
+            "Faith-based fintech partnerships",
+            "Educational institution collaborations",
+            "International expansion potential"
+        ]
+    }
+
+
+def leadership_insight_views(config: "Houston100Config", snapshots: "SnapshotReader",
+                             nav_history: "NavTimeSeriesStore", aggregator: "KingdomImpactAggregator",
+                             member_store: "MemberStore", health_monitor: "SystemHealthMonitor",
+                             refresh_seconds: float = DEFAULT_REFRESH_SECONDS) -> MaterializedViewSet:
+    """The CEO, COO, CTO and general views over live platform data"""
+    views = MaterializedViewSet(refresh_seconds)
+    views.add_source(_portfolio_source(config, snapshots, nav_history))
+    views.add_source(_impact_source(aggregator))
+    views.add_source(_member_source(member_store))
+    views.add_source(_health_source(health_monitor))
+
+    views.register("ceo", ["portfolio", "impact", "members"], lambda inputs: _build_ceo_view(config, inputs))
+    views.register("coo", ["members", "health"], lambda inputs: _build_coo_view(config, inputs))
+    views.register("cto", ["health"], lambda inputs: _build_cto_view(config, inputs))
+    views.register("general", ["portfolio", "impact"], lambda inputs: _build_general_view(config, inputs))
+    return views
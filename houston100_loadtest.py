@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Houston 100 Faith AI Assistant - Offline Load-Test Harness
+
+Measures throughput of Houston100Agent.stream_conversation without calling
+OpenAI. A local stand-in prompt driver simulates model latency and token
+rates and emits scripted calls to the custom Houston 100 tools, which run
+for real. A query corpus is replayed at a target concurrency and the
+harness reports throughput, latency and time-to-first-token percentiles
+and per-tool time.
+
+Usage:
+    python houston100_loadtest.py --concurrency 8 --requests 200 --profile gpt-4
+    python houston100_loadtest.py --corpus requests.jsonl --profile instant
+"""
+
+import os
+import json
+import math
+import time
+import random
+import argparse
+import threading
+from types import SimpleNamespace
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Iterator
+
+from houston100_agent import Houston100Agent, EXAMPLE_QUERIES
+from houston100_admission import estimate_tokens
+from houston100_tools import ToolCall, ToolCallExecutor
+
+
+@dataclass
+class LatencyProfile:
+    """Simulated model latency and token-rate characteristics"""
+    name: str
+    first_token_latency_ms: float
+    latency_jitter_ms: float
+    tokens_per_second: float
+    output_tokens: int
+
+
+LATENCY_PROFILES: Dict[str, LatencyProfile] = {
+    "gpt-4": LatencyProfile("gpt-4", first_token_latency_ms=900, latency_jitter_ms=300,
+                            tokens_per_second=25, output_tokens=350),
+    "gpt-4o": LatencyProfile("gpt-4o", first_token_latency_ms=400, latency_jitter_ms=120,
+                             tokens_per_second=90, output_tokens=350),
+    "fast": LatencyProfile("fast", first_token_latency_ms=50, latency_jitter_ms=10,
+                           tokens_per_second=2000, output_tokens=200),
+    "instant": LatencyProfile("instant", first_token_latency_ms=0, latency_jitter_ms=0,
+                              tokens_per_second=0, output_tokens=100),
+}
+
+
+SAMPLE_INVESTMENT = {
+    "id": "loadtest-001",
+    "name": "Load Test Affordable Housing",
+    "type": "affordable_housing",
+    "total_investment": 2000000,
+    "projected_irr": 12.5,
+    "timeline": "5-7 years",
+    "kingdom_scores": {
+        "care_for_poor": 95,
+        "creation_stewardship": 72,
+        "social_justice": 90,
+        "community_building": 88,
+        "economic_empowerment": 78
+    },
+    "community_impact": {"families_impacted": 40, "jobs_created": 12}
+}
+
+# Query keyword -> tool calls, checked in order; the first match wins
+DEFAULT_TOOL_SCRIPTS: List[tuple] = [
+    ("health", [ToolCall("check_faith_platform_health")]),
+    ("system alerts", [ToolCall("check_faith_platform_health")]),
+    ("analyze the kingdom impact potential", [
+        ToolCall("analyze_kingdom_investment", {"investment_data": json.dumps(SAMPLE_INVESTMENT)})
+    ]),
+    ("portfolio", [
+        ToolCall("analyze_houston100_portfolio"),
+        ToolCall("analyze_kingdom_impact")
+    ]),
+    ("best deals", [ToolCall("screen_kingdom_deals", {"limit": 10})]),
+    ("leadership", [ToolCall("generate_leadership_insights", {"focus_area": "ceo"})]),
+    ("dhap", [ToolCall("provide_member_services", {"query_type": "performance"})]),
+    ("families", [ToolCall("analyze_kingdom_impact")]),
+    ("investment opportunities", [ToolCall("analyze_kingdom_impact")]),
+]
+
+
+class FakePromptDriver:
+    """Local stand-in for OpenAiChatPromptDriver with configurable latency"""
+
+    def __init__(self, profile: LatencyProfile, tool_scripts: Optional[List[tuple]] = None,
+                 seed: Optional[int] = None):
+        self.profile = profile
+        self.tool_scripts = DEFAULT_TOOL_SCRIPTS if tool_scripts is None else tool_scripts
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+
+    def plan_tool_calls(self, prompt: str) -> List[ToolCall]:
+        """Return the scripted tool calls for a prompt"""
+        # Match on the user's query, not the Houston 100 context preamble
+        query = prompt.rsplit("User Query:", 1)[-1].lower()
+        for keyword, calls in self.tool_scripts:
+            if keyword in query:
+                return list(calls)
+        return []
+
+    def stream(self, prompt: str, tool_results: Optional[Dict[str, str]] = None) -> Iterator[str]:
+        """Yield response tokens at the profile's latency and token rate"""
+        with self._random_lock:
+            jitter = self._random.uniform(-1, 1) * self.profile.latency_jitter_ms
+        first_token_delay = max(0.0, self.profile.first_token_latency_ms + jitter) / 1000
+        token_delay = 1 / self.profile.tokens_per_second if self.profile.tokens_per_second else 0.0
+
+        if first_token_delay:
+            time.sleep(first_token_delay)
+
+        tools_used = ", ".join(tool_results or {}) or "no tools"
+        for index in range(self.profile.output_tokens):
+            if index and token_delay:
+                time.sleep(token_delay)
+            yield f"token{index}({tools_used}) " if index == 0 else f"token{index} "
+
+    def run(self, prompt: str, tool_results: Optional[Dict[str, str]] = None) -> str:
+        """Generate a complete response"""
+        return "".join(self.stream(prompt, tool_results))
+
+
+class ToolTimer:
+    """Thread-safe accumulator of per-tool call durations"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.durations: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+
+    def record(self, tool_name: str, duration_ms: float, failed: bool = False) -> None:
+        with self._lock:
+            self.durations.setdefault(tool_name, []).append(duration_ms)
+            if failed:
+                self.errors[tool_name] = self.errors.get(tool_name, 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.durations.clear()
+            self.errors.clear()
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                tool_name: {
+                    "calls": len(durations),
+                    "errors": self.errors.get(tool_name, 0),
+                    "total_ms": round(sum(durations), 3),
+                    "mean_ms": round(sum(durations) / len(durations), 3),
+                    "p95_ms": round(percentile(durations, 95), 3)
+                }
+                for tool_name, durations in self.durations.items()
+            }
+
+
+class OfflineAgentStructure:
+    """Stand-in for the Griptape Agent that drives tools with a fake prompt driver"""
+
+    def __init__(self, prompt_driver: FakePromptDriver, tool_executor: ToolCallExecutor,
+                 tool_timer: ToolTimer):
+        self.prompt_driver = prompt_driver
+        self.tool_executor = tool_executor
+        self.tool_timer = tool_timer
+        self._llm_lock = threading.Lock()
+        self.llm_time_ms = 0.0
+
+    def stream_events(self, prompt: str) -> Iterator[Dict[str, Any]]:
+        """Run one agent turn, yielding tool progress, tokens and a final done event"""
+        calls = self.prompt_driver.plan_tool_calls(prompt)
+        for call in calls:
+            if call.tool_name not in self.tool_executor.tools:
+                raise KeyError(f"Scripted call to unknown tool: {call.tool_name}")
+
+        # Independent calls of one step run concurrently, as in the live agent
+        tool_results = {}
+        if calls:
+            yield {"type": "tool_start", "tools": [call.tool_name for call in calls]}
+            for result in self.tool_executor.execute(calls):
+                self.tool_timer.record(result.call.tool_name, result.duration_ms, failed=not result.ok)
+                tool_results[result.call.tool_name] = result.output
+            yield {"type": "tool_finish", "tools": [call.tool_name for call in calls]}
+
+        started = time.perf_counter()
+        chunks = []
+        for token in self.prompt_driver.stream(prompt, tool_results):
+            chunks.append(token)
+            yield {"type": "token", "text": token}
+        with self._llm_lock:
+            self.llm_time_ms += (time.perf_counter() - started) * 1000
+
+        # A planning call when tools ran, then the answer; each reads the whole prompt
+        requests = 2 if calls else 1
+        yield {
+            "type": "usage",
+            "tokens": requests * estimate_tokens(prompt, 0) + len(chunks),
+            "requests": requests
+        }
+        yield {"type": "done", "output": "".join(chunks)}
+
+    def run(self, prompt: str):
+        """Run one agent turn and return a result shaped like a Griptape structure run"""
+        output = ""
+        for event in self.stream_events(prompt):
+            if event["type"] == "done":
+                output = event["output"]
+        return SimpleNamespace(output_task=SimpleNamespace(output=SimpleNamespace(value=output)))
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def load_query_corpus(path: Optional[str] = None) -> List[str]:
+    """Load queries from a JSONL/text corpus, defaulting to the main() examples"""
+    if not path:
+        return list(EXAMPLE_QUERIES)
+
+    queries = []
+    with open(path, encoding="utf-8") as corpus:
+        for line in corpus:
+            line = line.strip()
+            if not line:
+                continue
+            if not path.endswith(".jsonl"):
+                queries.append(line)
+                continue
+            record = json.loads(line)
+            for key in ("query", "user_input", "prompt", "body", "title"):
+                if record.get(key):
+                    queries.append(str(record[key]))
+                    break
+
+    if not queries:
+        raise ValueError(f"No queries found in corpus {path}")
+    return queries
+
+
+def build_offline_agent(profile: LatencyProfile, seed: Optional[int] = None,
+                        tool_scripts: Optional[List[tuple]] = None) -> Houston100Agent:
+    """Create a Houston100Agent whose Griptape structure runs fully offline"""
+    agent = Houston100Agent()
+    agent.agent = OfflineAgentStructure(
+        FakePromptDriver(profile, tool_scripts=tool_scripts, seed=seed),
+        agent.tool_executor,
+        ToolTimer()
+    )
+    return agent
+
+
+def run_load_test(agent: Houston100Agent, queries: List[str], concurrency: int = 4,
+                  total_requests: int = 100, warmup_requests: int = 0) -> Dict[str, Any]:
+    """Replay queries against the agent at a target concurrency"""
+    structure: OfflineAgentStructure = agent.agent
+
+    for index in range(warmup_requests):
+        agent.run_conversation(queries[index % len(queries)])
+    structure.tool_timer.reset()
+    structure.tool_executor.reset_metrics()
+    structure.llm_time_ms = 0.0
+
+    latencies: List[float] = []
+    first_token_latencies: List[float] = []
+    errors = 0
+    results_lock = threading.Lock()
+
+    def issue(request_index: int) -> None:
+        nonlocal errors
+        query = queries[request_index % len(queries)]
+        started = time.perf_counter()
+        first_token_ms = None
+        failed = False
+        for event in agent.stream_conversation(query):
+            if event["type"] == "token" and first_token_ms is None:
+                first_token_ms = (time.perf_counter() - started) * 1000
+            elif event["type"] == "error":
+                # Failed and admission-shed conversations both end in an error event
+                failed = True
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with results_lock:
+            latencies.append(elapsed_ms)
+            if first_token_ms is not None:
+                first_token_latencies.append(first_token_ms)
+            if failed:
+                errors += 1
+
+    wall_started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(issue, range(total_requests)))
+    wall_seconds = time.perf_counter() - wall_started
+
+    return {
+        "profile": structure.prompt_driver.profile.name,
+        "concurrency": concurrency,
+        "requests": total_requests,
+        "errors": errors,
+        "wall_time_seconds": round(wall_seconds, 3),
+        "throughput_rps": round(total_requests / wall_seconds, 3) if wall_seconds else 0.0,
+        "latency_ms": {
+            "mean": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+            "p50": round(percentile(latencies, 50), 3),
+            "p90": round(percentile(latencies, 90), 3),
+            "p95": round(percentile(latencies, 95), 3),
+            "p99": round(percentile(latencies, 99), 3),
+            "max": round(max(latencies), 3) if latencies else 0.0
+        },
+        "time_to_first_token_ms": {
+            "p50": round(percentile(first_token_latencies, 50), 3),
+            "p95": round(percentile(first_token_latencies, 95), 3)
+        },
+        "llm_time_ms_total": round(structure.llm_time_ms, 3),
+        "per_tool": structure.tool_timer.summary(),
+        "tool_execution": structure.tool_executor.metrics(),
+        "admission": agent.admission_controller.metrics()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline load test for the Houston 100 Faith AI Assistant")
+    parser.add_argument("--corpus", help="JSONL or text file of queries (default: main() examples)")
+    parser.add_argument("--profile", default="gpt-4", choices=sorted(LATENCY_PROFILES))
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=100)
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    args = parser.parse_args()
+
+    # Houston100Agent still constructs (but never calls) the OpenAI driver
+    os.environ.setdefault("OPENAI_API_KEY", "offline-load-test")
+
+    agent = build_offline_agent(LATENCY_PROFILES[args.profile], seed=args.seed)
+    report = run_load_test(
+        agent,
+        load_query_corpus(args.corpus),
+        concurrency=args.concurrency,
+        total_requests=args.requests,
+        warmup_requests=args.warmup
+    )
+
+    rendered = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            output_file.write(rendered)
+    print(rendered)
+
+
+if __name__ == "__main__":
+    main()
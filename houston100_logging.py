@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Houston 100 Faith AI Assistant - Logging Pipeline
+
+Non-blocking, queue-based logging for the Faith AI Assistant:
+- Producer-side QueueHandler so request threads never wait on disk I/O
+- Background writer thread with combined size and time based rotation
+- Structured JSON log records for the log file
+- Sampling of high-volume INFO logs (e.g. per-query conversation logs)
+"""
+
+import os
+import json
+import atexit
+import logging
+import logging.handlers
+import queue
+import random
+import zlib
+import datetime
+import threading
+from typing import Dict, Any, Optional
+
+# Attributes present on every LogRecord; anything else was passed via ``extra``
+_STANDARD_RECORD_ATTRS = frozenset(
+    logging.LogRecord("", 0, "", 0, "", (), None).__dict__.keys()
+) | {"message", "asctime"}
+
+TEXT_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_listener_lock = threading.Lock()
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.Handler] = None
+
+
+class SizeAndTimeRotatingFileHandler(logging.handlers.TimedRotatingFileHandler):
+    """File handler that rolls over on a time schedule or when the file grows too large"""
+
+    def __init__(self, filename: str, when: str = "midnight", interval: int = 1,
+                 backup_count: int = 14, max_bytes: int = 0, encoding: str = "utf-8"):
+        super().__init__(
+            filename, when=when, interval=interval,
+            backupCount=backup_count, encoding=encoding, delay=True
+        )
+        self.max_bytes = max_bytes
+
+    def shouldRollover(self, record: logging.LogRecord) -> int:
+        """Roll over when the time interval elapsed or the size limit is reached"""
+        if super().shouldRollover(record):
+            return 1
+        if self.max_bytes > 0:
+            if self.stream is None:
+                self.stream = self._open()
+            if self.stream.tell() + len(self.format(record)) + 1 >= self.max_bytes:
+                return 1
+        return 0
+
+    def rotation_filename(self, default_name: str) -> str:
+        """Avoid clobbering an earlier size-based rollover from the same interval"""
+        name = super().rotation_filename(default_name)
+        sequence = 1
+        candidate = name
+        while os.path.exists(candidate):
+            candidate = f"{name}.{sequence:03d}"
+            sequence += 1
+        return candidate
+
+
+class JsonFormatter(logging.Formatter):
+    """Render log records as single-line JSON documents"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "timestamp": datetime.datetime.fromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "thread": record.threadName,
+        }
+
+        # Structured fields passed through ``extra=``
+        for key, value in record.__dict__.items():
+            if key not in _STANDARD_RECORD_ATTRS and key not in payload:
+                payload[key] = value
+
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exception"] = record.exc_text
+
+        return json.dumps(payload, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Sample high-volume records tagged with a ``sample_key`` extra
+
+    Only records at or below ``max_level`` that carry a ``sample_key`` are
+    sampled; everything else always passes. Records that also carry a
+    ``sample_id`` (e.g. a conversation id) are kept or dropped together: the
+    decision is a hash of the id, so every line of one conversation shares it.
+    Kept records are annotated with the rate they were sampled at so
+    downstream counts can be re-weighted.
+    """
+
+    def __init__(self, sample_rates: Dict[str, float], max_level: int = logging.INFO):
+        super().__init__()
+        self.sample_rates = dict(sample_rates)
+        self.max_level = max_level
+        self.sampled_out = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        sample_key = getattr(record, "sample_key", None)
+        if sample_key is None or record.levelno > self.max_level:
+            return True
+
+        rate = self.sample_rates.get(sample_key, 1.0)
+        if rate >= 1.0:
+            return True
+        if self._draw(sample_key, getattr(record, "sample_id", None)) < rate:
+            record.sample_rate = rate
+            return True
+
+        self.sampled_out += 1
+        return False
+
+    @staticmethod
+    def _draw(sample_key: str, sample_id: Any) -> float:
+        """Uniform value in [0, 1): random per record, or fixed per ``sample_id``"""
+        if sample_id is None:
+            return random.random()
+        return zlib.crc32(f"{sample_key}:{sample_id}".encode("utf-8")) / 2 ** 32
+
+
+class DrainingQueueListener(logging.handlers.QueueListener):
+    """QueueListener whose stop sentinel waits for room in a full queue
+
+    The stock listener enqueues the sentinel with put_nowait(), so stopping
+    raises queue.Full exactly when logging is overloaded. The writer thread
+    keeps draining the queue, so a blocking put always gets through.
+    """
+
+    SENTINEL_RETRY_SECONDS = 0.5
+
+    def enqueue_sentinel(self) -> None:
+        while True:
+            try:
+                self.queue.put(self._sentinel, timeout=self.SENTINEL_RETRY_SECONDS)
+                return
+            except queue.Full:
+                # A dead writer will never make room; there is nothing left to stop
+                if self._thread is None or not self._thread.is_alive():
+                    return
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped_records = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped_records += 1
+
+
+def configure_logging(config) -> logging.handlers.QueueListener:
+    """Install the queued logging pipeline on the root logger (idempotent)"""
+    global _listener, _queue_handler
+
+    with _listener_lock:
+        if _listener is not None:
+            return _listener
+
+        level = logging.getLevelName(os.environ.get("LOG_LEVEL", config.LOG_LEVEL).upper())
+        if not isinstance(level, int):
+            level = logging.INFO
+
+        # Writer side: rotating file plus console, run on the listener thread
+        log_dir = os.path.dirname(config.LOG_FILE)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+
+        file_handler = SizeAndTimeRotatingFileHandler(
+            config.LOG_FILE,
+            when=config.LOG_ROTATION_WHEN,
+            backup_count=config.LOG_BACKUP_COUNT,
+            max_bytes=config.LOG_MAX_BYTES
+        )
+        file_handler.setFormatter(
+            JsonFormatter() if config.LOG_JSON_FORMAT else logging.Formatter(TEXT_LOG_FORMAT)
+        )
+
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter(TEXT_LOG_FORMAT))
+
+        # Producer side: sample and enqueue on the calling thread, nothing else
+        log_queue: queue.Queue = queue.Queue(maxsize=config.LOG_QUEUE_SIZE)
+        queue_handler = NonBlockingQueueHandler(log_queue)
+        queue_handler.addFilter(SamplingFilter(config.LOG_SAMPLE_RATES))
+
+        root_logger = logging.getLogger()
+        root_logger.setLevel(level)
+        root_logger.addHandler(queue_handler)
+        _queue_handler = queue_handler
+
+        _listener = DrainingQueueListener(
+            log_queue, file_handler, stream_handler, respect_handler_level=True
+        )
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+        return _listener
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the background writer"""
+    global _listener, _queue_handler
+
+    with _listener_lock:
+        if _listener is None:
+            return
+        logging.getLogger().removeHandler(_queue_handler)
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+        _queue_handler = None
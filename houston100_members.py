@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Houston 100 Faith AI Assistant - DHAP Member Store
+
+In-memory indexed store of DHAP members and their holdings:
+- O(1) lookups by member ID and email, and a per-tier member index
+- Holdings per member for personalized performance answers
+- Incremental refresh from CRM (Ontraport) sync results, persisted to JSON
+
+CRM contact records are expected to carry ``id``, ``email``, ``firstname``/
+``lastname`` (or ``name``), an optional ``dhap_tier`` and a ``holdings`` list
+of ``{"investment_id", "category", "commitment"}`` entries with dollar
+commitments.
+"""
+
+import os
+import json
+import datetime
+import threading
+from dataclasses import dataclass, field
+from decimal import Decimal, ROUND_HALF_EVEN
+from typing import Dict, List, Any, Iterable, Optional, Set, TYPE_CHECKING
+
+from houston100_money import Money, decimal_to_cents
+
+if TYPE_CHECKING:
+    from houston100_nav import NavTimeSeriesStore
+    from houston100_sync import SyncResult
+
+# DHAP tiers and minimum total commitments, lowest first
+DHAP_TIER_MINIMUMS = {
+    "Steward": Money.from_decimal(Decimal("25000")),
+    "Builder": Money.from_decimal(Decimal("100000")),
+    "Kingdom": Money.from_decimal(Decimal("500000")),
+}
+
+
+def tier_for_commitment(commitment: Money) -> Optional[str]:
+    """Highest DHAP tier whose minimum the total commitment meets"""
+    qualified = [tier for tier, minimum in DHAP_TIER_MINIMUMS.items() if commitment >= minimum]
+    return qualified[-1] if qualified else None
+
+
+def normalize_tier(tier: Optional[str]) -> Optional[str]:
+    """Map "kingdom", "Kingdom Level" etc. to a DHAP tier name"""
+    if not tier:
+        return None
+    name = str(tier).strip().split()[0].capitalize()
+    return name if name in DHAP_TIER_MINIMUMS else None
+
+
+@dataclass
+class Holding:
+    """A member's commitment to one investment"""
+    investment_id: str
+    category: str
+    commitment: Money
+
+
+@dataclass
+class MemberRecord:
+    """A DHAP member with their holdings"""
+    member_id: str
+    email: str
+    name: str
+    tier: Optional[str]
+    holdings: List[Holding] = field(default_factory=list)
+    joined_at: Optional[str] = None
+
+    @property
+    def total_commitment(self) -> Money:
+        return sum((holding.commitment for holding in self.holdings), Money(0))
+
+    @classmethod
+    def from_crm_record(cls, record: Dict[str, Any]) -> "MemberRecord":
+        holdings = [
+            Holding(
+                investment_id=str(holding["investment_id"]),
+                category=holding.get("category", ""),
+                commitment=Money(decimal_to_cents(str(holding.get("commitment", 0)), ROUND_HALF_EVEN))
+            )
+            for holding in record.get("holdings") or []
+        ]
+        name = record.get("name") or " ".join(
+            part for part in (record.get("firstname"), record.get("lastname")) if part
+        )
+        member = cls(
+            member_id=str(record["id"]),
+            email=str(record.get("email", "")).strip().lower(),
+            name=name,
+            tier=normalize_tier(record.get("dhap_tier")),
+            holdings=holdings,
+            joined_at=record.get("joined_at")
+        )
+        if member.tier is None:
+            member.tier = tier_for_commitment(member.total_commitment)
+        return member
+
+
+class MemberStore:
+    """Thread-safe member store indexed by ID, email and DHAP tier"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._lock = threading.RLock()
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._by_id: Dict[str, MemberRecord] = {}
+        self._by_email: Dict[str, str] = {}
+        self._by_tier: Dict[str, Set[str]] = {tier: set() for tier in DHAP_TIER_MINIMUMS}
+        self.last_refreshed_at: Optional[str] = None
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as store_file:
+                state = json.load(store_file)
+            self.last_refreshed_at = state.get("last_refreshed_at")
+            self.upsert(state.get("records", []), persist=False)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def _unindex(self, member_id: str) -> None:
+        member = self._by_id.pop(member_id, None)
+        if member is None:
+            return
+        if self._by_email.get(member.email) == member_id:
+            del self._by_email[member.email]
+        if member.tier:
+            self._by_tier[member.tier].discard(member_id)
+
+    def upsert(self, records: Iterable[Dict[str, Any]], persist: bool = True) -> int:
+        """Insert or replace members from CRM contact records"""
+        count = 0
+        with self._lock:
+            for record in records:
+                member = MemberRecord.from_crm_record(record)
+                self._unindex(member.member_id)
+                self._records[member.member_id] = record
+                self._by_id[member.member_id] = member
+                if member.email:
+                    self._by_email[member.email] = member.member_id
+                if member.tier:
+                    self._by_tier[member.tier].add(member.member_id)
+                count += 1
+            if persist and count:
+                self._save()
+        return count
+
+    def remove(self, member_ids: Iterable[str], persist: bool = True) -> int:
+        count = 0
+        with self._lock:
+            for member_id in member_ids:
+                if str(member_id) in self._by_id:
+                    self._unindex(str(member_id))
+                    self._records.pop(str(member_id), None)
+                    count += 1
+            if persist and count:
+                self._save()
+        return count
+
+    def apply_sync_result(self, result: "SyncResult") -> Dict[str, int]:
+        """Apply only the changed and deleted contacts from a CRM sync"""
+        if not result.success:
+            return {"upserted": 0, "removed": 0}
+        with self._lock:
+            upserted = self.upsert(result.changed_records, persist=False)
+            removed = self.remove(result.deleted_ids, persist=False)
+            self.last_refreshed_at = result.finished_at.isoformat()
+            self._save()
+        return {"upserted": upserted, "removed": removed}
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as store_file:
+            json.dump({"last_refreshed_at": self.last_refreshed_at, "records": list(self._records.values())},
+                      store_file, default=str)
+        os.replace(temp_path, self.path)
+
+    def all_members(self) -> List[MemberRecord]:
+        with self._lock:
+            return list(self._by_id.values())
+
+    def get(self, member_id: str) -> Optional[MemberRecord]:
+        return self._by_id.get(str(member_id))
+
+    def find_by_email(self, email: str) -> Optional[MemberRecord]:
+        member_id = self._by_email.get(email.strip().lower())
+        return self._by_id.get(member_id) if member_id else None
+
+    def members_in_tier(self, tier: str) -> List[MemberRecord]:
+        tier = normalize_tier(tier)
+        if tier is None:
+            return []
+        with self._lock:
+            return [self._by_id[member_id] for member_id in self._by_tier[tier]]
+
+    def holdings(self, member_id: str) -> List[Holding]:
+        member = self.get(member_id)
+        return list(member.holdings) if member else []
+
+    def resolve(self, member_info: str) -> Optional[MemberRecord]:
+        """Find a member from a tool's member_info: an ID, an email or a JSON object with either"""
+        member_info = (member_info or "").strip()
+        if not member_info:
+            return None
+        if member_info.startswith("{"):
+            try:
+                data = json.loads(member_info)
+            except ValueError:
+                return None
+            if not isinstance(data, dict):
+                return None
+            if data.get("member_id") or data.get("id"):
+                return self.get(str(data.get("member_id") or data.get("id")))
+            return self.find_by_email(str(data["email"])) if data.get("email") else None
+        if "@" in member_info:
+            return self.find_by_email(member_info)
+        return self.get(member_info)
+
+    def tier_counts(self) -> Dict[str, int]:
+        with self._lock:
+            return {tier: len(member_ids) for tier, member_ids in self._by_tier.items()}
+
+
+def member_performance(member: MemberRecord, nav_history: "NavTimeSeriesStore",
+                       as_of: Optional[datetime.date] = None) -> Dict[str, Any]:
+    """Commitment-weighted performance of a member's holdings from NAV history
+
+    Each holding uses its investment's NAV series, falling back to the
+    category series; holdings with neither are listed without returns.
+    """
+    holdings, weighted, weights = [], {}, {}
+    for holding in member.holdings:
+        history = (nav_history.performance_history(f"investment:{holding.investment_id}", as_of)
+                   or nav_history.performance_history(f"category:{holding.category}", as_of))
+        entry = {
+            "investment_id": holding.investment_id,
+            "category": holding.category,
+            "commitment": float(holding.commitment.to_decimal()),
+            "ytd_returns": history["ytd_returns"] if history else None,
+            "1_year_returns": history["1_year_returns"] if history else None
+        }
+        holdings.append(entry)
+        for metric in ("ytd_returns", "1_year_returns"):
+            if entry[metric] is not None:
+                weighted[metric] = weighted.get(metric, 0.0) + entry[metric] * holding.commitment.cents
+                weights[metric] = weights.get(metric, 0) + holding.commitment.cents
+
+    return {
+        "member_id": member.member_id,
+        "name": member.name,
+        "dhap_tier": member.tier,
+        "total_commitment": float(member.total_commitment.to_decimal()),
+        "holdings": holdings,
+        "weighted_returns": {
+            metric: round(weighted[metric] / weights[metric], 2)
+            for metric in weighted if weights[metric]
+        }
+    }
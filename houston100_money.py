@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Houston 100 Faith AI Assistant - Fixed-Point Money
+
+Integer-cents money arithmetic for the columnar and batch portfolio paths:
+- Money: an exact int64-cents scalar that converts losslessly to Decimal
+- Exact int64 sums and grouped roll-ups over NumPy cents arrays
+- Allocation percentages in basis points that always total exactly 100%
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_HALF_EVEN
+from typing import Dict, List, Any, Iterable, Optional, Sequence, Union
+
+import numpy as np
+
+CENTS_PER_DOLLAR = 100
+BASIS_POINTS_TOTAL = 10_000
+INT64_MAX = 2 ** 63 - 1
+INT64_MIN = -2 ** 63
+
+
+def decimal_to_cents(amount: Union[Decimal, int, str], rounding: Optional[str] = None) -> int:
+    """Convert dollars to integer cents
+
+    Without ``rounding`` the conversion must be exact: amounts with
+    sub-cent digits raise ValueError rather than silently losing value.
+    """
+    scaled = Decimal(amount) * CENTS_PER_DOLLAR
+    integral = scaled.to_integral_value(rounding=rounding or ROUND_HALF_EVEN)
+    if rounding is None and integral != scaled:
+        raise ValueError(f"{amount} is not a whole number of cents")
+    cents = int(integral)
+    if not INT64_MIN <= cents <= INT64_MAX:
+        raise OverflowError(f"{amount} does not fit in int64 cents")
+    return cents
+
+
+def cents_to_decimal(cents: int) -> Decimal:
+    """Exact Decimal dollars for integer cents"""
+    return Decimal(int(cents)).scaleb(-2)
+
+
+@dataclass(frozen=True, order=True)
+class Money:
+    """Exact amount of US dollars stored as int64 cents"""
+    cents: int = 0
+
+    def __post_init__(self):
+        if not isinstance(self.cents, (int, np.integer)):
+            raise TypeError(f"Money cents must be an integer, got {type(self.cents).__name__}")
+        if not INT64_MIN <= int(self.cents) <= INT64_MAX:
+            raise OverflowError(f"{self.cents} cents does not fit in int64")
+        object.__setattr__(self, "cents", int(self.cents))
+
+    @classmethod
+    def from_decimal(cls, amount: Union[Decimal, int, str], rounding: Optional[str] = None) -> "Money":
+        return cls(decimal_to_cents(amount, rounding))
+
+    def to_decimal(self) -> Decimal:
+        return cents_to_decimal(self.cents)
+
+    def __add__(self, other: "Money") -> "Money":
+        if not isinstance(other, Money):
+            return NotImplemented
+        return Money(self.cents + other.cents)
+
+    def __radd__(self, other: Any) -> "Money":
+        # Lets sum() start from 0
+        if other == 0:
+            return self
+        return NotImplemented
+
+    def __sub__(self, other: "Money") -> "Money":
+        if not isinstance(other, Money):
+            return NotImplemented
+        return Money(self.cents - other.cents)
+
+    def __neg__(self) -> "Money":
+        return Money(-self.cents)
+
+    def __str__(self) -> str:
+        return f"{'-' if self.cents < 0 else ''}${abs(self.cents) // 100:,}.{abs(self.cents) % 100:02d}"
+
+
+def decimals_to_cents_array(amounts: Iterable[Union[Decimal, int, str]],
+                            rounding: Optional[str] = None) -> np.ndarray:
+    """Convert Decimal amounts into an int64 cents array (exact unless ``rounding``)"""
+    return np.fromiter((decimal_to_cents(amount, rounding) for amount in amounts), dtype=np.int64)
+
+
+def exact_sum(cents: np.ndarray) -> int:
+    """Exact total of an int64 cents array
+
+    Uses a single int64 reduction when the worst case cannot overflow and
+    falls back to chunked Python-int accumulation otherwise.
+    """
+    cents = np.asarray(cents, dtype=np.int64)
+    if not cents.size:
+        return 0
+    largest = max(abs(int(cents.max())), abs(int(cents.min())))
+    if largest * cents.size <= INT64_MAX:
+        return int(cents.sum())
+
+    chunk = max(1, INT64_MAX // max(largest, 1))
+    return sum(int(cents[start:start + chunk].sum()) for start in range(0, cents.size, chunk))
+
+
+def grouped_sums(group_codes: np.ndarray, cents: np.ndarray, group_count: int) -> np.ndarray:
+    """Exact per-group int64 totals (np.bincount weights would round through float64)"""
+    cents = np.asarray(cents, dtype=np.int64)
+    if cents.size:
+        largest = max(abs(int(cents.max())), abs(int(cents.min())))
+        if largest * cents.size > INT64_MAX:
+            raise OverflowError("Grouped cents totals may overflow int64")
+    totals = np.zeros(group_count, dtype=np.int64)
+    np.add.at(totals, np.asarray(group_codes, dtype=np.intp), cents)
+    return totals
+
+
+def allocation_basis_points(amounts: Sequence[int]) -> List[int]:
+    """Allocation shares in basis points that total exactly 10,000
+
+    Uses the largest-remainder method so rounded percentages still add up
+    to 100.00% for reporting.
+    """
+    amounts = [int(amount) for amount in amounts]
+    total = sum(amounts)
+    if total <= 0:
+        return [0] * len(amounts)
+
+    floors = [amount * BASIS_POINTS_TOTAL // total for amount in amounts]
+    remainders = [amount * BASIS_POINTS_TOTAL % total for amount in amounts]
+    shortfall = BASIS_POINTS_TOTAL - sum(floors)
+    for index in sorted(range(len(amounts)), key=lambda i: remainders[i], reverse=True)[:shortfall]:
+        floors[index] += 1
+    return floors
+
+
+def basis_points_to_percent(basis_points: int) -> Decimal:
+    """Exact percentage for basis points, e.g. 3512 -> Decimal("35.12")"""
+    return Decimal(int(basis_points)).scaleb(-2)
+
+
+def aum_rollup(group_codes: np.ndarray, cents: np.ndarray, labels: Sequence[str]) -> Dict[str, Any]:
+    """Exact AUM totals and allocation percentages per group"""
+    totals = grouped_sums(group_codes, cents, len(labels))
+    shares = allocation_basis_points(totals)
+    return {
+        "total": Money(exact_sum(totals)),
+        "groups": {
+            label: {
+                "total": Money(int(totals[code])),
+                "allocation_basis_points": shares[code]
+            }
+            for code, label in enumerate(labels)
+        }
+    }
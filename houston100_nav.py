@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Houston 100 Faith AI Assistant - NAV Time Series
+
+Daily NAV and cash-flow history per investment, per investment category and
+for the whole portfolio:
+- Time-weighted daily returns with external cash flows stripped out
+- Prefix sums of log returns so any window's return is an O(1) lookup
+- Dense day indexing (gaps carry the last NAV forward) for O(1) date lookup
+- Incremental append of each new day's close; optional .npz persistence
+
+A cash flow on a day is treated as arriving at the start of that day, so
+the day's return is ``nav / (previous_nav + cash_flow) - 1``.
+"""
+
+import os
+import math
+import datetime
+import threading
+from typing import Dict, Any, Iterable, Optional, Tuple
+
+import numpy as np
+
+PORTFOLIO_SERIES = "portfolio"
+DAYS_PER_YEAR = 365.25
+INITIAL_CAPACITY = 256
+
+# Trailing windows reported by performance_history, in years
+PERFORMANCE_WINDOWS = {"1_year_returns": 1, "3_year_returns": 3, "5_year_returns": 5}
+
+
+def investment_series(investment_id: str) -> str:
+    return f"investment:{investment_id}"
+
+
+def category_series(category: str) -> str:
+    return f"category:{category}"
+
+
+class NavSeries:
+    """One daily NAV series with prefix sums of log returns and cash flows"""
+
+    def __init__(self, start_day: datetime.date, capacity: int = INITIAL_CAPACITY):
+        self.start_ordinal = start_day.toordinal()
+        self.length = 0
+        self._nav = np.zeros(capacity)
+        self._flow_prefix = np.zeros(capacity)
+        self._log_prefix = np.zeros(capacity)
+
+    @classmethod
+    def from_arrays(cls, start_day: datetime.date, navs: np.ndarray, flows: np.ndarray) -> "NavSeries":
+        """Vectorized rebuild from daily NAVs and cash flows, equivalent to appending each day"""
+        series = cls(start_day, capacity=max(len(navs), INITIAL_CAPACITY))
+        length = len(navs)
+        series._nav[:length] = navs
+        series._flow_prefix[:length] = np.cumsum(flows)
+        if length:
+            invested = navs[:-1] + flows[1:]
+            valid = (invested > 0) & (navs[1:] > 0)
+            log_returns = np.zeros(length - 1)
+            np.log(navs[1:] / invested, out=log_returns, where=valid)
+            series._log_prefix[1:length] = np.cumsum(log_returns)
+        series.length = length
+        return series
+
+    @property
+    def start_day(self) -> datetime.date:
+        return datetime.date.fromordinal(self.start_ordinal)
+
+    @property
+    def last_day(self) -> Optional[datetime.date]:
+        return datetime.date.fromordinal(self.start_ordinal + self.length - 1) if self.length else None
+
+    def _index(self, day: datetime.date) -> int:
+        return day.toordinal() - self.start_ordinal
+
+    def _reserve(self, length: int) -> None:
+        if length <= len(self._nav):
+            return
+        capacity = max(length, 2 * len(self._nav))
+        for name in ("_nav", "_flow_prefix", "_log_prefix"):
+            grown = np.zeros(capacity)
+            grown[:self.length] = getattr(self, name)[:self.length]
+            setattr(self, name, grown)
+
+    def append(self, day: datetime.date, nav: float, cash_flow: float = 0.0) -> None:
+        """Record a day's closing NAV; re-recording the latest day replaces it"""
+        index = self._index(day)
+        if index < 0 or index < self.length - 1:
+            raise ValueError(f"NAV for {day} is older than the latest recorded day {self.last_day}")
+
+        if index > self.length:
+            # Carry the last NAV across missing days: zero return, no flows
+            self._reserve(index)
+            previous = self.length - 1
+            self._nav[self.length:index] = self._nav[previous]
+            self._flow_prefix[self.length:index] = self._flow_prefix[previous]
+            self._log_prefix[self.length:index] = self._log_prefix[previous]
+            self.length = index
+
+        self._reserve(index + 1)
+        if index == 0:
+            self._nav[0], self._flow_prefix[0], self._log_prefix[0] = nav, cash_flow, 0.0
+        else:
+            invested = self._nav[index - 1] + cash_flow
+            log_return = math.log(nav / invested) if invested > 0 and nav > 0 else 0.0
+            self._nav[index] = nav
+            self._flow_prefix[index] = self._flow_prefix[index - 1] + cash_flow
+            self._log_prefix[index] = self._log_prefix[index - 1] + log_return
+        self.length = index + 1
+
+    def nav(self, day: Optional[datetime.date] = None) -> float:
+        return float(self._nav[self._clamp(day)])
+
+    def _clamp(self, day: Optional[datetime.date]) -> int:
+        if not self.length:
+            raise ValueError("NAV series is empty")
+        if day is None:
+            return self.length - 1
+        return min(max(self._index(day), 0), self.length - 1)
+
+    def window_return(self, start: datetime.date, end: Optional[datetime.date] = None) -> float:
+        """Time-weighted return from the close of ``start`` to the close of ``end`` (O(1))"""
+        start_index, end_index = self._clamp(start), self._clamp(end)
+        return math.expm1(self._log_prefix[end_index] - self._log_prefix[start_index])
+
+    def net_cash_flow(self, start: datetime.date, end: Optional[datetime.date] = None) -> float:
+        """External cash flows after the close of ``start`` up to the close of ``end`` (O(1))"""
+        return float(self._flow_prefix[self._clamp(end)] - self._flow_prefix[self._clamp(start)])
+
+    def annualized_return(self, start: datetime.date, end: Optional[datetime.date] = None) -> float:
+        """Annualized time-weighted return; windows under a year are not annualized"""
+        start_index, end_index = self._clamp(start), self._clamp(end)
+        years = (end_index - start_index) / DAYS_PER_YEAR
+        log_growth = self._log_prefix[end_index] - self._log_prefix[start_index]
+        return math.expm1(log_growth / years) if years >= 1 else math.expm1(log_growth)
+
+    def trailing_return(self, years: float, as_of: Optional[datetime.date] = None,
+                        annualize: bool = True) -> Optional[float]:
+        """Return over the trailing ``years``, or None when history is shorter"""
+        end_index = self._clamp(as_of)
+        start_index = end_index - round(years * DAYS_PER_YEAR)
+        if start_index < 0:
+            return None
+        start = datetime.date.fromordinal(self.start_ordinal + start_index)
+        end = datetime.date.fromordinal(self.start_ordinal + end_index)
+        return self.annualized_return(start, end) if annualize else self.window_return(start, end)
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Daily NAV and per-day cash flows (for persistence)"""
+        flows = np.diff(self._flow_prefix[:self.length], prepend=0.0)
+        return self._nav[:self.length].copy(), flows
+
+
+class NavTimeSeriesStore:
+    """Daily NAV series for investments, their categories and the whole portfolio"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.series: Dict[str, NavSeries] = {}
+        self._investment_category: Dict[str, str] = {}
+        self._latest_nav: Dict[str, float] = {}
+        self._category_totals: Dict[str, float] = {}
+        self._lock = threading.RLock()
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def _append(self, key: str, day: datetime.date, nav: float, cash_flow: float) -> None:
+        series = self.series.get(key)
+        if series is None:
+            series = self.series[key] = NavSeries(day)
+        series.append(day, nav, cash_flow)
+
+    def record_day(self, day: datetime.date,
+                   positions: Iterable[Tuple[str, str, float, float]]) -> int:
+        """Append one day's closes as (investment_id, category, nav, cash_flow) tuples
+
+        Investments missing from ``positions`` keep their last NAV in the
+        category and portfolio totals. Each position costs O(1).
+        """
+        with self._lock:
+            category_flows: Dict[str, float] = {}
+            recorded = 0
+            for investment_id, category, nav, cash_flow in positions:
+                nav, cash_flow = float(nav), float(cash_flow)
+                self._append(investment_series(investment_id), day, nav, cash_flow)
+
+                previous_category = self._investment_category.get(investment_id, category)
+                previous_nav = self._latest_nav.get(investment_id, 0.0)
+                self._category_totals[previous_category] = self._category_totals.get(previous_category, 0.0) - previous_nav
+                self._category_totals[category] = self._category_totals.get(category, 0.0) + nav
+                self._investment_category[investment_id] = category
+                self._latest_nav[investment_id] = nav
+                category_flows[category] = category_flows.get(category, 0.0) + cash_flow
+                recorded += 1
+
+            for category, total in self._category_totals.items():
+                self._append(category_series(category), day, total, category_flows.get(category, 0.0))
+            self._append(PORTFOLIO_SERIES, day, sum(self._category_totals.values()), sum(category_flows.values()))
+            return recorded
+
+    def get(self, key: str) -> Optional[NavSeries]:
+        return self.series.get(key)
+
+    def performance_history(self, key: str = PORTFOLIO_SERIES,
+                            as_of: Optional[datetime.date] = None) -> Optional[Dict[str, Any]]:
+        """YTD, trailing 1/3/5-year (annualized) and since-inception returns in percent"""
+        with self._lock:
+            series = self.series.get(key)
+            if series is None or not series.length:
+                return None
+
+            end = series.last_day if as_of is None else min(as_of, series.last_day)
+            year_start = max(datetime.date(end.year - 1, 12, 31), series.start_day)
+
+            def percent(value: Optional[float]) -> Optional[float]:
+                return None if value is None else round(value * 100, 2)
+
+            history = {"ytd_returns": percent(series.window_return(year_start, end))}
+            for name, years in PERFORMANCE_WINDOWS.items():
+                history[name] = percent(series.trailing_return(years, end))
+            history["inception_returns"] = percent(series.annualized_return(series.start_day, end))
+            history["inception_date"] = series.start_day.isoformat()
+            history["as_of"] = end.isoformat()
+            history["nav"] = round(series.nav(end), 2)
+            return history
+
+    def category_performance(self, as_of: Optional[datetime.date] = None) -> Dict[str, Dict[str, Any]]:
+        prefix = category_series("")
+        return {
+            key[len(prefix):]: self.performance_history(key, as_of)
+            for key in list(self.series)
+            if key.startswith(prefix)
+        }
+
+    def save(self, path: Optional[str] = None) -> str:
+        """Write every series to a compressed .npz file atomically"""
+        path = path or self.path
+        if not path:
+            raise ValueError("No NAV history path configured")
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._lock:
+            arrays: Dict[str, np.ndarray] = {
+                "keys": np.array(list(self.series), dtype=str),
+                "start_ordinals": np.array([series.start_ordinal for series in self.series.values()], dtype=np.int64),
+                "position_ids": np.array(list(self._investment_category), dtype=str),
+                "position_categories": np.array(list(self._investment_category.values()), dtype=str),
+                "position_navs": np.array([self._latest_nav[key] for key in self._investment_category]),
+            }
+            for index, series in enumerate(self.series.values()):
+                arrays[f"nav_{index}"], arrays[f"flow_{index}"] = series.arrays()
+
+        temp_path = f"{path}.tmp.npz"
+        np.savez_compressed(temp_path, **arrays)
+        os.replace(temp_path, path)
+        return path
+
+    def load(self, path: str) -> None:
+        """Rebuild series from a saved .npz file, recomputing prefix sums"""
+        with np.load(path) as data, self._lock:
+            self.series = {}
+            for index, (key, start_ordinal) in enumerate(zip(data["keys"].tolist(), data["start_ordinals"].tolist())):
+                self.series[key] = NavSeries.from_arrays(
+                    datetime.date.fromordinal(start_ordinal), data[f"nav_{index}"], data[f"flow_{index}"]
+                )
+
+            self._investment_category = dict(zip(data["position_ids"].tolist(), data["position_categories"].tolist()))
+            self._latest_nav = dict(zip(data["position_ids"].tolist(), data["position_navs"].tolist()))
+            self._category_totals = {}
+            for investment_id, category in self._investment_category.items():
+                self._category_totals[category] = self._category_totals.get(category, 0.0) + self._latest_nav[investment_id]
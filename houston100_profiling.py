@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Houston 100 Faith AI Assistant - On-Demand Request Profiling
+
+Profiles a single run_conversation or tool call in production, selected by
+the PROFILE_REQUESTS setting (environment variable of the same name) or a
+per-request flag:
+- A wall-clock stack sampler over every thread running Houston 100 code
+  (the agent worker and tool pool threads included), written as collapsed
+  stacks for flamegraph.pl, speedscope or Perfetto
+- A tracemalloc snapshot diff, written as a top-allocations report
+
+Nothing is installed until a request is selected: the check is a flag and
+a set lookup. One request is profiled at a time; a selected request that
+arrives while another is being profiled runs unprofiled. The sampler sees
+the whole process, so concurrent requests running the same code can show
+up in a profile.
+"""
+
+import os
+import re
+import sys
+import time
+import logging
+import datetime
+import linecache
+import itertools
+import threading
+import tracemalloc
+from collections import Counter, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Iterator, Optional
+
+PROFILE_ENV_VAR = "PROFILE_REQUESTS"
+FOCUS_MODULE_PREFIX = "houston100_"  # Only stacks through this code are request work
+IDLE_LEAF_MODULES = ("threading.py", "queue.py")  # Threads only ever parked here were idle all along
+RECENT_REPORTS = 20
+
+
+@dataclass
+class ProfileReport:
+    """Where one profiled request spent its time and memory"""
+    label: str
+    started_at: str
+    duration_ms: float
+    samples: int
+    flamegraph_path: str
+    allocations_path: str
+    allocated_bytes: int
+    peak_traced_bytes: int
+    top_allocations: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class StackSampler:
+    """Samples the Python stacks of all threads on a background thread
+
+    Threads whose every sample was parked in a threading/queue wait (idle
+    background workers) are left out of the output, except ``owner``, the
+    thread being profiled.
+    """
+
+    def __init__(self, interval_seconds: float = 0.005, focus: str = FOCUS_MODULE_PREFIX,
+                 owner: Optional[int] = None):
+        self.interval_seconds = interval_seconds
+        self.focus = focus
+        self.owner = threading.get_ident() if owner is None else owner
+        self.stacks: Counter = Counter()  # (thread ident, collapsed stack) -> samples
+        self.samples = 0
+        self._active_threads = {self.owner}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval_seconds):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident != own:
+                    self._record(ident, names.get(ident, str(ident)), frame)
+            self.samples += 1
+
+    def _record(self, ident: int, thread_name: str, frame) -> None:
+        if not os.path.basename(frame.f_code.co_filename).startswith(IDLE_LEAF_MODULES):
+            self._active_threads.add(ident)
+        stack = []
+        focused = False
+        while frame is not None:
+            code = frame.f_code
+            filename = os.path.basename(code.co_filename)
+            focused = focused or filename.startswith(self.focus)
+            stack.append(f"{code.co_name} ({filename}:{code.co_firstlineno})")
+            frame = frame.f_back
+        if focused:
+            stack.append(thread_name)
+            self.stacks[ident, ";".join(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        """Stacks in collapsed format: root;...;leaf <count> per line"""
+        return "".join(
+            f"{stack} {count}\n" for (ident, stack), count in self.stacks.most_common()
+            if ident in self._active_threads
+        )
+
+
+class RequestProfiler:
+    """Profiles selected requests and keeps their reports"""
+
+    def __init__(self, output_dir: str, selection: str = "", interval_ms: float = 5.0,
+                 top_allocations: int = 25):
+        self.output_dir = output_dir
+        self.interval_seconds = interval_ms / 1000
+        self.top_allocations = top_allocations
+        labels = {label.strip() for label in selection.split(",") if label.strip()}
+        self.profile_all = "all" in labels
+        self.selected = frozenset(labels - {"all"})
+        self.reports: deque = deque(maxlen=RECENT_REPORTS)
+        self.skipped_busy = 0
+        self.logger = logging.getLogger(__name__)
+        self._busy = threading.Lock()
+        self._sequence = itertools.count(1)
+
+    @classmethod
+    def from_config(cls, config) -> "RequestProfiler":
+        return cls(
+            config.PROFILE_OUTPUT_DIR,
+            os.environ.get(PROFILE_ENV_VAR, config.PROFILE_REQUESTS),
+            config.PROFILE_SAMPLE_INTERVAL_MS,
+            config.PROFILE_TOP_ALLOCATIONS
+        )
+
+    def wanted(self, label: str, flag: Optional[bool] = None) -> bool:
+        """Whether to profile ``label``: an explicit request flag wins, else the configured selection"""
+        if flag is not None:
+            return bool(flag)
+        return self.profile_all or label in self.selected
+
+    @contextmanager
+    def profile(self, label: str) -> Iterator[Optional[Dict[str, Any]]]:
+        """Profile the enclosed block; yields a dict that receives "report" on exit, or None if busy"""
+        if not self._busy.acquire(blocking=False):
+            self.skipped_busy += 1
+            self.logger.debug("Profiler busy; running %s unprofiled", label)
+            yield None
+            return
+
+        session: Dict[str, Any] = {}
+        try:
+            started_at = datetime.datetime.now()
+            started_tracing = not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            before = tracemalloc.take_snapshot()
+            sampler = StackSampler(self.interval_seconds)
+            started = time.perf_counter()
+            sampler.start()
+            try:
+                yield session
+            finally:
+                sampler.stop()
+                duration_ms = (time.perf_counter() - started) * 1000
+                after = tracemalloc.take_snapshot()
+                _, peak = tracemalloc.get_traced_memory()
+                if started_tracing:
+                    tracemalloc.stop()
+                try:
+                    session["report"] = self._write_report(
+                        label, started_at, duration_ms, sampler, before, after, peak
+                    )
+                except OSError as e:
+                    self.logger.error("Could not write profile for %s: %s", label, e)
+        finally:
+            self._busy.release()
+
+    def _write_report(self, label: str, started_at: datetime.datetime, duration_ms: float,
+                      sampler: StackSampler, before: tracemalloc.Snapshot, after: tracemalloc.Snapshot,
+                      peak: int) -> ProfileReport:
+        ignored = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+        differences = after.filter_traces(ignored).compare_to(before.filter_traces(ignored), "lineno")
+        growth = sorted((stat for stat in differences if stat.size_diff > 0),
+                        key=lambda stat: stat.size_diff, reverse=True)
+        top = []
+        for stat in growth[:self.top_allocations]:
+            frame = stat.traceback[0]
+            top.append({
+                "location": f"{frame.filename}:{frame.lineno}",
+                "size_diff_bytes": stat.size_diff,
+                "count_diff": stat.count_diff,
+                "source": linecache.getline(frame.filename, frame.lineno).strip()
+            })
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        stem = os.path.join(
+            self.output_dir,
+            f"{started_at:%Y%m%dT%H%M%S}-{re.sub(r'[^A-Za-z0-9_.-]', '_', label)}-{next(self._sequence)}"
+        )
+        flamegraph_path = f"{stem}.collapsed"
+        with open(flamegraph_path, "w", encoding="utf-8") as flamegraph_file:
+            flamegraph_file.write(sampler.collapsed())
+
+        allocated = sum(stat.size_diff for stat in growth)
+        allocations_path = f"{stem}-allocations.txt"
+        with open(allocations_path, "w", encoding="utf-8") as allocations_file:
+            allocations_file.write(
+                f"Top allocations for {label} at {started_at.isoformat()} ({duration_ms:.1f} ms)\n"
+                f"Net new: {allocated / 1024:.1f} KiB; peak traced: {peak / 1024:.1f} KiB\n\n"
+            )
+            for rank, entry in enumerate(top, 1):
+                allocations_file.write(
+                    f"#{rank} {entry['location']}: +{entry['size_diff_bytes'] / 1024:.1f} KiB "
+                    f"({entry['count_diff']:+d} blocks)\n    {entry['source']}\n"
+                )
+
+        report = ProfileReport(
+            label=label,
+            started_at=started_at.isoformat(),
+            duration_ms=round(duration_ms, 3),
+            samples=sampler.samples,
+            flamegraph_path=flamegraph_path,
+            allocations_path=allocations_path,
+            allocated_bytes=allocated,
+            peak_traced_bytes=peak,
+            top_allocations=top
+        )
+        self.reports.append(report)
+        self.logger.info("Profiled %s in %.1f ms: %s, %s", label, duration_ms, flamegraph_path, allocations_path)
+        return report
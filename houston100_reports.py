@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Houston 100 Faith AI Assistant - Quarterly Member Reports
+
+Parallel batch generation of the DHAP "quarterly financial and ministry
+impact reports":
+- Quarter returns and Kingdom impact per investment are precomputed once
+  and shared with every worker process
+- Reports are rendered across a process pool and written to disk as each
+  member finishes, never held in memory
+- A manifest of per-member input hashes lets reruns skip members whose
+  holdings and underlying aggregates are unchanged
+"""
+
+import os
+import json
+import time
+import hashlib
+import datetime
+import multiprocessing
+from dataclasses import dataclass, field
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple, TYPE_CHECKING
+
+from houston100_members import MemberRecord
+from houston100_nav import investment_series, category_series
+
+if TYPE_CHECKING:
+    from houston100_nav import NavTimeSeriesStore
+    from houston100_store import InvestmentStore
+
+MANIFEST_FILE = "manifest.json"
+MANIFEST_SAVE_INTERVAL = 1000  # Persist progress every N reports so interrupted runs resume
+IMPACT_FIELDS = ("families_impacted", "jobs_created", "businesses_supported")
+
+
+def quarter_bounds(quarter: str) -> Tuple[datetime.date, datetime.date]:
+    """First and last day of a quarter label such as "2025Q1" """
+    year, number = int(quarter[:4]), int(quarter[-1])
+    start = datetime.date(year, 3 * number - 2, 1)
+    next_start = datetime.date(year + (number == 4), 1 if number == 4 else 3 * number + 1, 1)
+    return start, next_start - datetime.timedelta(days=1)
+
+
+def last_completed_quarter(today: Optional[datetime.date] = None) -> str:
+    today = today or datetime.date.today()
+    number = (today.month - 1) // 3
+    return f"{today.year - 1}Q4" if number == 0 else f"{today.year}Q{number}"
+
+
+@dataclass
+class ReportAggregates:
+    """Per-investment inputs shared by every member report in a quarter"""
+    quarter: str
+    investment_returns: Dict[str, Optional[float]] = field(default_factory=dict)
+    category_returns: Dict[str, Optional[float]] = field(default_factory=dict)
+    investment_impact: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, quarter: str, investment_ids: Iterable[str], categories: Iterable[str],
+              nav_history: "NavTimeSeriesStore", investment_store: "InvestmentStore") -> "ReportAggregates":
+        """Precompute quarter returns and Kingdom impact for every held investment"""
+        start, end = quarter_bounds(quarter)
+        previous_close = start - datetime.timedelta(days=1)
+
+        def quarter_return(key: str) -> Optional[float]:
+            series = nav_history.get(key)
+            if series is None or not series.length or series.last_day < end or series.start_day > previous_close:
+                return None
+            return round(series.window_return(previous_close, end) * 100, 2)
+
+        aggregates = cls(quarter=quarter)
+        for category in set(categories):
+            aggregates.category_returns[category] = quarter_return(category_series(category))
+        for investment_id in set(investment_ids):
+            aggregates.investment_returns[investment_id] = quarter_return(investment_series(investment_id))
+            investment = investment_store.get_investment(investment_id)
+            analysis = investment_store.get_analysis(investment_id)
+            if investment is None:
+                continue
+            impact = investment.get("community_impact") or {}
+            aggregates.investment_impact[investment_id] = {
+                "name": investment["name"],
+                "total_investment_cents": investment["total_investment_cents"],
+                "kingdom_score": analysis["kingdom_impact_score"]["overall_score"] if analysis else None,
+                **{name: impact.get(name, 0) for name in IMPACT_FIELDS}
+            }
+        return aggregates
+
+    def inputs_for(self, member: MemberRecord) -> Dict[str, Any]:
+        """The aggregate entries a member's report depends on"""
+        return {
+            holding.investment_id: [
+                self.investment_returns.get(holding.investment_id),
+                self.category_returns.get(holding.category),
+                self.investment_impact.get(holding.investment_id)
+            ]
+            for holding in member.holdings
+        }
+
+
+def member_input_hash(member: MemberRecord, aggregates: ReportAggregates) -> str:
+    """Hash of everything a member's report is rendered from"""
+    payload = json.dumps({
+        "quarter": aggregates.quarter,
+        "member": [member.member_id, member.name, member.email, member.tier],
+        "holdings": [[h.investment_id, h.category, h.commitment.cents] for h in member.holdings],
+        "inputs": aggregates.inputs_for(member)
+    }, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def render_member_report(member: MemberRecord, aggregates: ReportAggregates) -> Dict[str, Any]:
+    """Holdings performance and attributed Kingdom impact for one member"""
+    holdings = []
+    attributed = dict.fromkeys(IMPACT_FIELDS, 0.0)
+    weighted_return, return_weight = 0.0, 0
+
+    for holding in member.holdings:
+        quarter_return = aggregates.investment_returns.get(holding.investment_id)
+        if quarter_return is None:
+            quarter_return = aggregates.category_returns.get(holding.category)
+        impact = aggregates.investment_impact.get(holding.investment_id) or {}
+        total_cents = impact.get("total_investment_cents") or 0
+        # Impact is attributed pro rata to the member's share of the investment
+        share = min(1.0, holding.commitment.cents / total_cents) if total_cents else 0.0
+
+        for name in IMPACT_FIELDS:
+            attributed[name] += share * (impact.get(name) or 0)
+        if quarter_return is not None:
+            weighted_return += quarter_return * holding.commitment.cents
+            return_weight += holding.commitment.cents
+
+        commitment = float(holding.commitment.to_decimal())
+        holdings.append({
+            "investment_id": holding.investment_id,
+            "investment_name": impact.get("name"),
+            "category": holding.category,
+            "commitment": commitment,
+            "quarter_return_pct": quarter_return,
+            "estimated_quarter_gain": round(commitment * quarter_return / 100, 2) if quarter_return is not None else None,
+            "kingdom_score": impact.get("kingdom_score"),
+            "ownership_share_pct": round(share * 100, 4)
+        })
+
+    return {
+        "report_type": "DHAP Quarterly Financial and Ministry Impact Report",
+        "quarter": aggregates.quarter,
+        "member": {"member_id": member.member_id, "name": member.name, "dhap_tier": member.tier},
+        "total_commitment": float(member.total_commitment.to_decimal()),
+        "weighted_quarter_return_pct": round(weighted_return / return_weight, 2) if return_weight else None,
+        "holdings": holdings,
+        "attributed_kingdom_impact": {name: round(value, 2) for name, value in attributed.items()},
+        "generated_at": datetime.datetime.now().isoformat()
+    }
+
+
+def _report_path(directory: str, member_id: str) -> str:
+    return os.path.join(directory, f"{member_id}.json")
+
+
+def _write_report(directory: str, member_id: str, report: Dict[str, Any]) -> str:
+    path = _report_path(directory, member_id)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as report_file:
+        json.dump(report, report_file, indent=2)
+    os.replace(temp_path, path)
+    return path
+
+
+# Per-process state set once by the pool initializer instead of pickled with every task
+_worker_aggregates: Optional[ReportAggregates] = None
+_worker_directory: Optional[str] = None
+
+
+def _init_worker(aggregates: ReportAggregates, directory: str) -> None:
+    global _worker_aggregates, _worker_directory
+    _worker_aggregates, _worker_directory = aggregates, directory
+
+
+def _generate_one(task: Tuple[MemberRecord, str]) -> Tuple[str, str]:
+    member, input_hash = task
+    _write_report(_worker_directory, member.member_id, render_member_report(member, _worker_aggregates))
+    return member.member_id, input_hash
+
+
+class QuarterlyReportGenerator:
+    """Generates one JSON report per member for a quarter across a process pool"""
+
+    def __init__(self, output_dir: str, workers: Optional[int] = None, chunksize: int = 64):
+        self.output_dir = output_dir
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.chunksize = chunksize
+
+    def _load_manifest(self, path: str) -> Dict[str, str]:
+        if not os.path.exists(path):
+            return {}
+        with open(path, encoding="utf-8") as manifest_file:
+            return json.load(manifest_file)
+
+    def _save_manifest(self, path: str, manifest: Dict[str, str]) -> None:
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as manifest_file:
+            json.dump(manifest, manifest_file)
+        os.replace(temp_path, path)
+
+    def generate(self, members: Iterable[MemberRecord], aggregates: ReportAggregates,
+                 force: bool = False) -> Dict[str, Any]:
+        """Render reports for members whose inputs changed since the last run"""
+        directory = os.path.join(self.output_dir, aggregates.quarter)
+        os.makedirs(directory, exist_ok=True)
+        manifest_path = os.path.join(directory, MANIFEST_FILE)
+        manifest = {} if force else self._load_manifest(manifest_path)
+
+        started = time.perf_counter()
+        counts = {"members": 0, "skipped": 0}
+
+        def pending() -> Iterator[Tuple[MemberRecord, str]]:
+            for member in members:
+                counts["members"] += 1
+                input_hash = member_input_hash(member, aggregates)
+                # A deleted report is regenerated even when its inputs are unchanged
+                if (manifest.get(member.member_id) == input_hash
+                        and os.path.exists(_report_path(directory, member.member_id))):
+                    counts["skipped"] += 1
+                    continue
+                yield member, input_hash
+
+        generated = 0
+        if self.workers > 1:
+            with multiprocessing.Pool(self.workers, initializer=_init_worker,
+                                      initargs=(aggregates, directory)) as pool:
+                for member_id, input_hash in pool.imap_unordered(_generate_one, pending(), self.chunksize):
+                    manifest[member_id] = input_hash
+                    generated += 1
+                    if generated % MANIFEST_SAVE_INTERVAL == 0:
+                        self._save_manifest(manifest_path, manifest)
+        else:
+            _init_worker(aggregates, directory)
+            for task in pending():
+                member_id, input_hash = _generate_one(task)
+                manifest[member_id] = input_hash
+                generated += 1
+
+        self._save_manifest(manifest_path, manifest)
+        elapsed = time.perf_counter() - started
+        return {
+            "quarter": aggregates.quarter,
+            "output_dir": directory,
+            "members": counts["members"],
+            "reports_generated": generated,
+            "reports_skipped": counts["skipped"],
+            "workers": self.workers,
+            "elapsed_seconds": round(elapsed, 3),
+            "members_per_second": round(counts["members"] / elapsed, 1) if elapsed else 0.0,
+            "reports_per_second": round(generated / elapsed, 1) if elapsed else 0.0
+        }
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Houston 100 Faith AI Assistant - Deal Screener
+
+Streaming top-K screening over analyzed deals:
+- Predicate filters on investment type, Kingdom score, IRR range and tier
+- Ranking by kingdom_roi or any other numeric field
+- Bounded heap keeps memory at O(K) however many candidates are streamed
+"""
+
+import heapq
+import math
+import itertools
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Callable, Iterable, Optional
+
+DEFAULT_RANK_FIELD = "kingdom_roi"
+
+
+@dataclass
+class ScreenCriteria:
+    """Filters applied to each candidate deal; unset fields match everything"""
+    investment_type: Optional[str] = None
+    min_kingdom_score: Optional[int] = None
+    min_irr: Optional[float] = None
+    max_irr: Optional[float] = None
+    recommendation_tier: Optional[str] = None
+    predicates: List[Callable[[Dict[str, Any]], bool]] = field(default_factory=list)
+
+    def matches(self, deal: Dict[str, Any]) -> bool:
+        if self.investment_type and deal.get("investment_type") != self.investment_type:
+            return False
+        if self.recommendation_tier and deal.get("recommendation_tier") != self.recommendation_tier.upper():
+            return False
+        if self.min_kingdom_score is not None and (deal.get("kingdom_score") or 0) < self.min_kingdom_score:
+            return False
+        irr = deal.get("projected_irr")
+        if self.min_irr is not None and (irr is None or irr < self.min_irr):
+            return False
+        if self.max_irr is not None and (irr is None or irr > self.max_irr):
+            return False
+        return all(predicate(deal) for predicate in self.predicates)
+
+
+@dataclass
+class ScreenResult:
+    """Top-K deals plus how many candidates were scanned and matched"""
+    rank_by: str
+    scanned: int
+    matched: int
+    deals: List[Dict[str, Any]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "rank_by": self.rank_by,
+            "candidates_scanned": self.scanned,
+            "candidates_matched": self.matched,
+            "deals": self.deals
+        }
+
+
+def screen_deals(candidates: Iterable[Dict[str, Any]], criteria: Optional[ScreenCriteria] = None,
+                 rank_by: str = DEFAULT_RANK_FIELD, top_k: int = 10, descending: bool = True) -> ScreenResult:
+    """Stream candidates through the criteria and keep the best ``top_k`` by ``rank_by``
+
+    Candidates whose rank field is missing, non-numeric or NaN are skipped. Ties
+    keep the earliest candidate.
+    """
+    criteria = criteria or ScreenCriteria()
+    sign = 1 if descending else -1
+    # Min-heap on (signed key, -sequence): the root is the weakest kept deal
+    heap: List[tuple] = []
+    sequence = itertools.count()
+    scanned = matched = 0
+
+    for deal in candidates:
+        scanned += 1
+        if not criteria.matches(deal):
+            continue
+        value = deal.get(rank_by)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        if math.isnan(value):
+            # NaN compares false both ways and would corrupt the heap order
+            continue
+        matched += 1
+        if top_k <= 0:
+            continue
+
+        entry = (sign * value, -next(sequence), deal)
+        if len(heap) < top_k:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+
+    ranked = [deal for _, _, deal in sorted(heap, key=lambda entry: entry[:2], reverse=True)]
+    return ScreenResult(rank_by=rank_by, scanned=scanned, matched=matched, deals=ranked)
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Houston 100 Faith AI Assistant - Sensitivity and What-If Analysis
+
+Vectorized what-if sweeps over the inputs of the Kingdom recommendation:
+- Projected IRR, individual Biblical principle scores and principle weights
+- Whole grids evaluated in one pass with NumPy arrays
+- Tornado-chart data and exact tier-flip boundaries per variable
+
+Tiers come from the analyzer's recommendation decision table, so the
+sweeps always follow the active policy version. Variables are named
+``projected_irr``, ``score:<principle_id>`` or
+``weight:<principle_id>``. Changing a weight rescales the other weights
+proportionally so they still sum to one.
+"""
+
+import math
+import itertools
+from dataclasses import dataclass
+from typing import Dict, List, Any, Sequence, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from houston100_decisions import TIER_RANKING
+
+if TYPE_CHECKING:
+    from houston100_agent import InvestmentData, KingdomInvestmentAnalyzer, KingdomPrinciples
+
+DEFAULT_IRR_RANGE = (0.0, 30.0)
+DEFAULT_IRR_DELTA = 2.0
+DEFAULT_SCORE_DELTA = 10
+DEFAULT_WEIGHT_DELTA = 0.05
+# Impact defaults come from the investment-type matrix; alignment always defaults to 70
+ALIGNMENT_DEFAULT_SCORE = 70
+# Table fields that the analyzer truncates to whole numbers before deciding
+TRUNCATED_FIELDS = ("kingdom_score", "biblical_alignment_score")
+
+
+@dataclass
+class ScenarioBatch:
+    """Model inputs for n scenarios over P principles"""
+    projected_irr: np.ndarray      # (n,)
+    impact_scores: np.ndarray      # (n, P) scores used for the Kingdom Impact Score
+    alignment_scores: np.ndarray   # (n, P) scores used for Biblical alignment
+    weights: np.ndarray            # (n, P)
+
+    def __len__(self) -> int:
+        return len(self.projected_irr)
+
+    def repeat(self, count: int) -> "ScenarioBatch":
+        return ScenarioBatch(
+            np.repeat(self.projected_irr, count),
+            np.repeat(self.impact_scores, count, axis=0),
+            np.repeat(self.alignment_scores, count, axis=0),
+            np.repeat(self.weights, count, axis=0)
+        )
+
+    @classmethod
+    def concatenate(cls, batches: Sequence["ScenarioBatch"]) -> "ScenarioBatch":
+        return cls(
+            np.concatenate([batch.projected_irr for batch in batches]),
+            np.concatenate([batch.impact_scores for batch in batches]),
+            np.concatenate([batch.alignment_scores for batch in batches]),
+            np.concatenate([batch.weights for batch in batches])
+        )
+
+
+class SensitivityEngine:
+    """What-if sweeps, tornado data and tier-flip boundaries for one investment"""
+
+    def __init__(self, analyzer: "KingdomInvestmentAnalyzer", principles: Sequence["KingdomPrinciples"]):
+        self.analyzer = analyzer
+        self.decision_table = analyzer.decision_table
+        self.principles = list(principles)
+        self.principle_ids = [principle.principle_id for principle in self.principles]
+
+    def variables(self) -> List[str]:
+        return (["projected_irr"]
+                + [f"score:{pid}" for pid in self.principle_ids]
+                + [f"weight:{pid}" for pid in self.principle_ids])
+
+    def baseline(self, investment: "InvestmentData") -> ScenarioBatch:
+        """Single-scenario batch matching analyze_investment's inputs"""
+        impact = [
+            investment.kingdom_scores.get(
+                principle.principle_id,
+                self.analyzer._default_score_for_investment_type(investment.investment_type, principle)
+            )
+            for principle in self.principles
+        ]
+        alignment = [
+            investment.kingdom_scores.get(principle.principle_id, ALIGNMENT_DEFAULT_SCORE)
+            for principle in self.principles
+        ]
+        return ScenarioBatch(
+            np.array([investment.projected_irr], dtype=float),
+            np.array([impact], dtype=float),
+            np.array([alignment], dtype=float),
+            np.array([[principle.weight for principle in self.principles]], dtype=float)
+        )
+
+    def evaluate(self, batch: ScenarioBatch) -> Dict[str, np.ndarray]:
+        """Kingdom score, Biblical alignment and tier for every scenario at once"""
+        kingdom_raw = np.zeros(len(batch))
+        alignment_raw = np.zeros(len(batch))
+        # Accumulate principle by principle so float rounding matches the scalar analyzer
+        for column in range(len(self.principles)):
+            kingdom_raw += batch.impact_scores[:, column] * batch.weights[:, column]
+            alignment_raw += batch.alignment_scores[:, column] * batch.weights[:, column]
+
+        kingdom = np.clip(np.trunc(kingdom_raw), 0, 100)
+        alignment = np.trunc(alignment_raw)
+        return {
+            "kingdom_raw": kingdom_raw,
+            "alignment_raw": alignment_raw,
+            "kingdom_score": kingdom,
+            "biblical_alignment_score": alignment,
+            "tier": self.classify(kingdom, batch.projected_irr, alignment)
+        }
+
+    def classify(self, kingdom_score: np.ndarray, projected_irr: np.ndarray,
+                 biblical_alignment_score: np.ndarray) -> np.ndarray:
+        """TIER_RANKING rank of the decision-table rule that fires for each scenario"""
+        rules = self.decision_table.evaluate({
+            "kingdom_score": kingdom_score,
+            "projected_irr": projected_irr,
+            "biblical_alignment_score": biblical_alignment_score
+        })
+        return self.decision_table.tier_ranks[rules]
+
+    def thresholds(self, field_name: str) -> List[float]:
+        """Decision-table thresholds on a field, as crossing points of its untruncated value"""
+        if field_name not in self.decision_table.fields:
+            return []
+        thresholds = self.decision_table.thresholds(field_name)
+        if field_name in TRUNCATED_FIELDS:
+            thresholds = [float(math.ceil(value)) for value in thresholds]
+        return thresholds
+
+    def apply(self, batch: ScenarioBatch, variable: str, values: np.ndarray) -> ScenarioBatch:
+        """Copy of ``batch`` with ``variable`` set per scenario to ``values``"""
+        values = np.broadcast_to(np.asarray(values, dtype=float), (len(batch),))
+        irr = batch.projected_irr.copy()
+        impact = batch.impact_scores.copy()
+        alignment = batch.alignment_scores.copy()
+        weights = batch.weights.copy()
+
+        if variable == "projected_irr":
+            irr[:] = values
+            return ScenarioBatch(irr, impact, alignment, weights)
+
+        kind, _, principle_id = variable.partition(":")
+        if principle_id not in self.principle_ids or kind not in ("score", "weight"):
+            raise ValueError(f"Unknown sensitivity variable: {variable}")
+        column = self.principle_ids.index(principle_id)
+
+        if kind == "score":
+            # A supplied principle score feeds both the impact score and the alignment
+            impact[:, column] = values
+            alignment[:, column] = values
+        else:
+            others = np.arange(len(self.principle_ids)) != column
+            remaining = 1.0 - weights[:, column]
+            scale = np.divide(1.0 - values, remaining, out=np.zeros_like(remaining), where=remaining > 0)
+            weights[:, others] *= scale[:, None]
+            weights[:, column] = values
+        return ScenarioBatch(irr, impact, alignment, weights)
+
+    def sweep(self, investment: "InvestmentData", variable: str, values: Sequence[float]) -> Dict[str, Any]:
+        """Evaluate one variable over a list of values"""
+        values = np.asarray(values, dtype=float)
+        batch = self.apply(self.baseline(investment).repeat(len(values)), variable, values)
+        return {"variable": variable, "values": values, **self.evaluate(batch)}
+
+    def grid(self, investment: "InvestmentData", axes: Dict[str, Sequence[float]]) -> Dict[str, Any]:
+        """Evaluate the full cartesian product of several variables in one pass"""
+        axis_values = [np.asarray(values, dtype=float) for values in axes.values()]
+        mesh = np.meshgrid(*axis_values, indexing="ij")
+        shape = mesh[0].shape if mesh else ()
+
+        batch = self.baseline(investment).repeat(int(np.prod(shape)) if mesh else 1)
+        for variable, values in zip(axes, mesh):
+            batch = self.apply(batch, variable, values.ravel())
+
+        results = self.evaluate(batch)
+        tier_counts = np.bincount(results["tier"], minlength=len(TIER_RANKING))
+        return {
+            "axes": dict(zip(axes, axis_values)),
+            "points": len(batch),
+            "tier_counts": {label: int(count) for label, count in zip(TIER_RANKING, tier_counts) if count},
+            "kingdom_score": results["kingdom_score"].reshape(shape),
+            "biblical_alignment_score": results["biblical_alignment_score"].reshape(shape),
+            "tier": results["tier"].reshape(shape)
+        }
+
+    def _variable_range(self, variable: str) -> Tuple[float, float]:
+        if variable == "projected_irr":
+            return DEFAULT_IRR_RANGE
+        if variable.startswith("score:"):
+            return 0.0, 100.0
+        return 0.0, 1.0
+
+    def _baseline_value(self, variable: str, baseline: ScenarioBatch) -> float:
+        if variable == "projected_irr":
+            return float(baseline.projected_irr[0])
+        kind, _, principle_id = variable.partition(":")
+        column = self.principle_ids.index(principle_id)
+        source = baseline.impact_scores if kind == "score" else baseline.weights
+        return float(source[0, column])
+
+    def tornado(self, investment: "InvestmentData", irr_delta: float = DEFAULT_IRR_DELTA,
+                score_delta: float = DEFAULT_SCORE_DELTA,
+                weight_delta: float = DEFAULT_WEIGHT_DELTA) -> List[Dict[str, Any]]:
+        """Low/high outcomes per variable, ordered by tier swing then score swing"""
+        baseline = self.baseline(investment)
+        deltas = {"projected_irr": irr_delta, "score": score_delta, "weight": weight_delta}
+
+        variables, lows, highs, batches = self.variables(), [], [], []
+        for variable in variables:
+            center = self._baseline_value(variable, baseline)
+            lower, upper = self._variable_range(variable)
+            delta = deltas.get(variable, deltas[variable.partition(":")[0]])
+            low, high = max(lower, center - delta), min(upper, center + delta)
+            lows.append(low)
+            highs.append(high)
+            batches.append(self.apply(baseline.repeat(2), variable, np.array([low, high])))
+
+        # One vectorized evaluation for every bar
+        results = self.evaluate(ScenarioBatch.concatenate(batches))
+        base = self.evaluate(baseline)
+
+        bars = []
+        for index, variable in enumerate(variables):
+            low_at, high_at = 2 * index, 2 * index + 1
+            kingdom = results["kingdom_score"][[low_at, high_at]]
+            alignment = results["biblical_alignment_score"][[low_at, high_at]]
+            tiers = results["tier"][[low_at, high_at]]
+            bars.append({
+                "variable": variable,
+                "baseline_value": round(self._baseline_value(variable, baseline), 4),
+                "low_value": round(lows[index], 4),
+                "high_value": round(highs[index], 4),
+                "kingdom_score": [int(kingdom[0]), int(kingdom[1])],
+                "biblical_alignment_score": [int(alignment[0]), int(alignment[1])],
+                "tier": [TIER_RANKING[tiers[0]], TIER_RANKING[tiers[1]]],
+                "tier_swing": int(abs(tiers[1] - tiers[0])),
+                "score_swing": int(abs(kingdom[1] - kingdom[0]) + abs(alignment[1] - alignment[0]))
+            })
+
+        bars.sort(key=lambda bar: (bar["tier_swing"], bar["score_swing"]), reverse=True)
+        return [{"baseline_tier": TIER_RANKING[base["tier"][0]], **bar} for bar in bars]
+
+    def tier_boundaries(self, investment: "InvestmentData", variable: str) -> List[Dict[str, Any]]:
+        """Exact values of ``variable`` where the recommendation tier flips, others held at baseline
+
+        Kingdom and alignment scores are linear in every variable before
+        truncation, so each threshold crossing is solved in closed form and
+        then confirmed by evaluating the tiers on either side.
+        """
+        baseline = self.baseline(investment)
+        lower, upper = self._variable_range(variable)
+
+        if variable == "projected_irr":
+            candidates = self.thresholds("projected_irr")
+        else:
+            probes = self.evaluate(self.apply(baseline.repeat(2), variable, np.array([lower, upper])))
+            candidates = []
+            for raw, metric in (("kingdom_raw", "kingdom_score"), ("alignment_raw", "biblical_alignment_score")):
+                start, end = probes[raw]
+                slope = (end - start) / (upper - lower)
+                if slope:
+                    candidates += [lower + (level - start) / slope for level in self.thresholds(metric)]
+
+        candidates = sorted({round(value, 9) for value in candidates if lower < value < upper})
+        if not candidates:
+            return []
+
+        # Tier on each side of every candidate: the interval midpoints plus the range ends
+        edges = [lower, *candidates, upper]
+        midpoints = np.array([(left + right) / 2 for left, right in zip(edges, edges[1:])])
+        tiers = self.evaluate(self.apply(baseline.repeat(len(midpoints)), variable, midpoints))["tier"]
+
+        return [
+            {
+                "variable": variable,
+                "value": value,
+                "tier_below": TIER_RANKING[below],
+                "tier_above": TIER_RANKING[above]
+            }
+            for value, below, above in zip(candidates, tiers, tiers[1:])
+            if below != above
+        ]
+
+    def analyze(self, investment: "InvestmentData") -> Dict[str, Any]:
+        """Baseline, tornado data and tier-flip boundaries for every variable"""
+        base = self.evaluate(self.baseline(investment))
+        boundaries = itertools.chain.from_iterable(
+            self.tier_boundaries(investment, variable) for variable in self.variables()
+        )
+        return {
+            "investment_id": investment.id,
+            "baseline": {
+                "projected_irr": investment.projected_irr,
+                "kingdom_score": int(base["kingdom_score"][0]),
+                "biblical_alignment_score": int(base["biblical_alignment_score"][0]),
+                "tier": TIER_RANKING[base["tier"][0]]
+            },
+            "tornado": self.tornado(investment),
+            "tier_boundaries": list(boundaries)
+        }
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Houston 100 Faith AI Assistant - SLO Burn-Rate Engine
+
+Service-level objectives per health component, evaluated from live events:
+- Good/bad event counts (and a latency sum) in fixed-size ring buffers of
+  time buckets, so memory does not grow with traffic
+- Error-budget burn rates over 5-minute, 1-hour and 6-hour windows
+- Multi-window alerts (5m/1h fast burn, 1h/6h slow burn) that fire only
+  when both windows are burning, so a single spike never pages anyone
+- Health scores derived from the 1-hour burn rate
+
+A burn rate of 1 spends the error budget exactly as fast as the objective
+allows; 14.4 over an hour spends 2% of a 30-day budget.
+"""
+
+import math
+import time
+import datetime
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+BUCKET_SECONDS = 10
+BURN_WINDOWS = {"5m": 300, "1h": 3600, "6h": 21600}
+SCORE_WINDOW = "1h"
+SCORE_PER_BURN = 10  # Health points lost per unit of 1-hour burn rate
+MIN_ALERT_EVENTS = 100  # Long-window events needed before a burn can alert; low traffic is too noisy
+
+
+@dataclass
+class ServiceLevelObjective:
+    """Target good-event ratio for one component"""
+    component: str
+    objective: float
+    description: str = ""
+
+    @property
+    def error_budget(self) -> float:
+        return 1.0 - self.objective
+
+
+@dataclass
+class BurnRatePolicy:
+    """Alert when both the long and the short window burn faster than ``threshold``"""
+    name: str
+    long_window: str
+    short_window: str
+    threshold: float
+    severity: str
+
+
+DEFAULT_BURN_POLICIES = [
+    BurnRatePolicy("fast_burn", long_window="1h", short_window="5m", threshold=14.4, severity="HIGH"),
+    BurnRatePolicy("slow_burn", long_window="6h", short_window="1h", threshold=6.0, severity="MEDIUM"),
+]
+
+
+class SlidingWindowCounter:
+    """Good/bad counts and a value sum in a ring of time buckets"""
+
+    def __init__(self, horizon_seconds: float, bucket_seconds: float = BUCKET_SECONDS):
+        self.bucket_seconds = bucket_seconds
+        self.size = math.ceil(horizon_seconds / bucket_seconds) + 1
+        self._epochs = np.full(self.size, -1, dtype=np.int64)
+        self._good = np.zeros(self.size, dtype=np.int64)
+        self._bad = np.zeros(self.size, dtype=np.int64)
+        self._value_sum = np.zeros(self.size)
+
+    def add(self, good: int, bad: int, value: float, now: float) -> None:
+        epoch = int(now // self.bucket_seconds)
+        slot = epoch % self.size
+        if self._epochs[slot] != epoch:
+            # The slot still holds a bucket from one horizon ago
+            self._epochs[slot] = epoch
+            self._good[slot] = self._bad[slot] = 0
+            self._value_sum[slot] = 0.0
+        self._good[slot] += good
+        self._bad[slot] += bad
+        self._value_sum[slot] += value
+
+    def totals(self, window_seconds: float, now: float) -> Tuple[int, int, float]:
+        epoch = int(now // self.bucket_seconds)
+        oldest = epoch - math.ceil(window_seconds / self.bucket_seconds) + 1
+        mask = (self._epochs >= oldest) & (self._epochs <= epoch)
+        return int(self._good[mask].sum()), int(self._bad[mask].sum()), float(self._value_sum[mask].sum())
+
+
+class SLOEngine:
+    """Tracks events against objectives and evaluates burn rates, alerts and scores"""
+
+    def __init__(self, objectives: List[ServiceLevelObjective],
+                 policies: Optional[List[BurnRatePolicy]] = None,
+                 bucket_seconds: float = BUCKET_SECONDS):
+        self.objectives = {slo.component: slo for slo in objectives}
+        self.policies = list(DEFAULT_BURN_POLICIES if policies is None else policies)
+        horizon = max(BURN_WINDOWS.values())
+        self._counters = {
+            component: SlidingWindowCounter(horizon, bucket_seconds) for component in self.objectives
+        }
+        self._lock = threading.Lock()
+
+    def record(self, component: str, good: bool, value: float = 0.0, now: Optional[float] = None) -> None:
+        """Count one event; ``value`` (e.g. latency in ms) feeds window averages"""
+        self.record_counts(component, int(good), int(not good), value, now)
+
+    def record_counts(self, component: str, good: int, bad: int, value: float = 0.0,
+                      now: Optional[float] = None) -> None:
+        counter = self._counters.get(component)
+        if counter is None:
+            return
+        with self._lock:
+            counter.add(good, bad, value, time.monotonic() if now is None else now)
+
+    def window(self, component: str, window: str, now: Optional[float] = None) -> Dict[str, Any]:
+        """Event counts, good ratio, burn rate and mean value over a named window"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            good, bad, value_sum = self._counters[component].totals(BURN_WINDOWS[window], now)
+        total = good + bad
+        bad_ratio = bad / total if total else 0.0
+        budget = self.objectives[component].error_budget
+        return {
+            "events": total,
+            "bad_events": bad,
+            "good_ratio": 1.0 - bad_ratio if total else None,
+            "burn_rate": bad_ratio / budget if budget > 0 else (math.inf if bad else 0.0),
+            "mean_value": value_sum / total if total else None
+        }
+
+    def evaluate(self, component: str, now: Optional[float] = None) -> Dict[str, Any]:
+        """Burn rates, firing alerts and health score for one component"""
+        now = time.monotonic() if now is None else now
+        windows = {name: self.window(component, name, now) for name in BURN_WINDOWS}
+        slo = self.objectives[component]
+
+        alerts = []
+        for policy in self.policies:
+            long_window, short_window = windows[policy.long_window], windows[policy.short_window]
+            if (long_window["events"] >= MIN_ALERT_EVENTS
+                    and long_window["burn_rate"] >= policy.threshold
+                    and short_window["burn_rate"] >= policy.threshold):
+                alerts.append({
+                    "severity": policy.severity,
+                    "component": component,
+                    "policy": policy.name,
+                    "message": (
+                        f"{component} is burning its {slo.objective:.2%} SLO error budget at "
+                        f"{long_window['burn_rate']:.1f}x over {policy.long_window} "
+                        f"and {short_window['burn_rate']:.1f}x over {policy.short_window}"
+                    ),
+                    "timestamp": datetime.datetime.now().isoformat()
+                })
+
+        scoring = windows[SCORE_WINDOW]
+        score = None
+        if scoring["events"]:
+            score = int(round(min(100.0, max(0.0, 100.0 - SCORE_PER_BURN * scoring["burn_rate"]))))
+        return {
+            "objective": slo.objective,
+            "description": slo.description,
+            "burn_rates": {name: round(data["burn_rate"], 3) for name, data in windows.items()},
+            "good_ratio_1h": None if scoring["good_ratio"] is None else round(scoring["good_ratio"], 6),
+            "events_1h": scoring["events"],
+            "health_score": score,
+            "alerts": alerts
+        }
+
+    def evaluate_all(self, now: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        now = time.monotonic() if now is None else now
+        return {component: self.evaluate(component, now) for component in self.objectives}
+
+    def active_alerts(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        return [alert for report in self.evaluate_all(now).values() for alert in report["alerts"]]
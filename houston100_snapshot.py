@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Houston 100 Faith AI Assistant - Columnar Portfolio Snapshots
+
+Versioned, memory-mapped snapshots of the portfolio/investment table so a
+fresh worker can serve portfolio analytics without parsing JSON or hitting
+the database:
+- Small fixed header followed by page-aligned column files in one blob
+- Columns are read zero-copy into NumPy arrays via mmap
+- Snapshots carry a generation number; readers reload newer ones on demand
+
+File layout:
+    [0:48)      header struct (magic, format version, generation, row count, ...)
+    [48:N)      JSON column directory and category labels
+    [N:...)     column data, each column aligned to 64 bytes, data page-aligned
+"""
+
+import os
+import json
+import mmap
+import glob
+import time
+import struct
+import datetime
+import threading
+from typing import Dict, List, Any, Iterable, Optional
+
+import numpy as np
+
+from houston100_money import aum_rollup, exact_sum, cents_to_decimal
+
+SNAPSHOT_MAGIC = b"H100SNAP"
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_SUFFIX = ".h100snap"
+HEADER_STRUCT = struct.Struct("<8sHHIQQdQ")  # magic, version, reserved, reserved, generation, rows, created, meta length
+PAGE_SIZE = 4096
+COLUMN_ALIGNMENT = 64
+
+# Numeric columns and their on-disk dtypes (little-endian)
+NUMERIC_COLUMNS: Dict[str, str] = {
+    "investment_type": "<u1",
+    "total_investment_cents": "<i8",
+    "projected_irr": "<f8",
+    "kingdom_score": "<i2",
+    "biblical_alignment_score": "<i2",
+    "kingdom_roi": "<f8",
+    "recommendation_tier": "<u1",
+    "analysis_timestamp_us": "<i8",
+}
+CATEGORICAL_COLUMNS = ("investment_type", "recommendation_tier")
+
+
+def _align(offset: int, alignment: int) -> int:
+    return (offset + alignment - 1) // alignment * alignment
+
+
+def write_snapshot(directory: str, rows: Iterable[Dict[str, Any]],
+                   generation: Optional[int] = None) -> str:
+    """Write rows as a new snapshot generation and return its path
+
+    Each row needs ``investment_id`` plus every key in NUMERIC_COLUMNS, with
+    ``investment_type``/``recommendation_tier`` as labels and
+    ``analysis_timestamp`` as an ISO string instead of microseconds.
+    """
+    os.makedirs(directory, exist_ok=True)
+    generation = generation if generation is not None else time.time_ns()
+
+    ids: List[bytes] = []
+    values: Dict[str, list] = {name: [] for name in NUMERIC_COLUMNS}
+    categories: Dict[str, Dict[str, int]] = {name: {} for name in CATEGORICAL_COLUMNS}
+
+    for row in rows:
+        ids.append(str(row["investment_id"]).encode("utf-8"))
+        for name in NUMERIC_COLUMNS:
+            if name in categories:
+                labels = categories[name]
+                values[name].append(labels.setdefault(row[name], len(labels)))
+            elif name == "analysis_timestamp_us":
+                timestamp = datetime.datetime.fromisoformat(row["analysis_timestamp"]).timestamp()
+                values[name].append(int(timestamp * 1_000_000))
+            else:
+                values[name].append(row[name])
+
+    arrays = {name: np.asarray(column, dtype=NUMERIC_COLUMNS[name]) for name, column in values.items()}
+    arrays["id_offsets"] = np.cumsum([0] + [len(item) for item in ids], dtype="<i8")
+    arrays["id_bytes"] = np.frombuffer(b"".join(ids), dtype="<u1")
+
+    # Lay out columns after a page-aligned metadata block
+    data_start = PAGE_SIZE
+    while True:
+        directory_entries, offset = [], data_start
+        for name, array in arrays.items():
+            offset = _align(offset, COLUMN_ALIGNMENT)
+            directory_entries.append({
+                "name": name, "dtype": array.dtype.str, "offset": offset, "count": int(array.size)
+            })
+            offset += array.nbytes
+        metadata = json.dumps({
+            "columns": directory_entries,
+            "categories": {name: list(labels) for name, labels in categories.items()}
+        }).encode("utf-8")
+        if HEADER_STRUCT.size + len(metadata) <= data_start:
+            break
+        data_start += PAGE_SIZE
+
+    header = HEADER_STRUCT.pack(
+        SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, 0, 0, generation,
+        len(ids), time.time(), len(metadata)
+    )
+
+    final_path = os.path.join(directory, f"portfolio-{generation:020d}{SNAPSHOT_SUFFIX}")
+    temp_path = f"{final_path}.tmp"
+    with open(temp_path, "wb") as snapshot_file:
+        snapshot_file.write(header)
+        snapshot_file.write(metadata)
+        for entry in directory_entries:
+            snapshot_file.seek(entry["offset"])
+            snapshot_file.write(arrays[entry["name"]].tobytes())
+        snapshot_file.truncate(offset)  # Cover trailing empty columns
+        snapshot_file.flush()
+        os.fsync(snapshot_file.fileno())
+    os.replace(temp_path, final_path)
+    return final_path
+
+
+def latest_snapshot_path(directory: str) -> Optional[str]:
+    """Path of the newest snapshot generation in a directory"""
+    paths = glob.glob(os.path.join(directory, f"portfolio-*{SNAPSHOT_SUFFIX}"))
+    return max(paths) if paths else None
+
+
+def prune_snapshots(directory: str, keep: int = 3) -> List[str]:
+    """Delete all but the newest ``keep`` snapshots; mapped readers are unaffected on POSIX"""
+    paths = sorted(glob.glob(os.path.join(directory, f"portfolio-*{SNAPSHOT_SUFFIX}")))
+    stale = paths[:-keep] if keep else paths
+    for path in stale:
+        os.remove(path)
+    return stale
+
+
+class PortfolioSnapshot:
+    """A memory-mapped snapshot whose columns are zero-copy NumPy views"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as snapshot_file:
+            self._mmap = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, format_version, _, _, self.generation, self.row_count,
+         self.created_at, metadata_length) = HEADER_STRUCT.unpack_from(self._mmap, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"Not a portfolio snapshot: {path}")
+        if format_version != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot format version {format_version}: {path}")
+
+        metadata = json.loads(self._mmap[HEADER_STRUCT.size:HEADER_STRUCT.size + metadata_length])
+        self.categories: Dict[str, List[str]] = metadata["categories"]
+        self.columns: Dict[str, np.ndarray] = {
+            entry["name"]: np.frombuffer(
+                self._mmap, dtype=np.dtype(entry["dtype"]), count=entry["count"], offset=entry["offset"]
+            )
+            for entry in metadata["columns"]
+        }
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+
+    def investment_id(self, row: int) -> str:
+        offsets = self.columns["id_offsets"]
+        return self.columns["id_bytes"][offsets[row]:offsets[row + 1]].tobytes().decode("utf-8")
+
+    def category_code(self, column: str, label: str) -> int:
+        """Code of a categorical label, or -1 when absent from this snapshot"""
+        labels = self.categories[column]
+        return labels.index(label) if label in labels else -1
+
+    def portfolio_breakdown(self) -> Dict[str, Dict[str, Any]]:
+        """Per investment type allocation, returns and Kingdom score"""
+        type_codes = self.columns["investment_type"]
+        labels = self.categories["investment_type"]
+        counts = np.bincount(type_codes, minlength=len(labels))
+        rollup = aum_rollup(type_codes, self.columns["total_investment_cents"], labels)["groups"]
+        irr_sums = np.bincount(type_codes, weights=self.columns["projected_irr"], minlength=len(labels))
+        score_sums = np.bincount(type_codes, weights=self.columns["kingdom_score"], minlength=len(labels))
+
+        breakdown = {}
+        for code, label in enumerate(labels):
+            if not counts[code]:
+                continue
+            breakdown[label] = {
+                "allocation_percentage": rollup[label]["allocation_basis_points"] / 100,
+                "average_returns": round(float(irr_sums[code] / counts[code]), 2),
+                "average_kingdom_score": round(float(score_sums[code] / counts[code]), 1),
+                "total_investment": float(rollup[label]["total"].to_decimal()),
+                "investments": int(counts[code])
+            }
+        return breakdown
+
+    def summary(self) -> Dict[str, Any]:
+        """Portfolio-wide totals and averages"""
+        cents = self.columns["total_investment_cents"]
+        if not self.row_count:
+            return {"total_aum": 0.0, "investments": 0}
+        return {
+            "total_aum": float(cents_to_decimal(exact_sum(cents))),
+            "investments": self.row_count,
+            "average_returns": round(float(np.average(self.columns["projected_irr"], weights=cents)), 2)
+            if cents.any() else 0.0,
+            "average_kingdom_score": round(float(self.columns["kingdom_score"].mean()), 1),
+            "snapshot_generation": self.generation,
+            "snapshot_created_at": datetime.datetime.fromtimestamp(self.created_at).isoformat()
+        }
+
+
+class SnapshotReader:
+    """Tracks the newest snapshot in a directory and reloads it when a newer one appears"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.snapshot: Optional[PortfolioSnapshot] = None
+        self._lock = threading.Lock()
+
+    def reload_if_newer(self) -> Optional[PortfolioSnapshot]:
+        """Map the latest snapshot if its generation is newer than the current one"""
+        path = latest_snapshot_path(self.directory)
+        with self._lock:
+            if path and (self.snapshot is None or path != self.snapshot.path):
+                candidate = PortfolioSnapshot(path)
+                if self.snapshot is None or candidate.generation > self.snapshot.generation:
+                    # Old arrays stay valid until their last reference is dropped
+                    self.snapshot = candidate
+            return self.snapshot
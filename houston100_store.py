@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Houston 100 Faith AI Assistant - Investment Store
+
+Embedded SQLite persistence for InvestmentData and analyze_investment output:
+- Indexed by investment type, Kingdom score, recommendation tier and timestamp
+- Batched, transaction-wrapped bulk upserts
+- Indexed top-deal queries for the agent tools
+"""
+
+import json
+import sqlite3
+import datetime
+import threading
+from decimal import ROUND_HALF_EVEN
+from typing import Dict, List, Any, Iterable, Iterator, Optional, TYPE_CHECKING
+
+from houston100_money import decimal_to_cents
+
+if TYPE_CHECKING:
+    from houston100_agent import InvestmentData
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS investments (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    investment_type TEXT NOT NULL,
+    total_investment_cents INTEGER NOT NULL,
+    projected_irr REAL NOT NULL,
+    investment_timeline TEXT,
+    kingdom_scores TEXT,
+    community_impact TEXT,
+    financial_metrics TEXT,
+    biblical_alignment TEXT,
+    updated_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS analyses (
+    investment_id TEXT PRIMARY KEY,
+    investment_name TEXT,
+    investment_type TEXT NOT NULL,
+    kingdom_score INTEGER NOT NULL,
+    biblical_alignment_score INTEGER,
+    projected_irr REAL,
+    kingdom_roi REAL,
+    recommendation TEXT,
+    recommendation_tier TEXT,
+    analysis_timestamp TEXT NOT NULL,
+    analysis_json TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_investments_type ON investments (investment_type);
+CREATE INDEX IF NOT EXISTS idx_analyses_type_score ON analyses (investment_type, kingdom_score DESC);
+CREATE INDEX IF NOT EXISTS idx_analyses_score ON analyses (kingdom_score DESC);
+CREATE INDEX IF NOT EXISTS idx_analyses_tier_score ON analyses (recommendation_tier, kingdom_score DESC);
+CREATE INDEX IF NOT EXISTS idx_analyses_timestamp ON analyses (analysis_timestamp);
+"""
+
+UPSERT_INVESTMENT_SQL = """
+INSERT INTO investments (
+    id, name, investment_type, total_investment_cents, projected_irr, investment_timeline,
+    kingdom_scores, community_impact, financial_metrics, biblical_alignment, updated_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    name = excluded.name,
+    investment_type = excluded.investment_type,
+    total_investment_cents = excluded.total_investment_cents,
+    projected_irr = excluded.projected_irr,
+    investment_timeline = excluded.investment_timeline,
+    kingdom_scores = excluded.kingdom_scores,
+    community_impact = excluded.community_impact,
+    financial_metrics = excluded.financial_metrics,
+    biblical_alignment = excluded.biblical_alignment,
+    updated_at = excluded.updated_at
+"""
+
+UPSERT_ANALYSIS_SQL = """
+INSERT INTO analyses (
+    investment_id, investment_name, investment_type, kingdom_score, biblical_alignment_score,
+    projected_irr, kingdom_roi, recommendation, recommendation_tier, analysis_timestamp, analysis_json
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (investment_id) DO UPDATE SET
+    investment_name = excluded.investment_name,
+    investment_type = excluded.investment_type,
+    kingdom_score = excluded.kingdom_score,
+    biblical_alignment_score = excluded.biblical_alignment_score,
+    projected_irr = excluded.projected_irr,
+    kingdom_roi = excluded.kingdom_roi,
+    recommendation = excluded.recommendation,
+    recommendation_tier = excluded.recommendation_tier,
+    analysis_timestamp = excluded.analysis_timestamp,
+    analysis_json = excluded.analysis_json
+"""
+
+SUMMARY_COLUMNS = (
+    "investment_id, investment_name, investment_type, kingdom_score, biblical_alignment_score, "
+    "projected_irr, kingdom_roi, recommendation, recommendation_tier, analysis_timestamp"
+)
+
+
+def recommendation_tier(recommendation: str) -> str:
+    """Tier label of a recommendation, e.g. "STRONG BUY" from "STRONG BUY - ..." """
+    return recommendation.split(" - ", 1)[0].strip().upper()
+
+
+class InvestmentStore:
+    """SQLite-backed store for investments and their latest analysis"""
+
+    def __init__(self, path: str = ":memory:", batch_size: int = 1000):
+        self.path = path
+        self.batch_size = batch_size
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+
+    def _bulk_execute(self, sql: str, rows: Iterable[tuple]) -> int:
+        """Run executemany in batches, one transaction per batch"""
+        written = 0
+        batch: List[tuple] = []
+        with self._lock:
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    with self._connection:
+                        self._connection.executemany(sql, batch)
+                    written += len(batch)
+                    batch = []
+            if batch:
+                with self._connection:
+                    self._connection.executemany(sql, batch)
+                written += len(batch)
+        return written
+
+    def upsert_investments(self, investments: Iterable["InvestmentData"]) -> int:
+        """Bulk upsert InvestmentData records"""
+        now = datetime.datetime.now().isoformat()
+        return self._bulk_execute(UPSERT_INVESTMENT_SQL, (
+            (
+                investment.id,
+                investment.name,
+                investment.investment_type.value,
+                decimal_to_cents(investment.total_investment, ROUND_HALF_EVEN),
+                float(investment.projected_irr),
+                investment.investment_timeline,
+                json.dumps(investment.kingdom_scores),
+                json.dumps(investment.community_impact, default=str),
+                json.dumps(investment.financial_metrics, default=str),
+                json.dumps(investment.biblical_alignment, default=str),
+                now
+            )
+            for investment in investments
+        ))
+
+    def upsert_analyses(self, analyses: Iterable[Dict[str, Any]]) -> int:
+        """Bulk upsert analyze_investment results, skipping error responses"""
+        return self._bulk_execute(UPSERT_ANALYSIS_SQL, (
+            (
+                analysis["investment_id"],
+                analysis.get("investment_name"),
+                analysis["investment_type"],
+                analysis["kingdom_impact_score"]["overall_score"],
+                analysis["biblical_assessment"]["overall_biblical_alignment_score"],
+                analysis["financial_analysis"]["projected_irr"],
+                analysis["kingdom_roi_projection"]["kingdom_roi"],
+                analysis["recommendation"],
+                recommendation_tier(analysis["recommendation"]),
+                analysis["analysis_timestamp"],
+                json.dumps(analysis, default=str)
+            )
+            for analysis in analyses
+            if analysis.get("status") != "error"
+        ))
+
+    def save_analysis(self, investment: "InvestmentData", analysis: Dict[str, Any]) -> None:
+        """Persist one investment and its analysis"""
+        self.upsert_investments([investment])
+        self.upsert_analyses([analysis])
+
+    def top_deals(self, investment_type: Optional[str] = None, min_kingdom_score: Optional[int] = None,
+                  recommendation_tier: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """Highest Kingdom-score analyses matching the filters (index range scan)"""
+        conditions, params = [], []
+        if investment_type:
+            conditions.append("investment_type = ?")
+            params.append(investment_type)
+        if recommendation_tier:
+            conditions.append("recommendation_tier = ?")
+            params.append(recommendation_tier.upper())
+        if min_kingdom_score is not None:
+            conditions.append("kingdom_score >= ?")
+            params.append(min_kingdom_score)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        sql = f"SELECT {SUMMARY_COLUMNS} FROM analyses {where} ORDER BY kingdom_score DESC LIMIT ?"
+        with self._lock:
+            rows = self._connection.execute(sql, (*params, limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def _iter_pages(self, sql: str, key: str, fetch_size: int) -> Iterator[sqlite3.Row]:
+        """Keyset-paginate ``sql`` on the unique ``key`` column, one page per lock hold
+
+        The lock is released before any row is yielded, so a slow consumer never
+        blocks writers or other readers. Pages are separate reads: rows upserted
+        mid-iteration may or may not be seen, but none is yielded twice.
+        """
+        last_key = None
+        while True:
+            with self._lock:
+                if last_key is None:
+                    rows = self._connection.execute(
+                        f"{sql} ORDER BY {key} LIMIT ?", (fetch_size,)
+                    ).fetchall()
+                else:
+                    rows = self._connection.execute(
+                        f"{sql} WHERE {key} > ? ORDER BY {key} LIMIT ?", (last_key, fetch_size)
+                    ).fetchall()
+            if not rows:
+                return
+            last_key = rows[-1][0]
+            yield from rows
+            if len(rows) < fetch_size:
+                return
+
+    def iter_snapshot_rows(self, fetch_size: int = 10000) -> Iterator[Dict[str, Any]]:
+        """Stream the flat portfolio rows used for columnar snapshots"""
+        sql = """
+            SELECT a.investment_id, a.investment_type, i.total_investment_cents, a.projected_irr,
+                   a.kingdom_score, a.biblical_alignment_score, a.kingdom_roi,
+                   a.recommendation_tier, a.analysis_timestamp
+            FROM analyses a JOIN investments i ON i.id = a.investment_id
+        """
+        for row in self._iter_pages(sql, "a.investment_id", fetch_size):
+            yield dict(row)
+
+    def iter_deal_summaries(self, fetch_size: int = 10000) -> Iterator[Dict[str, Any]]:
+        """Stream flat summary rows of every analyzed deal for screening"""
+        sql = f"""
+            SELECT {', '.join(f'a.{column.strip()}' for column in SUMMARY_COLUMNS.split(','))},
+                   i.total_investment_cents
+            FROM analyses a LEFT JOIN investments i ON i.id = a.investment_id
+        """
+        for row in self._iter_pages(sql, "a.investment_id", fetch_size):
+            yield dict(row)
+
+    def iter_analyses(self, fetch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Stream every stored analysis as a full analyze_investment result"""
+        sql = "SELECT investment_id, analysis_json FROM analyses"
+        for row in self._iter_pages(sql, "investment_id", fetch_size):
+            yield json.loads(row["analysis_json"])
+
+    def get_analysis(self, investment_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT analysis_json FROM analyses WHERE investment_id = ?", (investment_id,)
+            ).fetchone()
+        return json.loads(row["analysis_json"]) if row else None
+
+    def get_investment(self, investment_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT * FROM investments WHERE id = ?", (investment_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        investment = dict(row)
+        for column in ("kingdom_scores", "community_impact", "financial_metrics", "biblical_alignment"):
+            investment[column] = json.loads(investment[column]) if investment[column] else {}
+        return investment
+
+    def count(self, table: str = "analyses") -> int:
+        if table not in ("analyses", "investments"):
+            raise ValueError(f"Unknown table: {table}")
+        with self._lock:
+            return self._connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,759 @@
+#!/usr/bin/env python3
+"""
+Houston 100 Faith AI Assistant - Integration Sync Engine
+
+Rate-limit-aware synchronization with Airtable, Google Sheets, Ontraport,
+Beehiiv and Motion:
+- Pooled keep-alive HTTP connections per integration
+- Request batching up to each API's batch size
+- Token-bucket rate limiting per integration
+- Retries with exponential backoff and full jitter (honors Retry-After)
+- Concurrent syncs across integrations, optionally on a background schedule
+- Checkpointed delta sync with persisted per-source watermarks and
+  periodic checksum reconciliation to catch missed deletes
+- Local stand-in server for offline testing
+
+The client speaks one generic records protocol (``{"records": [...],
+"offset": ...}`` pages, ``modified_since`` / ``since_cursor`` filters and
+``{"records": [...]}`` PATCH upserts), which is what the stand-in server
+implements. The vendor APIs each shape requests and responses differently,
+so pointing an IntegrationSpec at a real provider needs an adapter (or a
+proxy) that translates to this protocol; none ship here yet.
+"""
+
+import os
+import json
+import time
+import hashlib
+import queue
+import random
+import logging
+import datetime
+import threading
+import http.client
+from collections import deque
+from dataclasses import dataclass, field, replace
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Any, Callable, Optional, Tuple
+from urllib.parse import urlsplit, urlencode, parse_qs
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class IntegrationSyncError(Exception):
+    """Raised when an integration request fails after all retries"""
+
+
+@dataclass
+class IntegrationSpec:
+    """Connection, batching and rate-limit settings for one integration"""
+    name: str
+    base_url: str
+    records_path: str
+    api_key_env: str
+    batch_size: int
+    requests_per_second: float
+    burst: int = 1
+    page_size: int = 100
+    pool_size: int = 4
+    max_retries: int = 5
+    backoff_base_seconds: float = 0.5
+    backoff_cap_seconds: float = 30.0
+    timeout_seconds: float = 30.0
+    delta_mode: str = "modified_time"  # "modified_time", "cursor" or "full"
+    modified_field: str = "modified_at"
+    watermark_overlap_seconds: float = 0.0  # Widen for sources whose clocks drift; re-reads that window
+    scheduled: bool = False  # Include in the background schedule; set once base_url speaks the records protocol
+
+
+# Published API limits: Airtable 5 req/s per base with 10-record writes,
+# Google Sheets 60 req/min per user, Ontraport 180 req/min, Motion 12 req/min.
+# Sheets rows carry no modified time, so every Sheets sync is a full diff.
+DEFAULT_INTEGRATIONS: Dict[str, IntegrationSpec] = {
+    "airtable": IntegrationSpec(
+        name="airtable", base_url="https://api.airtable.com",
+        records_path="/v0/houston100/investments", api_key_env="AIRTABLE_API_KEY",
+        batch_size=10, requests_per_second=5, burst=5, page_size=100
+    ),
+    "google_sheets": IntegrationSpec(
+        name="google_sheets", base_url="https://sheets.googleapis.com",
+        records_path="/v4/spreadsheets/houston100/values/portfolio", api_key_env="GOOGLE_SHEETS_API_KEY",
+        batch_size=500, requests_per_second=1, burst=5, page_size=1000, delta_mode="full"
+    ),
+    "ontraport": IntegrationSpec(
+        name="ontraport", base_url="https://api.ontraport.com",
+        records_path="/1/Contacts", api_key_env="ONTRAPORT_API_KEY",
+        batch_size=50, requests_per_second=3, burst=3, page_size=50
+    ),
+    "beehiiv": IntegrationSpec(
+        name="beehiiv", base_url="https://api.beehiiv.com",
+        records_path="/v2/publications/houston100/subscriptions", api_key_env="BEEHIIV_API_KEY",
+        batch_size=100, requests_per_second=2, burst=2, page_size=100, delta_mode="cursor"
+    ),
+    "motion": IntegrationSpec(
+        name="motion", base_url="https://api.usemotion.com",
+        records_path="/v1/tasks", api_key_env="MOTION_API_KEY",
+        batch_size=1, requests_per_second=0.2, burst=1, page_size=50
+    ),
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiter with utilization tracking"""
+
+    def __init__(self, rate: float, capacity: int, utilization_window_seconds: float = 60.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self.utilization_window_seconds = utilization_window_seconds
+        self._grants: deque = deque()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until tokens are available; returns seconds spent waiting"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    self._grants.append(now)
+                    return waited
+                delay = (tokens - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def penalize(self, seconds: float) -> None:
+        """Drain the bucket so callers back off after a server-side 429"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens = min(self.tokens, -seconds * self.rate)
+
+    def utilization(self) -> float:
+        """Fraction of the rate limit used over the trailing window"""
+        with self._lock:
+            cutoff = time.monotonic() - self.utilization_window_seconds
+            while self._grants and self._grants[0] < cutoff:
+                self._grants.popleft()
+            return len(self._grants) / (self.rate * self.utilization_window_seconds)
+
+
+class ConnectionPool:
+    """Pool of keep-alive HTTP(S) connections to a single host"""
+
+    def __init__(self, base_url: str, max_size: int = 4, timeout: float = 30.0):
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.timeout = timeout
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize=max_size)
+        self.connections_created = 0
+
+    def acquire(self) -> http.client.HTTPConnection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            self.connections_created += 1
+            connection_class = (
+                http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+            )
+            return connection_class(self.host, self.port, timeout=self.timeout)
+
+    def release(self, connection: http.client.HTTPConnection, reusable: bool = True) -> None:
+        if not reusable:
+            connection.close()
+            return
+        try:
+            self._idle.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class IntegrationClient:
+    """Rate-limited, pooled, retrying JSON client for one integration"""
+
+    def __init__(self, spec: IntegrationSpec):
+        self.spec = spec
+        self.pool = ConnectionPool(spec.base_url, spec.pool_size, spec.timeout_seconds)
+        self.rate_limiter = TokenBucket(spec.requests_per_second, spec.burst)
+        self.base_path = urlsplit(spec.base_url).path.rstrip("/")
+        self._random = random.Random()
+        self.requests_sent = 0
+        self.retries = 0
+
+    def request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None,
+                body: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Send a JSON request, retrying transient failures with jittered backoff"""
+        target = self.base_path + path + (f"?{urlencode(params)}" if params else "")
+        payload = json.dumps(body).encode("utf-8") if body is not None else None
+        headers = {"Accept": "application/json", "Content-Type": "application/json"}
+        api_key = os.environ.get(self.spec.api_key_env)
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+
+        last_error = ""
+        for attempt in range(self.spec.max_retries + 1):
+            if attempt:
+                self.retries += 1
+            self.rate_limiter.acquire()
+            self.requests_sent += 1
+
+            connection = self.pool.acquire()
+            retry_after = None
+            try:
+                connection.request(method, target, body=payload, headers=headers)
+                response = connection.getresponse()
+                data = response.read()
+                self.pool.release(connection, reusable=not response.will_close)
+            except (OSError, http.client.HTTPException) as e:
+                self.pool.release(connection, reusable=False)
+                last_error = f"{type(e).__name__}: {e}"
+            else:
+                if response.status < 400:
+                    return json.loads(data) if data else {}
+                last_error = f"HTTP {response.status}: {data[:200].decode('utf-8', 'replace')}"
+                if response.status not in RETRYABLE_STATUS_CODES:
+                    break
+                if response.getheader("Retry-After"):
+                    try:
+                        retry_after = float(response.getheader("Retry-After"))
+                    except ValueError:
+                        retry_after = None
+                if response.status == 429:
+                    # Drain the shared bucket; the next acquire() absorbs the wait
+                    self.rate_limiter.penalize(retry_after or self.spec.backoff_base_seconds)
+                    logger.warning("%s rate limited on %s %s", self.spec.name, method, path)
+                    continue
+
+            if attempt < self.spec.max_retries:
+                backoff = min(self.spec.backoff_cap_seconds, self.spec.backoff_base_seconds * 2 ** attempt)
+                delay = retry_after if retry_after is not None else self._random.uniform(0, backoff)
+                logger.warning("%s %s %s failed (%s); retrying in %.2fs",
+                               self.spec.name, method, path, last_error, delay)
+                time.sleep(delay)
+
+        raise IntegrationSyncError(f"{self.spec.name} {method} {path} failed: {last_error}")
+
+    def push_records(self, records: List[Dict[str, Any]]) -> int:
+        """Upsert records in API-sized batches; returns records written"""
+        written = 0
+        for start in range(0, len(records), self.spec.batch_size):
+            batch = records[start:start + self.spec.batch_size]
+            self.request("PATCH", self.spec.records_path, body={"records": batch})
+            written += len(batch)
+        return written
+
+    def pull_records(self, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Fetch all records, following offset cursors page by page"""
+        return self.pull_changes(params)[0]
+
+    def pull_changes(self, params: Optional[Dict[str, Any]] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Fetch matching records plus the change cursor reported on the first page"""
+        records = []
+        sync_cursor = None
+        query = dict(params or {}, pageSize=self.spec.page_size)
+        while True:
+            page = self.request("GET", self.spec.records_path, params=query)
+            if sync_cursor is None:
+                sync_cursor = page.get("sync_cursor")
+            records.extend(page.get("records", []))
+            if not page.get("offset"):
+                return records, sync_cursor
+            query["offset"] = page["offset"]
+
+    def close(self) -> None:
+        self.pool.close()
+
+
+def parse_timestamp(value: str) -> datetime.datetime:
+    """Parse an ISO-8601 timestamp; a trailing Z or no offset is taken as UTC"""
+    if value.endswith(("Z", "z")):
+        value = value[:-1] + "+00:00"
+    parsed = datetime.datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=datetime.timezone.utc)
+
+
+def record_checksum(record: Dict[str, Any], ignored_fields: Tuple[str, ...] = ("modified_at", "sequence")) -> str:
+    """Stable content checksum of a record, ignoring sync metadata"""
+    content = {key: value for key, value in record.items() if key not in ignored_fields}
+    return hashlib.sha1(json.dumps(content, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class SyncCheckpointStore:
+    """Per-integration watermarks and record checksums, persisted to a local JSON file"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._state: Dict[str, Dict[str, Any]] = {}
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as state_file:
+                self._state = json.load(state_file)
+
+    def get(self, integration: str) -> Dict[str, Any]:
+        with self._lock:
+            state = self._state.setdefault(integration, {
+                "watermark": None,
+                "watermark_ids": [],
+                "last_reconciled_at": None,
+                "checksums": {}
+            })
+            return {**state, "checksums": dict(state["checksums"]),
+                    "watermark_ids": list(state.get("watermark_ids", []))}
+
+    def save(self, integration: str, state: Dict[str, Any]) -> None:
+        """Replace an integration's checkpoint and atomically rewrite the file"""
+        with self._lock:
+            self._state[integration] = state
+            if not self.path:
+                return
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as state_file:
+                json.dump(self._state, state_file)
+            os.replace(temp_path, self.path)
+
+
+@dataclass
+class SyncResult:
+    """Outcome of one integration sync"""
+    integration: str
+    started_at: datetime.datetime
+    finished_at: datetime.datetime
+    success: bool
+    records_pushed: int = 0
+    records_pulled: int = 0
+    requests: int = 0
+    retries: int = 0
+    error: str = ""
+    sync_type: str = "full"  # "full", "delta" or "reconcile"
+    records_changed: int = 0
+    records_deleted: int = 0
+    watermark: Optional[str] = None
+    changed_records: List[Dict[str, Any]] = field(default_factory=list, repr=False)
+    deleted_ids: List[str] = field(default_factory=list, repr=False)
+
+    @property
+    def records_transferred(self) -> int:
+        return self.records_pushed + self.records_pulled
+
+
+class IntegrationSyncEngine:
+    """Runs integration syncs concurrently and tracks their health"""
+
+    def __init__(self, specs: Optional[Dict[str, IntegrationSpec]] = None,
+                 max_workers: int = 5, history_size: int = 100,
+                 checkpoint_path: Optional[str] = None,
+                 reconcile_interval_seconds: float = 24 * 3600):
+        self.specs = dict(DEFAULT_INTEGRATIONS if specs is None else specs)
+        self.clients = {name: IntegrationClient(spec) for name, spec in self.specs.items()}
+        self.max_workers = max_workers
+        self.history: Dict[str, deque] = {name: deque(maxlen=history_size) for name in self.specs}
+        self.last_successful_sync: Dict[str, datetime.datetime] = {}
+        self.checkpoints = SyncCheckpointStore(checkpoint_path)
+        self.reconcile_interval_seconds = reconcile_interval_seconds
+        self.listeners: List[Callable[[SyncResult], None]] = []
+        self._lock = threading.Lock()
+        self._sync_locks: Dict[str, threading.RLock] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def for_base_url(cls, base_url: str, **kwargs) -> "IntegrationSyncEngine":
+        """Point every integration at one host, e.g. the local stand-in server, and schedule them"""
+        specs = {name: replace(spec, base_url=base_url, scheduled=True) for name, spec in DEFAULT_INTEGRATIONS.items()}
+        return cls(specs, **kwargs)
+
+    def sync_integration(self, name: str, outgoing: Optional[List[Dict[str, Any]]] = None,
+                         pull: bool = True, force_reconcile: bool = False) -> SyncResult:
+        """Push outgoing records and pull remote changes for one integration
+
+        Pulls are incremental from the persisted watermark. The first sync,
+        ``delta_mode="full"`` sources and any sync past the reconciliation
+        interval pull the full record set instead and diff its checksums
+        against the local copy, which also catches deletes that a
+        modified-since query can never return.
+
+        Syncs of one integration are serialized: a second caller waits and
+        then continues from the checkpoint the first one saved, so the
+        watermark never moves backwards and no change is delivered twice.
+        """
+        with self._sync_lock(name):
+            return self._sync_integration(name, outgoing, pull, force_reconcile)
+
+    def _sync_lock(self, name: str) -> threading.RLock:
+        with self._lock:
+            return self._sync_locks.setdefault(name, threading.RLock())
+
+    def _sync_integration(self, name: str, outgoing: Optional[List[Dict[str, Any]]],
+                          pull: bool, force_reconcile: bool) -> SyncResult:
+        spec = self.specs[name]
+        client = self.clients[name]
+        requests_before, retries_before = client.requests_sent, client.retries
+        started_at = datetime.datetime.now(datetime.timezone.utc)
+        checkpoint = self.checkpoints.get(name)
+        pushed, pulled, changed, deleted_ids, error = 0, [], [], [], ""
+        sync_type = self._sync_type(spec, checkpoint, force_reconcile)
+
+        try:
+            if outgoing:
+                pushed = client.push_records(outgoing)
+            if pull:
+                pulled, sync_cursor = client.pull_changes(self._delta_params(spec, checkpoint, sync_type))
+                changed, deleted_ids = self._apply_pull(spec, checkpoint, pulled, sync_cursor, sync_type, started_at)
+                self.checkpoints.save(name, checkpoint)
+        except IntegrationSyncError as e:
+            error = str(e)
+            logger.error("Integration sync failed for %s: %s", name, e)
+        except Exception as e:
+            # Malformed payloads (bad JSON, unparseable watermarks) fail this integration only
+            error = f"{type(e).__name__}: {e}"
+            logger.exception("Unexpected error syncing %s", name)
+
+        result = SyncResult(
+            integration=name,
+            started_at=started_at,
+            finished_at=datetime.datetime.now(datetime.timezone.utc),
+            success=not error,
+            records_pushed=pushed,
+            records_pulled=len(pulled),
+            requests=client.requests_sent - requests_before,
+            retries=client.retries - retries_before,
+            error=error,
+            sync_type=sync_type if pull else "push",
+            records_changed=len(changed),
+            records_deleted=len(deleted_ids),
+            watermark=checkpoint.get("watermark"),
+            changed_records=changed,
+            deleted_ids=deleted_ids
+        )
+        self._record(result)
+        return result
+
+    def _sync_type(self, spec: IntegrationSpec, checkpoint: Dict[str, Any], force_reconcile: bool) -> str:
+        if spec.delta_mode == "full" or checkpoint["watermark"] is None:
+            return "full"
+        last_reconciled = checkpoint["last_reconciled_at"]
+        if force_reconcile or last_reconciled is None:
+            return "reconcile"
+        age = time.time() - parse_timestamp(last_reconciled).timestamp()
+        return "reconcile" if age >= self.reconcile_interval_seconds else "delta"
+
+    def _delta_params(self, spec: IntegrationSpec, checkpoint: Dict[str, Any], sync_type: str) -> Dict[str, Any]:
+        if sync_type != "delta":
+            return {}
+        if spec.delta_mode == "cursor":
+            return {"since_cursor": checkpoint["watermark"]}
+
+        # modified_since is inclusive, so records written later in the watermark's own
+        # timestamp are not missed; the ones already seen are skipped via watermark_ids
+        since = parse_timestamp(checkpoint["watermark"])
+        since -= datetime.timedelta(seconds=spec.watermark_overlap_seconds)
+        return {"modified_since": since.isoformat()}
+
+    def _apply_pull(self, spec: IntegrationSpec, checkpoint: Dict[str, Any], pulled: List[Dict[str, Any]],
+                    sync_cursor: Optional[str], sync_type: str,
+                    started_at: datetime.datetime) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Diff pulled records against local checksums and advance the watermark"""
+        checksums = checkpoint["checksums"]
+        changed = []
+        seen = set()
+        watermark = None
+        if spec.delta_mode != "cursor" and checkpoint["watermark"] is not None:
+            watermark = parse_timestamp(checkpoint["watermark"])
+        watermark_ids = set(checkpoint.get("watermark_ids", []))
+        modified_times = {}
+
+        for record in pulled:
+            record_id = str(record.get("id"))
+            seen.add(record_id)
+            if spec.delta_mode != "cursor" and record.get(spec.modified_field):
+                modified_times[record_id] = parse_timestamp(record[spec.modified_field])
+                # Same id at the same modified time is the version already applied
+                if record_id in watermark_ids and modified_times[record_id] == watermark:
+                    continue
+            checksum = record_checksum(record)
+            if checksums.get(record_id) != checksum:
+                checksums[record_id] = checksum
+                changed.append(record)
+
+        deleted_ids = []
+        if sync_type != "delta":
+            # Full pulls see every live record; anything missing was deleted
+            deleted_ids = [record_id for record_id in checksums if record_id not in seen]
+            for record_id in deleted_ids:
+                del checksums[record_id]
+            checkpoint["last_reconciled_at"] = started_at.isoformat()
+
+        if spec.delta_mode == "cursor":
+            checkpoint["watermark"] = sync_cursor or checkpoint["watermark"]
+        else:
+            newest = max(modified_times.values()) if modified_times else None
+            if newest is not None and (watermark is None or newest >= watermark):
+                # Remember which ids share the watermark time so the next inclusive query can skip them
+                tied = {record_id for record_id, modified in modified_times.items() if modified == newest}
+                checkpoint["watermark_ids"] = sorted(tied | watermark_ids if newest == watermark else tied)
+                checkpoint["watermark"] = newest.isoformat()
+            elif watermark is None:
+                checkpoint["watermark"] = started_at.isoformat()
+
+        return changed, deleted_ids
+
+    def sync_all(self, outgoing: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+                 pull: bool = True, names: Optional[List[str]] = None) -> Dict[str, SyncResult]:
+        """Sync every integration (or just ``names``) concurrently"""
+        outgoing = outgoing or {}
+        names = list(self.specs) if names is None else names
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="integration-sync") as executor:
+            futures = {
+                name: executor.submit(self.sync_integration, name, outgoing.get(name), pull)
+                for name in names
+            }
+            return {name: future.result() for name, future in futures.items()}
+
+    def scheduled_integrations(self) -> List[str]:
+        """Integrations whose specs opt in to the background schedule"""
+        return [name for name, spec in self.specs.items() if spec.scheduled]
+
+    def start(self, interval_seconds: float) -> "IntegrationSyncEngine":
+        """Sync the scheduled integrations every ``interval_seconds`` from a daemon thread
+
+        Integrations still pointing at a vendor API the client cannot speak
+        stay off the schedule, so their guaranteed failures never reach the
+        health SLOs. With none scheduled, no thread is started.
+        """
+        if self._thread is not None:
+            return self
+        if not self.scheduled_integrations():
+            logger.info("No integrations are scheduled for background sync")
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(interval_seconds,), name="integration-sync-schedule", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self, interval_seconds: float) -> None:
+        while not self._stop.wait(interval_seconds):
+            try:
+                results = self.sync_all(names=self.scheduled_integrations())
+            except Exception as e:
+                logger.error("Scheduled integration sync failed: %s", e)
+                continue
+            failed = sorted(name for name, result in results.items() if not result.success)
+            if failed:
+                logger.warning("Scheduled integration sync: %d of %d failed (%s)",
+                               len(failed), len(results), ", ".join(failed))
+
+    def add_listener(self, listener: Callable[[SyncResult], None]) -> None:
+        """Register a callback invoked with every completed sync"""
+        self.listeners.append(listener)
+
+    def _record(self, result: SyncResult) -> None:
+        with self._lock:
+            self.history[result.integration].append(result)
+            if result.success:
+                self.last_successful_sync[result.integration] = result.finished_at
+        for listener in self.listeners:
+            try:
+                listener(result)
+            except Exception as e:
+                logger.error("Sync listener failed for %s: %s", result.integration, e)
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Per-integration health derived from recent sync results"""
+        report = {}
+        with self._lock:
+            now = datetime.datetime.now(datetime.timezone.utc)
+            for name, results in self.history.items():
+                if not results:
+                    continue
+                successes = [result for result in results if result.success]
+                last_success = self.last_successful_sync.get(name)
+                report[name] = {
+                    "status": "Connected" if results[-1].success else "Degraded",
+                    "sync_success_rate": round(len(successes) / len(results) * 100, 1),
+                    "last_successful_sync": last_success.isoformat() if last_success else None,
+                    "syncs_tracked": len(results),
+                    "last_error": results[-1].error or None,
+                    "api_rate_limit_utilization": round(self.clients[name].rate_limiter.utilization() * 100, 1),
+                    "delta_mode": self.specs[name].delta_mode,
+                    "last_sync_type": results[-1].sync_type,
+                    "records_transferred_last_sync": results[-1].records_transferred,
+                    "average_records_transferred": round(
+                        sum(result.records_transferred for result in results) / len(results), 1
+                    ),
+                    "records_changed_last_sync": results[-1].records_changed,
+                    "records_deleted_last_sync": results[-1].records_deleted,
+                    # Data is current as of the start of the last successful sync
+                    "sync_lag_seconds": round((now - successes[-1].started_at).total_seconds(), 1)
+                    if successes else None,
+                    "watermark": results[-1].watermark
+                }
+        return report
+
+    def close(self) -> None:
+        self.stop()
+        for client in self.clients.values():
+            client.close()
+
+
+class StandInIntegrationServer:
+    """Local HTTP stand-in that speaks the engine's records protocol
+
+    GET returns pages of ``{"records": [...], "offset": "..."}`` filtered by
+    an inclusive ``modified_since`` or a ``since_cursor`` sequence; PATCH
+    upserts ``{"records": [...]}`` by id. Optional failure injection returns
+    503s and per-second rate limiting returns 429 with Retry-After.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, max_batch_size: int = 500,
+                 failure_rate: float = 0.0, requests_per_second: Optional[float] = None, seed: int = 100):
+        self.records: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.sequence = 0
+        self.max_batch_size = max_batch_size
+        self.failure_rate = failure_rate
+        self.requests_per_second = requests_per_second
+        self.request_log: List[Tuple[str, str]] = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._window: deque = deque()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandInIntegrationServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _admit(self) -> Optional[int]:
+        """Return an error status to inject, if any"""
+        with self._lock:
+            if self.requests_per_second:
+                now = time.monotonic()
+                while self._window and self._window[0] < now - 1.0:
+                    self._window.popleft()
+                if len(self._window) >= self.requests_per_second:
+                    return 429
+                self._window.append(now)
+            if self.failure_rate and self._random.random() < self.failure_rate:
+                return 503
+        return None
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _route(self, method: str):
+                parts = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else {}
+                server.request_log.append((method, parts.path))
+
+                injected = server._admit()
+                if injected == 429:
+                    return self._send(429, {"error": "rate limited"}, {"Retry-After": "1"})
+                if injected:
+                    return self._send(injected, {"error": "unavailable"})
+
+                with server._lock:
+                    table = server.records.setdefault(parts.path, {})
+                    if method == "GET":
+                        return self._send(200, server._page(table, parse_qs(parts.query)))
+                    return self._send(*server._upsert(table, body.get("records", [])))
+
+            def do_GET(self):
+                self._route("GET")
+
+            def do_PATCH(self):
+                self._route("PATCH")
+
+            def do_POST(self):
+                self._route("POST")
+
+        return Handler
+
+    def delete_records(self, path: str, record_ids: List[str]) -> None:
+        """Delete records server-side; deletes never show up in delta queries"""
+        with self._lock:
+            table = self.records.setdefault(path, {})
+            for record_id in record_ids:
+                table.pop(str(record_id), None)
+
+    def _page(self, table: Dict[str, Dict[str, Any]], query: Dict[str, List[str]]) -> Dict[str, Any]:
+        offset = int(query.get("offset", ["0"])[0])
+        page_size = int(query.get("pageSize", ["100"])[0])
+        modified_since = query.get("modified_since", [None])[0]
+        if modified_since is not None:
+            modified_since = parse_timestamp(modified_since)
+        since_cursor = query.get("since_cursor", [None])[0]
+
+        ordered = [
+            record_id for record_id in sorted(table)
+            if (modified_since is None or parse_timestamp(table[record_id]["modified_at"]) >= modified_since)
+            and (since_cursor is None or table[record_id]["sequence"] > int(since_cursor))
+        ]
+        page = [table[record_id] for record_id in ordered[offset:offset + page_size]]
+        payload: Dict[str, Any] = {"records": page, "sync_cursor": str(self.sequence)}
+        if offset + page_size < len(ordered):
+            payload["offset"] = str(offset + page_size)
+        return payload
+
+    def _upsert(self, table: Dict[str, Dict[str, Any]], records: List[Dict[str, Any]]) -> Tuple[int, Dict[str, Any]]:
+        if len(records) > self.max_batch_size:
+            return 422, {"error": f"batch exceeds {self.max_batch_size} records"}
+        now = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        for record in records:
+            self.sequence += 1
+            table[str(record["id"])] = dict(record, modified_at=now, sequence=self.sequence)
+        return 200, {"records": records}
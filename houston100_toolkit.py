@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Houston 100 Faith AI Assistant - Griptape Toolkit Bridge
+
+Exposes the custom Houston 100 tool functions to the Griptape agent as one
+tool whose activities dispatch through the shared ToolCallExecutor:
+- One activity per function, described by its docstring and with an input
+  schema built from its signature and the docstring's Args section
+- Griptape's ActionsSubtask already runs the actions of a step on parallel
+  threads; each activity submits its call to the executor, so agent calls
+  get the same timeouts, single-flight coalescing, profiling and result
+  listeners (health SLOs, anomaly detectors) as direct executor batches
+
+A step that asks for three slow tools therefore takes about as long as the
+slowest of them, and a tool that overruns its timeout comes back to the
+model as an error instead of stalling the step.
+"""
+
+import inspect
+import typing
+from typing import Dict, List, Any, Callable, Optional, Tuple
+
+from attrs import define, field
+from schema import Literal, Optional as OptionalKey, Or, Schema
+from griptape.artifacts import BaseArtifact, ErrorArtifact, TextArtifact
+from griptape.tools import BaseTool
+from griptape.utils.decorators import activity
+
+from houston100_tools import ToolCall, ToolCallExecutor
+
+DEFAULT_TOOLKIT_NAME = "Houston100Tools"
+
+
+def _parse_docstring(function: Callable) -> Tuple[str, Dict[str, str]]:
+    """Summary text and per-argument descriptions from a Google-style docstring"""
+    summary: List[str] = []
+    arguments: Dict[str, str] = {}
+    section = "summary"
+    for line in inspect.getdoc(function).splitlines() if function.__doc__ else []:
+        stripped = line.strip()
+        if stripped in ("Args:", "Returns:"):
+            section = stripped[:-1].lower()
+        elif section == "summary" and stripped:
+            summary.append(stripped)
+        elif section == "args" and ":" in stripped:
+            name, description = stripped.split(":", 1)
+            arguments[name.strip()] = description.strip()
+    return " ".join(summary) or function.__name__, arguments
+
+
+def _schema_type(annotation: Any) -> Any:
+    """schema-library type for a parameter annotation; unannotated parameters accept anything"""
+    if typing.get_origin(annotation) is typing.Union:
+        members = [member for member in typing.get_args(annotation) if member is not type(None)]
+        return Or(*(_schema_type(member) for member in members), None)
+    if annotation is float:
+        return Or(int, float)
+    if annotation in (str, int, bool, dict, list):
+        return annotation
+    return object
+
+
+def _input_schema(function: Callable, descriptions: Dict[str, str]) -> Optional[Schema]:
+    """Activity input schema from the function signature; None for functions without parameters"""
+    parameters = inspect.signature(function).parameters.values()
+    keys = {}
+    for parameter in parameters:
+        key = Literal(parameter.name, description=descriptions.get(parameter.name, parameter.name))
+        if parameter.default is not inspect.Parameter.empty:
+            key = OptionalKey(key)
+        keys[key] = _schema_type(parameter.annotation)
+    return Schema(keys) if keys else None
+
+
+def _make_activity(tool_name: str, function: Callable) -> Callable:
+    description, arguments = _parse_docstring(function)
+
+    config = {"name": tool_name, "description": description}
+    input_schema = _input_schema(function, arguments)
+    if input_schema is not None:
+        config["schema"] = input_schema
+
+    @activity(config=config)
+    def run_tool(self, values: dict) -> BaseArtifact:
+        return self.run_call(tool_name, values or {})
+
+    run_tool.__name__ = tool_name
+    return run_tool
+
+
+@define
+class ExecutorToolkit(BaseTool):
+    """Griptape tool whose activities run the executor's tools
+
+    Build instances with build_executor_toolkit(), which adds one activity
+    per executor tool.
+    """
+    executor: ToolCallExecutor = field(kw_only=True)
+    install_dependencies_on_init: bool = field(default=False, kw_only=True)
+
+    def run_call(self, tool_name: str, values: Dict[str, Any]) -> BaseArtifact:
+        """Submit one activity call to the executor and convert its result to an artifact"""
+        result = self.executor.execute([ToolCall(tool_name, dict(values))])[0]
+        if result.ok:
+            return TextArtifact(result.output)
+        return ErrorArtifact(result.output)
+
+
+def build_executor_toolkit(executor: ToolCallExecutor, name: str = DEFAULT_TOOLKIT_NAME,
+                           **kwargs) -> ExecutorToolkit:
+    """Griptape tool with an activity for every tool registered on ``executor``"""
+    namespace = {
+        tool_name: _make_activity(tool_name, function)
+        for tool_name, function in executor.tools.items()
+    }
+    namespace["__module__"] = __name__
+    toolkit_class = type(name, (ExecutorToolkit,), namespace)
+    return toolkit_class(executor=executor, name=name, **kwargs)
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Houston 100 Faith AI Assistant - Concurrent Tool Execution
+
+Runs the independent tool calls of one agent step side by side:
+- A bounded, shared thread pool so a busy server never spawns unbounded threads
+- Per-tool timeouts; a call that overruns returns an error result instead of
+  holding up the whole step
+- Results come back in the order the calls were planned
+- Single-flight coalescing: concurrent identical calls (same tool, same
+  normalized arguments) from any session share one execution and result
+
+A multi-tool turn (health, portfolio and Kingdom impact for a leadership
+briefing) then costs about as much as its slowest tool. Python cannot
+interrupt a running thread, so a timed-out call keeps its worker until it
+returns; its result is discarded.
+"""
+
+import json
+import time
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass, field
+from concurrent.futures import Executor, ThreadPoolExecutor, Future, TimeoutError as FutureTimeoutError
+from typing import Dict, List, Any, Callable, Optional
+
+from houston100_tracing import propagate
+from houston100_profiling import RequestProfiler
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_TIMEOUT_SECONDS = 30.0
+
+
+@dataclass
+class ToolCall:
+    """One tool invocation planned by the agent"""
+    tool_name: str
+    arguments: Dict[str, Any] = field(default_factory=dict)
+    profile: Optional[bool] = None  # Request flag; None defers to the profiler's configured selection
+
+
+@dataclass
+class ToolCallResult:
+    """Outcome of a tool call; status is "ok", "error" or "timeout" """
+    call: ToolCall
+    output: str
+    status: str
+    duration_ms: float
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+
+def _normalize_argument(value: Any) -> Any:
+    # JSON payloads (e.g. investment_data) compare by content, not formatting
+    if isinstance(value, str) and value.lstrip()[:1] in ("{", "["):
+        try:
+            return json.loads(value)
+        except ValueError:
+            pass
+    return value
+
+
+def call_key(tool_name: str, arguments: Dict[str, Any]) -> str:
+    """Coalescing key: tool name plus canonical JSON of the normalized arguments"""
+    normalized = {name: _normalize_argument(value) for name, value in arguments.items()}
+    return f"{tool_name}:{json.dumps(normalized, sort_keys=True, default=str)}"
+
+
+class SingleFlight:
+    """Shares one execution among concurrent callers with the same key
+
+    Thread callers use do(); asyncio callers use do_async(). Both wait on the
+    same in-flight future, so a coroutine can join a call a thread started
+    and vice versa. Results are not cached once the call completes.
+
+    The shared future is marked running as soon as it is created, so no
+    waiter can cancel it: a cancelled coroutine (leader or follower) stops
+    waiting while the execution carries on for everyone else.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    def _join_or_lead(self, key: str) -> tuple:
+        with self._lock:
+            self.calls += 1
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = self._in_flight[key] = Future()
+            future.set_running_or_notify_cancel()
+            self.executions += 1
+            return future, True
+
+    def _finish(self, key: str, future: Future, value: Any = None,
+                error: Optional[BaseException] = None) -> None:
+        # Drop the key before publishing so later callers start a fresh execution
+        with self._lock:
+            self._in_flight.pop(key, None)
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(value)
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        future, leader = self._join_or_lead(key)
+        if not leader:
+            return future.result()
+        try:
+            value = fn()
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, value)
+        return value
+
+    async def do_async(self, key: str, fn: Callable[[], Any], executor: Optional[Executor] = None) -> Any:
+        """Await ``fn``: a coroutine function as a task, a plain function on ``executor``"""
+        future, leader = self._join_or_lead(key)
+        if leader:
+            if asyncio.iscoroutinefunction(fn):
+                work = asyncio.ensure_future(fn())
+            else:
+                work = asyncio.get_running_loop().run_in_executor(executor, propagate(fn))
+            # The work publishes its own outcome, so cancelling the leader cannot strand the followers
+            work.add_done_callback(lambda done: self._finish_from(key, future, done))
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    def _finish_from(self, key: str, future: Future, done: asyncio.Future) -> None:
+        if done.cancelled():
+            self._finish(key, future, error=asyncio.CancelledError())
+        elif done.exception() is not None:
+            self._finish(key, future, error=done.exception())
+        else:
+            self._finish(key, future, done.result())
+
+    def reset_metrics(self) -> None:
+        with self._lock:
+            self.calls = self.executions = self.coalesced = 0
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._in_flight),
+                "coalesced_percentage": round(self.coalesced / self.calls * 100, 2) if self.calls else 0.0
+            }
+
+
+class ToolCallExecutor:
+    """Executes batches of tool calls concurrently with per-tool timeouts"""
+
+    def __init__(self, tools: Dict[str, Callable[..., str]], max_workers: int = DEFAULT_MAX_WORKERS,
+                 default_timeout: float = DEFAULT_TIMEOUT_SECONDS,
+                 timeouts: Optional[Dict[str, float]] = None, coalesce: bool = True,
+                 profiler: Optional[RequestProfiler] = None):
+        self.tools = dict(tools)
+        self.max_workers = max_workers
+        self.default_timeout = default_timeout
+        self.timeouts = dict(timeouts or {})
+        self.single_flight = SingleFlight() if coalesce else None
+        self.profiler = profiler
+        self.listeners: List[Callable[[ToolCallResult], None]] = []
+        self.logger = logging.getLogger(__name__)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="tool-call")
+            return self._pool
+
+    def add_listener(self, listener: Callable[[ToolCallResult], None]) -> None:
+        """Register a callback invoked with every tool call result"""
+        self.listeners.append(listener)
+
+    def _notify_listeners(self, results: List[ToolCallResult]) -> None:
+        for listener in self.listeners:
+            for result in results:
+                try:
+                    listener(result)
+                except Exception as e:
+                    self.logger.error("Tool result listener failed: %s", e)
+
+    def timeout_for(self, tool_name: str) -> float:
+        return self.timeouts.get(tool_name, self.default_timeout)
+
+    def _call_tool(self, call: ToolCall) -> str:
+        """Run one tool, under the request profiler when the call is selected"""
+        tool = self.tools[call.tool_name]
+        if self.profiler is not None and self.profiler.wanted(call.tool_name, call.profile):
+            with self.profiler.profile(call.tool_name):
+                return tool(**call.arguments)
+        return tool(**call.arguments)
+
+    def _run(self, call: ToolCall) -> str:
+        if self.single_flight is None:
+            return self._call_tool(call)
+        return self.single_flight.do(call_key(call.tool_name, call.arguments), lambda: self._call_tool(call))
+
+    def _invoke(self, call: ToolCall) -> ToolCallResult:
+        started = time.perf_counter()
+        if call.tool_name not in self.tools:
+            output, status = f"Error: unknown tool {call.tool_name}", "error"
+        else:
+            try:
+                output = self._run(call)
+                # Custom tools report their own failures as "Error ..." strings
+                status = "error" if isinstance(output, str) and output.startswith("Error") else "ok"
+            except Exception as e:
+                self.logger.error("Error running tool %s: %s", call.tool_name, e)
+                output, status = f"Error running {call.tool_name}: {str(e)}", "error"
+        return ToolCallResult(call, output, status, (time.perf_counter() - started) * 1000)
+
+    def execute(self, calls: List[ToolCall]) -> List[ToolCallResult]:
+        """Run calls concurrently and return their results in call order"""
+        if not calls:
+            return []
+
+        executor = self._executor()
+        submitted = time.perf_counter()
+        futures: List[Future] = [executor.submit(propagate(self._invoke), call) for call in calls]
+
+        results = []
+        for call, future in zip(calls, futures):
+            timeout = self.timeout_for(call.tool_name)
+            remaining = max(0.0, submitted + timeout - time.perf_counter())
+            try:
+                results.append(future.result(timeout=remaining))
+            except FutureTimeoutError:
+                future.cancel()
+                self.logger.warning("Tool %s timed out after %gs", call.tool_name, timeout)
+                results.append(ToolCallResult(
+                    call,
+                    f"Error: {call.tool_name} timed out after {timeout:g} seconds",
+                    "timeout",
+                    (time.perf_counter() - submitted) * 1000
+                ))
+        self._notify_listeners(results)
+        return results
+
+    async def execute_async(self, calls: List[ToolCall]) -> List[ToolCallResult]:
+        """Asyncio counterpart of execute(): concurrent, timed out per tool, in call order"""
+        executor = self._executor()
+
+        async def invoke(call: ToolCall) -> ToolCallResult:
+            started = time.perf_counter()
+            if call.tool_name not in self.tools:
+                return ToolCallResult(call, f"Error: unknown tool {call.tool_name}", "error", 0.0)
+            timeout = self.timeout_for(call.tool_name)
+            try:
+                if self.single_flight is None:
+                    pending = asyncio.get_running_loop().run_in_executor(
+                        executor, propagate(lambda: self._call_tool(call))
+                    )
+                else:
+                    pending = self.single_flight.do_async(
+                        call_key(call.tool_name, call.arguments), lambda: self._call_tool(call), executor
+                    )
+                # shield() keeps a timed-out shared execution alive for the other waiters
+                output = await asyncio.wait_for(asyncio.shield(pending), timeout)
+                status = "error" if isinstance(output, str) and output.startswith("Error") else "ok"
+            except asyncio.TimeoutError:
+                self.logger.warning("Tool %s timed out after %gs", call.tool_name, timeout)
+                output, status = f"Error: {call.tool_name} timed out after {timeout:g} seconds", "timeout"
+            except Exception as e:
+                self.logger.error("Error running tool %s: %s", call.tool_name, e)
+                output, status = f"Error running {call.tool_name}: {str(e)}", "error"
+            return ToolCallResult(call, output, status, (time.perf_counter() - started) * 1000)
+
+        results = list(await asyncio.gather(*(invoke(call) for call in calls)))
+        self._notify_listeners(results)
+        return results
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "max_workers": self.max_workers,
+            "coalescing": self.single_flight.metrics() if self.single_flight is not None else None
+        }
+
+    def reset_metrics(self) -> None:
+        if self.single_flight is not None:
+            self.single_flight.reset_metrics()
+
+    def close(self, wait: bool = True) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=wait)
+                self._pool = None
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Houston 100 Faith AI Assistant - Span Tracing
+
+In-process tracing of where a request's time goes:
+- Nested spans (conversation, agent run, tools, analyzer sub-steps, health
+  probes) tracked through contextvars, so asyncio tasks inherit the active
+  span automatically; propagate() carries it into worker threads
+- Head sampling: the keep/drop decision is made once, at the root span,
+  and every span of the trace follows it
+- Sampled traces are appended to a Chrome trace-event file (JSON array
+  format), viewable in Perfetto or chrome://tracing
+
+Generators time their spans by hand (start_span(), activate() around each
+synchronous step, finish()) so no span stays current across a yield and
+leaks into the consumer's context.
+
+Tracing is off unless TRACE_SAMPLE_RATE is above zero. While off, span()
+returns a shared no-op and instrument()/wrap() leave methods untouched, so
+hot paths such as the analyzer sub-steps pay nothing at all.
+"""
+
+import os
+import json
+import queue
+import time
+import atexit
+import random
+import functools
+import itertools
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Dict, List, Any, Callable, Iterator, Optional
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar("houston100_span", default=None)
+
+
+class _NoopSpan:
+    """Stand-in returned while tracing is off or the trace was not sampled"""
+    __slots__ = ()
+    trace = None
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def start(self) -> "_NoopSpan":
+        return self
+
+    def finish(self, exc_type=None, exc=None) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _UnsampledRoot(_NoopSpan):
+    """Root of a dropped trace; marks the context so its children skip recording"""
+    __slots__ = ("_token",)
+
+    def __enter__(self) -> "_UnsampledRoot":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        _restore(self._token, None)
+        return False
+
+
+def _restore(token: contextvars.Token, parent: Any) -> None:
+    try:
+        _current_span.reset(token)
+    except ValueError:
+        # Exited in another context (e.g. a generator resumed on a different thread)
+        _current_span.set(parent)
+
+
+class _Trace:
+    """Spans of one sampled trace; exported when the root span ends"""
+    __slots__ = ("trace_id", "spans", "flushed")
+
+    def __init__(self, trace_id: str):
+        self.trace_id = trace_id
+        self.spans: List["Span"] = []
+        self.flushed = False
+
+
+class Span:
+    """A timed, named operation within a trace"""
+    __slots__ = ("tracer", "name", "trace", "parent", "span_id", "attributes",
+                 "start_ns", "end_ns", "thread_id", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, trace: _Trace, parent: Optional["Span"],
+                 attributes: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.trace = trace
+        self.parent = parent
+        self.span_id = tracer._next_id()
+        self.attributes = attributes
+        self.start_ns = 0
+        self.end_ns = 0
+        self.thread_id = 0
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def start(self) -> "Span":
+        self.thread_id = threading.get_ident()
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def finish(self, exc_type=None, exc=None) -> None:
+        """End the span and hand it to the tracer"""
+        self.end_ns = time.perf_counter_ns()
+        if exc is not None:
+            self.attributes["error"] = f"{exc_type.__name__}: {exc}"
+        self.tracer._closed(self)
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        _restore(self._token, self.parent)
+        self.finish(exc_type, exc)
+        return False
+
+
+class ChromeTraceExporter:
+    """Appends spans to a Chrome trace-event file from a background writer thread
+
+    Uses the JSON array format, whose closing bracket is optional, so
+    events can be appended for the life of the process without rewriting
+    the file. Request threads only enqueue finished spans.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.exported_spans = 0
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._named_threads = set()
+        # Spans are timed with perf_counter_ns; this maps them onto wall-clock microseconds
+        self._wall_offset_ns = time.time_ns() - time.perf_counter_ns()
+        self._writer: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span]) -> None:
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="trace-writer", daemon=True)
+                self._writer.start()
+        self._queue.put(spans)
+
+    def _write_loop(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as output:
+            if output.tell() == 0:
+                output.write("[\n")
+            while True:
+                spans = self._queue.get()
+                if spans is None:
+                    return
+                try:
+                    output.write("".join(line + ",\n" for line in self._events(spans)))
+                    output.flush()
+                except (OSError, TypeError, ValueError):
+                    continue
+                self.exported_spans += len(spans)
+
+    def _events(self, spans: List[Span]) -> Iterator[str]:
+        pid = os.getpid()
+        for span in spans:
+            if span.thread_id not in self._named_threads:
+                self._named_threads.add(span.thread_id)
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+                yield json.dumps({
+                    "name": "thread_name", "ph": "M", "pid": pid, "tid": span.thread_id,
+                    "args": {"name": names.get(span.thread_id, str(span.thread_id))}
+                })
+            yield json.dumps({
+                "name": span.name,
+                "cat": span.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": (span.start_ns + self._wall_offset_ns) / 1000,
+                "dur": (span.end_ns - span.start_ns) / 1000,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": {
+                    **span.attributes,
+                    "trace_id": span.trace.trace_id,
+                    "span_id": span.span_id,
+                    "parent_id": span.parent.span_id if span.parent is not None else None
+                }
+            }, default=str)
+
+    def close(self) -> None:
+        """Write everything queued so far and stop the writer"""
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._queue.put(None)
+            writer.join()
+
+
+class Tracer:
+    """Creates spans, applies head sampling and hands finished traces to the exporter"""
+
+    def __init__(self, sample_rate: float = 0.0, exporter: Optional[ChromeTraceExporter] = None):
+        self.sample_rate = 0.0
+        self.exporter = None
+        self.traces_started = 0
+        self.traces_sampled = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.configure(sample_rate, exporter)
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def configure(self, sample_rate: float, exporter: Optional[ChromeTraceExporter] = None) -> None:
+        """Apply settings; traces still open are exported through the new exporter"""
+        if self.exporter is not None and self.exporter is not exporter:
+            self.exporter.close()
+        self.sample_rate = max(0.0, min(1.0, float(sample_rate)))
+        self.exporter = exporter
+        self._enabled = self.sample_rate > 0 and exporter is not None
+
+    def _next_id(self) -> int:
+        return next(self._ids)
+
+    def span(self, name: str, **attributes: Any):
+        """Context manager timing ``name`` as a child of the active span (or a new root)"""
+        if not self._enabled:
+            return _NOOP_SPAN
+        parent = _current_span.get()
+        if parent is None:
+            self.traces_started += 1
+            if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+                return _UnsampledRoot()
+            self.traces_sampled += 1
+            return Span(self, name, _Trace(f"{os.getpid():x}-{self._next_id():x}"), None, attributes)
+        if parent.trace is None:
+            return _NOOP_SPAN
+        return Span(self, name, parent.trace, parent, attributes)
+
+    def start_span(self, name: str, **attributes: Any):
+        """Start ``name`` as a child of the active span without making it current
+
+        The caller enters activate() around the work that belongs to it and
+        calls finish() once; nothing stays current between those steps.
+        """
+        return self.span(name, **attributes).start()
+
+    @contextmanager
+    def activate(self, span) -> Iterator[Any]:
+        """Make a span from start_span() current for the enclosed block"""
+        if span is _NOOP_SPAN:
+            yield span
+            return
+        previous = _current_span.get()
+        token = _current_span.set(span)
+        try:
+            yield span
+        finally:
+            _restore(token, previous)
+
+    def current_span(self):
+        """The active span, or a no-op whose set_attribute() does nothing"""
+        span = _current_span.get() if self._enabled else None
+        return span if span is not None else _NOOP_SPAN
+
+    def _closed(self, span: Span) -> None:
+        trace = span.trace
+        with self._lock:
+            trace.spans.append(span)
+            # Spans that outlive their root (e.g. a timed-out tool) export on their own
+            if span.parent is not None and not trace.flushed:
+                return
+            trace.flushed = True
+            spans, trace.spans = trace.spans, []
+        if self.exporter is not None:
+            self.exporter.export(spans)
+
+    def wrap(self, function: Callable, name: str) -> Callable:
+        """``function`` timed as span ``name``; returned unchanged while tracing is off"""
+        if not self._enabled:
+            return function
+
+        @functools.wraps(function)
+        def traced(*args, **kwargs):
+            with self.span(name):
+                return function(*args, **kwargs)
+
+        return traced
+
+    def instrument(self, target: Any, spans: Dict[str, str]) -> None:
+        """Replace ``target``'s methods (name -> span name) with traced versions when tracing is on"""
+        if not self._enabled:
+            return
+        for method_name, span_name in spans.items():
+            setattr(target, method_name, self.wrap(getattr(target, method_name), span_name))
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "enabled": self._enabled,
+            "sample_rate": self.sample_rate,
+            "traces_started": self.traces_started,
+            "traces_sampled": self.traces_sampled,
+            "exported_spans": self.exporter.exported_spans if self.exporter is not None else 0,
+            "output_path": self.exporter.path if self.exporter is not None else None
+        }
+
+
+tracer = Tracer()
+atexit.register(lambda: tracer.exporter is not None and tracer.exporter.close())
+
+
+def propagate(function: Callable) -> Callable:
+    """Bind ``function`` to the caller's context so a worker thread continues its trace"""
+    if not tracer.enabled:
+        return function
+    return functools.partial(contextvars.copy_context().run, function)
+
+
+def configure_tracing(config) -> Tracer:
+    """Configure the process tracer from config; TRACE_SAMPLE_RATE in the environment overrides"""
+    sample_rate = float(os.environ.get("TRACE_SAMPLE_RATE", config.TRACE_SAMPLE_RATE))
+    exporter = None
+    if sample_rate > 0:
+        exporter = tracer.exporter
+        if exporter is None or exporter.path != config.TRACE_OUTPUT_PATH:
+            exporter = ChromeTraceExporter(config.TRACE_OUTPUT_PATH)
+    tracer.configure(sample_rate, exporter)
+    return tracer
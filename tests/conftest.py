@@ -0,0 +1,24 @@
+import os
+import sys
+
+import pytest
+
+# The houston100_* modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from houston100_logging import shutdown_logging  # noqa: E402
+
+
+@pytest.fixture
+def offline_agent(tmp_path, monkeypatch):
+    """Houston100Agent whose Griptape structure is the offline load-test stand-in"""
+    loadtest = pytest.importorskip("houston100_loadtest", exc_type=ImportError)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("OPENAI_API_KEY", "offline-test")
+    agent = loadtest.build_offline_agent(loadtest.LATENCY_PROFILES["instant"], seed=1)
+    yield agent
+    agent.leadership_views.stop()
+    agent.sync_engine.close()
+    agent.tool_executor.close()
+    agent.investment_store.close()
+    shutdown_logging()
@@ -0,0 +1,120 @@
+import threading
+import time
+
+import pytest
+
+from houston100_admission import AdmissionController, AdmissionRejected, estimate_tokens
+
+
+def drained(tokens_per_minute=600, **kwargs):
+    """Controller plus the ticket holding its whole token budget (refilling at tokens_per_minute / 60 per second)"""
+    controller = AdmissionController(requests_per_minute=600, tokens_per_minute=tokens_per_minute, **kwargs)
+    return controller, controller.acquire(tokens_per_minute)
+
+
+def wait_for_depth(controller, depth):
+    deadline = time.monotonic() + 5
+    while controller.metrics()["queue_depth"] != depth:
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def test_estimate_counts_prompt_and_completion_budget():
+    assert estimate_tokens("x" * 10, 100) == 103
+
+
+def test_higher_tiers_are_admitted_first():
+    controller, holder = drained()
+    order = []
+
+    def request(tier):
+        with controller.admit(600, tier=tier, timeout=5) as ticket:
+            order.append(tier)
+            # Using nothing refunds the whole reservation, handing the budget to the next in line
+            ticket.record_usage(0)
+
+    threads = []
+    for tier in ("Steward", None, "Builder", "Kingdom", "Builder"):
+        threads.append(threading.Thread(target=request, args=(tier,)))
+        threads[-1].start()
+        wait_for_depth(controller, len(threads))
+    holder.record_usage(0)
+    controller.release(holder)
+    for thread in threads:
+        thread.join(5)
+
+    # Tier order, first come first served within a tier
+    assert order == ["Kingdom", "Builder", "Builder", "Steward", None]
+    assert controller.metrics()["by_tier"]["Builder"]["admitted"] == 2
+
+
+def test_request_past_its_deadline_is_shed():
+    controller, _ = drained()
+
+    started = time.monotonic()
+    with pytest.raises(AdmissionRejected) as rejected:
+        controller.acquire(600, tier="Kingdom", timeout=0.1)
+
+    assert rejected.value.reason == "deadline_exceeded"
+    assert rejected.value.retry_after_seconds >= 1.0
+    assert time.monotonic() - started < 1.0
+    metrics = controller.metrics()
+    assert metrics["queue_depth"] == 0
+    assert metrics["by_tier"]["Kingdom"]["shed"] == 1
+
+
+def test_full_queue_displaces_lower_tiers_and_rejects_equal_ones():
+    controller, _ = drained(max_queue_depth=1)
+    outcome = {}
+
+    def steward():
+        try:
+            controller.acquire(600, tier="Steward", timeout=5)
+        except AdmissionRejected as e:
+            outcome["steward"] = e.reason
+
+    thread = threading.Thread(target=steward)
+    thread.start()
+    wait_for_depth(controller, 1)
+
+    with pytest.raises(AdmissionRejected) as kingdom:
+        controller.acquire(600, tier="Kingdom", timeout=0.2)
+    thread.join(5)
+    with pytest.raises(AdmissionRejected) as anonymous:
+        controller.acquire(600, timeout=0.2)
+
+    assert outcome == {"steward": "displaced"}
+    assert kingdom.value.reason == "deadline_exceeded"
+    # The Kingdom request was shed at its deadline, so the queue had room again
+    assert anonymous.value.reason == "deadline_exceeded"
+    assert controller.metrics()["by_tier"]["Steward"]["rejected"] == 1
+
+
+def test_release_refunds_unused_tokens():
+    controller = AdmissionController(requests_per_minute=60, tokens_per_minute=6000)
+
+    with controller.admit(1000) as ticket:
+        assert controller.metrics()["tokens_budget_remaining"] == pytest.approx(5000, abs=5)
+        ticket.record_usage(200)
+
+    assert controller.metrics()["tokens_budget_remaining"] == pytest.approx(5800, abs=5)
+
+
+def test_release_charges_tokens_and_model_calls_beyond_the_reservation():
+    controller = AdmissionController(requests_per_minute=60, tokens_per_minute=6000)
+
+    with controller.admit(1000) as ticket:
+        ticket.record_usage(1500, requests=3)
+
+    metrics = controller.metrics()
+    assert metrics["tokens_budget_remaining"] == pytest.approx(4500, abs=5)
+    assert metrics["requests_budget_remaining"] == pytest.approx(57, abs=0.1)
+
+
+def test_release_without_recorded_usage_keeps_the_estimate():
+    controller = AdmissionController(requests_per_minute=60, tokens_per_minute=6000)
+
+    with controller.admit(1000):
+        pass
+
+    assert controller.metrics()["tokens_budget_remaining"] == pytest.approx(5000, abs=5)
@@ -0,0 +1,101 @@
+import random
+
+import pytest
+
+from houston100_anomaly import AnomalyMonitor, QuantileSketch, StreamingDetector
+
+
+def feed_error_minutes(monitor, errors_per_minute, conversations=100):
+    """One-minute intervals of ``conversations`` outcomes; returns anomalies keyed by the minute they opened"""
+    opened = []
+    for minute, errors in enumerate(errors_per_minute):
+        for index in range(conversations):
+            for anomaly in monitor.observe_outcome("error_rate", index < errors,
+                                                   now=minute * 60 + index * 0.5):
+                opened.append((minute, anomaly))
+    return opened
+
+
+def test_sketch_quantiles_stay_within_relative_accuracy():
+    rng = random.Random(1)
+    values = sorted(rng.lognormvariate(5, 1) for _ in range(20000))
+    sketch = QuantileSketch()
+    for value in values:
+        sketch.add(value)
+
+    for q in (0.5, 0.95, 0.99):
+        exact = values[int(q * (len(values) - 1))]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+
+
+def test_single_error_blip_never_opens_drift():
+    monitor = AnomalyMonitor(60)
+    errors = [1 if minute == 100 else 0 for minute in range(500)]
+
+    opened = feed_error_minutes(monitor, errors)
+
+    # p95 of a mostly-zero series is 0; the decaying baseline must not count as past it
+    assert opened == []
+    assert not monitor.is_anomalous("error_rate")
+    assert not any(anomaly["severity"] == "LOW" for anomaly in monitor.recent)
+
+
+def test_gradual_error_ramp_opens_drift_and_recovery_closes_it():
+    monitor = AnomalyMonitor(60)
+    ramp = [0] * 200 + [(minute // 40) for minute in range(400)]
+
+    opened = feed_error_minutes(monitor, ramp)
+
+    drift = [minute for minute, anomaly in opened if anomaly["kind"] == "drift"]
+    assert drift and drift[0] > 200
+    assert all(anomaly["severity"] == "LOW" for _, anomaly in opened if anomaly["kind"] == "drift")
+
+    feed_error_minutes(monitor, [0] * 600)
+    assert "drift" not in monitor.detectors["error_rate"].active
+
+
+def test_gradual_latency_ramp_is_detected_as_drift_only_once():
+    rng = random.Random(7)
+    detector = StreamingDetector("response_time_ms", min_std=5.0)
+    opened = []
+    for index in range(1200):
+        value = 200 + max(0, index - 400) * 1.0 + rng.gauss(0, 10)
+        opened.extend((index, anomaly["kind"]) for anomaly in detector.update(value))
+
+    drift = [index for index, kind in opened if kind == "drift"]
+    assert drift and 400 < drift[0] < 600
+    # Hysteresis keeps one climbing episode from flapping as the long-run quantile catches up
+    assert len(drift) <= 2
+    assert "drift" in detector.active
+
+
+def test_single_latency_spike_does_not_alert_but_a_level_shift_does():
+    rng = random.Random(3)
+    detector = StreamingDetector("response_time_ms", min_std=5.0)
+    for _ in range(300):
+        detector.update(200 + rng.gauss(0, 10))
+
+    assert detector.update(5000) == []
+    for _ in range(20):
+        detector.update(200 + rng.gauss(0, 10))
+    assert not detector.active
+
+    shifted = []
+    for _ in range(20):
+        shifted.extend(detector.update(400 + rng.gauss(0, 10)))
+    assert [anomaly["kind"] for anomaly in shifted] == ["level_shift"]
+    assert shifted[0]["severity"] == "MEDIUM"
+
+
+def test_lower_direction_detects_falling_sync_rate():
+    monitor = AnomalyMonitor(60)
+    for _ in range(100):
+        monitor.observe("integration_sync_rate", 99.0)
+
+    opened = []
+    for _ in range(10):
+        opened.extend(monitor.observe("integration_sync_rate", 80.0))
+
+    assert [anomaly["kind"] for anomaly in opened] == ["level_shift"]
+    assert monitor.is_anomalous("integration_sync_rate")
+    assert not monitor.is_anomalous("error_rate")
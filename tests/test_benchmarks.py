@@ -0,0 +1,41 @@
+from decimal import Decimal
+
+import pytest
+
+benchmarks = pytest.importorskip("houston100_benchmarks", exc_type=ImportError)
+
+
+def test_generator_is_seeded_and_covers_every_investment_type():
+    first = list(benchmarks.SyntheticInvestmentGenerator(seed=7).generate(20))
+    second = list(benchmarks.SyntheticInvestmentGenerator(seed=7).generate(20))
+
+    assert [inv.total_investment for inv in first] == [inv.total_investment for inv in second]
+    assert {inv.investment_type for inv in first} == set(benchmarks.InvestmentType)
+    assert all(inv.total_investment == inv.total_investment.quantize(Decimal("0.01")) for inv in first)
+
+
+def test_timing_handles_zero_duration():
+    assert benchmarks._timing(2_000_000_000, 1000) == {
+        "total_s": 2.0, "per_record_us": 2000.0, "records_per_s": 500.0
+    }
+    assert benchmarks._timing(0, 10)["records_per_s"] == 0.0
+
+
+def test_compare_reports_flags_only_lower_is_better_regressions():
+    baseline = {"results": {"1000": {"sum": {"float_per_record_ns": 10.0, "exact": True},
+                                     "memory": {"retained_bytes": 100}}}}
+    current = {"results": {"1000": {"sum": {"float_per_record_ns": 12.0, "exact": True},
+                                    "memory": {"retained_bytes": 105}}}}
+
+    comparisons = {item["metric"]: item for item in benchmarks.compare_reports(baseline, current, 0.10)}
+
+    assert set(comparisons) == {"1000.sum.float_per_record_ns", "1000.memory.retained_bytes"}
+    assert comparisons["1000.sum.float_per_record_ns"]["regression"] is True
+    assert comparisons["1000.memory.retained_bytes"]["regression"] is False
+
+
+def test_money_suite_fixed_point_path_is_exact():
+    accuracy = benchmarks.run_money_suite([500], seed=3)["500"]["accuracy"]
+
+    assert accuracy["int64_cents_exact"] is True
+    assert accuracy["int64_cents_allocation_sum_bps"] == 10_000
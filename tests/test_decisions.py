@@ -0,0 +1,104 @@
+import itertools
+import json
+
+import numpy as np
+import pytest
+
+from houston100_decisions import DEFAULT_DECISION_TABLE, DecisionTable, load_decision_table
+
+
+def legacy_recommendation(kingdom_score, projected_irr, biblical_alignment):
+    """The if/elif cascade the default decision table replaced, verbatim"""
+    if kingdom_score >= 90 and projected_irr >= 12 and biblical_alignment >= 85:
+        return "STRONG BUY - Exceptional Kingdom impact with superior financial returns and strong Biblical alignment"
+    elif kingdom_score >= 80 and projected_irr >= 10 and biblical_alignment >= 75:
+        return "BUY - Strong Kingdom impact with solid financial returns and good Biblical alignment"
+    elif kingdom_score >= 70 and projected_irr >= 8 and biblical_alignment >= 65:
+        return "CONSIDER - Moderate Kingdom impact with acceptable returns, requires further analysis"
+    elif kingdom_score < 60 or biblical_alignment < 50:
+        return "AVOID - Insufficient Kingdom alignment regardless of financial metrics"
+    elif projected_irr < 6:
+        return "HOLD - Review financial projections before proceeding"
+    else:
+        return "FURTHER ANALYSIS REQUIRED - Mixed indicators require additional evaluation"
+
+
+@pytest.fixture(scope="module")
+def table():
+    return load_decision_table()
+
+
+def boundary_grid():
+    """Every threshold, its neighbours and the range ends for each field"""
+    scores = sorted({value + delta for value in (0, 50, 60, 65, 70, 75, 80, 85, 90, 100) for delta in (-1, 0, 1)})
+    irrs = sorted({value + delta for value in (0.0, 6.0, 8.0, 10.0, 12.0, 30.0)
+                   for delta in (-0.01, -1e-9, 0.0, 1e-9, 0.01)})
+    return list(itertools.product(scores, irrs, scores))
+
+
+def test_default_table_matches_legacy_cascade_on_boundaries(table):
+    grid = np.array(boundary_grid())
+    columns = {"kingdom_score": grid[:, 0], "projected_irr": grid[:, 1], "biblical_alignment_score": grid[:, 2]}
+
+    vectorized = [table.rules[index].recommendation for index in table.evaluate(columns)]
+
+    expected = [legacy_recommendation(*row) for row in grid.tolist()]
+    assert vectorized == expected
+
+
+def test_default_table_matches_legacy_cascade_on_random_deals(table):
+    rng = np.random.default_rng(37)
+    scores = rng.integers(0, 101, size=(20_000, 2))
+    irrs = np.round(rng.uniform(-5, 30, size=20_000), 2)
+
+    rules = table.evaluate({"kingdom_score": scores[:, 0], "projected_irr": irrs,
+                            "biblical_alignment_score": scores[:, 1]})
+
+    for (kingdom, alignment), irr, rule in zip(scores.tolist(), irrs.tolist(), rules):
+        assert table.rules[rule].recommendation == legacy_recommendation(kingdom, irr, alignment)
+        scalar = table.evaluate_one(kingdom_score=kingdom, projected_irr=irr, biblical_alignment_score=alignment)
+        assert scalar.recommendation == table.rules[rule].recommendation
+
+
+def test_strict_operators_and_any_rules():
+    table = DecisionTable.from_dict({
+        "version": "test", "fields": ["x", "y"],
+        "rules": [
+            {"name": "high", "tier": "BUY", "message": "m", "conditions": [["x", ">", 5], ["x", "<=", 10]]},
+            {"name": "either", "tier": "AVOID", "message": "m", "match": "any",
+             "conditions": [["x", "<", 0], ["y", ">=", 3]]},
+        ],
+        "default": {"name": "rest", "tier": "HOLD", "message": "m"},
+    })
+
+    rules = table.evaluate({"x": [5, 5.000001, 10, 10.000001, -1, 1], "y": [0, 0, 0, 0, 0, 3]})
+
+    assert table.describe(rules) == [
+        {"rule": "rest", "tier": "HOLD"}, {"rule": "high", "tier": "BUY"}, {"rule": "high", "tier": "BUY"},
+        {"rule": "rest", "tier": "HOLD"}, {"rule": "either", "tier": "AVOID"}, {"rule": "either", "tier": "AVOID"},
+    ]
+    assert table.thresholds("y") == [3.0]
+
+
+@pytest.mark.parametrize("mutate", [
+    lambda spec: spec["rules"][0].update(tier="MAYBE"),
+    lambda spec: spec["rules"][0].update(match="most"),
+    lambda spec: spec["rules"][0]["conditions"].append(["unknown", ">=", 1]),
+    lambda spec: spec["rules"][0]["conditions"].append(["projected_irr", "==", 1]),
+])
+def test_invalid_tables_are_rejected(mutate):
+    spec = json.loads(json.dumps(DEFAULT_DECISION_TABLE))
+    mutate(spec)
+
+    with pytest.raises(ValueError):
+        DecisionTable.from_dict(spec)
+
+
+def test_tables_load_from_json(tmp_path):
+    spec = json.loads(json.dumps(DEFAULT_DECISION_TABLE))
+    spec["version"] = "2025.2"
+    path = tmp_path / "table.json"
+    path.write_text(json.dumps(spec))
+
+    assert load_decision_table(str(path)).version == "2025.2"
+    assert load_decision_table().version == DEFAULT_DECISION_TABLE["version"]
@@ -0,0 +1,207 @@
+import json
+import random
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from houston100_geo import CITY_CENTERS, GridSpatialIndex, Property, haversine_km, load_properties, resolve_location
+
+
+def texas_properties(count, seed=5):
+    rng = random.Random(seed)
+    properties = []
+    for index in range(count):
+        # Clusters around the metros plus a scattering across the state
+        if index % 4:
+            center_latitude, center_longitude = rng.choice(list(CITY_CENTERS.values()))
+            latitude, longitude = center_latitude + rng.gauss(0, 0.15), center_longitude + rng.gauss(0, 0.15)
+        else:
+            latitude, longitude = rng.uniform(26.0, 36.0), rng.uniform(-106.0, -94.0)
+        properties.append(Property(f"p{index}", f"Property {index}", latitude, longitude))
+    return properties
+
+
+def distances(properties, latitude, longitude):
+    return haversine_km(latitude, longitude, np.array([prop.latitude for prop in properties]),
+                        np.array([prop.longitude for prop in properties])).tolist()
+
+
+def brute_radius(properties, latitude, longitude, radius_km):
+    return sorted(prop.property_id for prop, km in zip(properties, distances(properties, latitude, longitude))
+                  if km <= radius_km)
+
+
+def brute_nearest_distances(properties, latitude, longitude, k):
+    return sorted(distances(properties, latitude, longitude))[:k]
+
+
+@pytest.fixture(scope="module")
+def loaded():
+    properties = texas_properties(3000)
+    index = GridSpatialIndex()
+    assert index.bulk_load(properties) == 3000
+    return index, properties
+
+
+def test_haversine_matches_known_distance():
+    houston, dallas = CITY_CENTERS["houston"], CITY_CENTERS["dallas"]
+    km = haversine_km(*houston, np.array([dallas[0]]), np.array([dallas[1]]))[0]
+    assert km == pytest.approx(362, abs=2)
+
+
+def test_radius_queries_match_brute_force(loaded):
+    index, properties = loaded
+    rng = random.Random(11)
+    for _ in range(40):
+        latitude, longitude = rng.uniform(26.0, 36.0), rng.uniform(-106.0, -94.0)
+        radius = rng.choice([1.0, 10.0, 50.0, 250.0])
+        found = index.within_radius(latitude, longitude, radius)
+
+        assert sorted(prop.property_id for prop, _ in found) == brute_radius(properties, latitude, longitude, radius)
+        found_km = [km for _, km in found]
+        assert found_km == sorted(found_km)
+
+
+def test_radius_limit_keeps_the_nearest(loaded):
+    index, properties = loaded
+    latitude, longitude = CITY_CENTERS["austin"]
+
+    limited = index.within_radius(latitude, longitude, 30.0, limit=5)
+
+    expected = [km for km in brute_nearest_distances(properties, latitude, longitude, 5) if km <= 30.0]
+    assert [km for _, km in limited] == pytest.approx(expected)
+
+
+def test_nearest_matches_brute_force(loaded):
+    index, properties = loaded
+    rng = random.Random(13)
+    for k in (1, 5, 50):
+        for _ in range(15):
+            latitude, longitude = rng.uniform(25.0, 37.0), rng.uniform(-107.0, -93.0)
+            found = index.nearest(latitude, longitude, k)
+            assert [km for _, km in found] == pytest.approx(brute_nearest_distances(properties, latitude, longitude, k))
+
+
+def test_nearest_far_outside_the_indexed_area(loaded):
+    index, properties = loaded
+    # Denver: every candidate is hundreds of km away, so the ring search must not stop early
+    found = index.nearest(39.7392, -104.9903, 3)
+    assert [km for _, km in found] == pytest.approx(brute_nearest_distances(properties, 39.7392, -104.9903, 3))
+    assert index.nearest(30.0, -95.0, 0) == []
+    assert GridSpatialIndex().nearest(30.0, -95.0, 3) == []
+
+
+def test_status_filter_applies_inside_the_index():
+    properties = [replace(prop, status="sold" if index % 10 else "Active")
+                  for index, prop in enumerate(texas_properties(2000, seed=9))]
+    active = [prop for prop in properties if prop.status == "Active"]
+    index = GridSpatialIndex()
+    index.bulk_load(properties)
+    latitude, longitude = CITY_CENTERS["houston"]
+
+    # Most nearby properties are sold; the search must widen until it has k active ones
+    found = index.nearest(latitude, longitude, 20, status="active")
+    assert [km for _, km in found] == pytest.approx(brute_nearest_distances(active, latitude, longitude, 20))
+    assert {prop.status for prop, _ in found} == {"Active"}
+
+    within = index.within_radius(latitude, longitude, 100.0, limit=5, status="ACTIVE")
+    assert [km for _, km in within] == pytest.approx(brute_nearest_distances(active, latitude, longitude, 5))
+    box = (29.0, -96.0, 30.5, -95.0)
+    assert sorted(prop.property_id for prop in index.bounding_box(*box, status="active")) == sorted(
+        prop.property_id for prop in active
+        if box[0] <= prop.latitude <= box[2] and box[1] <= prop.longitude <= box[3])
+    assert index.nearest(latitude, longitude, 3, status="pending") == []
+
+
+def test_bounding_box_includes_edges(loaded):
+    index, properties = loaded
+    box = (29.5, -95.6, 30.0, -95.1)
+    expected = sorted(prop.property_id for prop in properties
+                      if box[0] <= prop.latitude <= box[2] and box[1] <= prop.longitude <= box[3])
+
+    assert sorted(prop.property_id for prop in index.bounding_box(*box)) == expected
+
+    edge = GridSpatialIndex(cell_degrees=0.1)
+    edge.insert(Property("corner", "Corner", 30.0, -95.0))
+    assert [prop.property_id for prop in edge.bounding_box(29.9, -95.0, 30.0, -94.9)] == ["corner"]
+
+
+def test_insert_moves_and_remove_unindexes():
+    index = GridSpatialIndex()
+    index.bulk_load(texas_properties(200))
+    houston, dallas = CITY_CENTERS["houston"], CITY_CENTERS["dallas"]
+
+    index.insert(Property("mover", "Mover", *houston))
+    assert index.nearest(*houston, 1)[0][0].property_id == "mover"
+
+    index.insert(Property("mover", "Mover", *dallas))
+    assert len(index) == 201
+    assert "mover" not in [prop.property_id for prop, _ in index.within_radius(*houston, 1.0)]
+    assert index.nearest(*dallas, 1)[0][0].property_id == "mover"
+    assert index.get("mover").latitude == dallas[0]
+
+    assert index.remove("mover") is True
+    assert index.remove("mover") is False
+    assert index.get("mover") is None
+    assert "mover" not in [prop.property_id for prop, _ in index.within_radius(*dallas, 1.0)]
+    assert len(index) == 200
+
+
+def test_bulk_load_replaces_existing_and_repeated_ids():
+    index = GridSpatialIndex()
+    index.bulk_load([Property("a", "A", 30.0, -95.0), Property("b", "B", 31.0, -96.0)])
+    index.bulk_load([Property("a", "A2", 32.0, -97.0), Property("c", "C", 33.0, -98.0),
+                     Property("c", "C2", 29.0, -98.0)])
+
+    assert len(index) == 3
+    assert index.get("a").name == "A2"
+    assert index.get("c").name == "C2"
+    assert index.within_radius(30.0, -95.0, 5.0) == []
+    assert [prop.name for prop, _ in index.within_radius(29.0, -98.0, 5.0)] == ["C2"]
+    assert index.within_radius(33.0, -98.0, 5.0) == []
+    stats = index.stats()
+    assert stats["properties"] == 3 and stats["occupied_cells"] == 3
+
+
+def test_locations_and_records(tmp_path):
+    assert resolve_location(" Houston ") == CITY_CENTERS["houston"]
+    assert resolve_location("29.5, -95.25") == (29.5, -95.25)
+    with pytest.raises(ValueError):
+        resolve_location("Atlantis")
+
+    path = tmp_path / "properties.json"
+    path.write_text(json.dumps({"properties": [
+        {"id": 7, "name": "Oak Manor", "lat": "29.7", "lng": -95.3, "city": "Houston"},
+        {"property_id": "p8", "latitude": 30.2, "longitude": -97.7}
+    ]}))
+    loaded = load_properties(str(path))
+    assert [(prop.property_id, prop.latitude, prop.status) for prop in loaded] == [("7", 29.7, "active"),
+                                                                                  ("p8", 30.2, "active")]
+    assert load_properties(str(tmp_path / "missing.json")) == []
+    with pytest.raises(ValueError):
+        Property.from_record({"id": 1, "latitude": 95.0, "longitude": -95.0})
+
+
+def test_search_tool_fills_nearest_with_matching_status(offline_agent):
+    from houston100_tools import ToolCall
+
+    houston = CITY_CENTERS["houston"]
+    offline_agent.property_index.bulk_load(
+        [Property(f"sold-{index}", "Sold", houston[0] + index * 0.001, houston[1], status="sold")
+         for index in range(30)]
+        + [Property(f"active-{index}", "Active", houston[0] + 0.5 + index * 0.001, houston[1])
+           for index in range(80)]
+    )
+    offline_agent.config.PROPERTY_SEARCH_MAX_RESULTS = 50
+
+    def search(**arguments):
+        [result] = offline_agent.tool_executor.execute([ToolCall("search_properties", arguments)])
+        return json.loads(result.output)
+
+    found = search(location="Houston", nearest=5, status="active")
+    assert [prop["property_id"] for prop in found["properties"]] == [f"active-{index}" for index in range(5)]
+
+    clamped = search(location="Houston", nearest=500, limit=500)
+    assert clamped["query"]["nearest"] == 50
+    assert clamped["returned"] == 50
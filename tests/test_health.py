@@ -0,0 +1,46 @@
+def test_platform_performance_reports_no_data_before_traffic(offline_agent):
+    platform = offline_agent.health_monitor._check_platform_performance()
+
+    assert platform["status"] == "No data"
+    assert platform["uptime_percentage"] is None
+    assert platform["average_response_time_ms"] is None
+    assert platform["error_rate_percentage"] is None
+    assert platform["api_requests_per_hour"] == 0
+
+
+def test_platform_performance_reads_recorded_conversations(offline_agent):
+    offline_agent._record_conversation(True, 100.0)
+    offline_agent._record_conversation(True, 300.0)
+    offline_agent._record_conversation(False)
+    # Tool calls feed their own SLO and must not leak into the conversation figures
+    offline_agent.health_monitor.slo_engine.record("response_time", True, 5000.0)
+
+    platform = offline_agent.health_monitor._check_platform_performance()
+
+    assert platform["api_requests_per_hour"] == 3
+    assert platform["average_response_time_ms"] == 200
+    assert platform["uptime_percentage"] == 66.667
+    assert platform["error_rate_percentage"] == 33.333
+    assert platform["status"] == "Needs Attention"
+
+
+def test_live_conversations_feed_the_platform_window(offline_agent):
+    offline_agent.run_conversation("What is DHAP?")
+
+    health = offline_agent.health_monitor.comprehensive_health_check()
+
+    assert health["platform_performance"]["api_requests_per_hour"] == 1
+    assert health["platform_performance"]["average_response_time_ms"] is not None
+    assert health["platform_performance"]["status"] == "Excellent"
+
+
+def test_error_blip_leaves_performance_trend_stable(offline_agent):
+    anomalies = offline_agent.health_monitor.anomaly_monitor
+    for minute in range(500):
+        for index in range(100):
+            anomalies.observe_outcome("error_rate", minute == 100 and index == 0, now=minute * 60 + index * 0.5)
+
+    health = offline_agent.health_monitor.comprehensive_health_check()
+
+    assert health["platform_performance"]["performance_trend"] == "Stable"
+    assert not [alert for alert in health["active_alerts"] if alert.get("component") == "anomaly_detection"]
@@ -0,0 +1,77 @@
+import random
+
+from houston100_impact import KingdomImpactAggregator, TopK
+
+
+def make_analysis(investment_id, overall, **principles):
+    return {
+        "investment_id": investment_id,
+        "investment_name": investment_id.title(),
+        "kingdom_impact_score": {
+            "overall_score": overall,
+            "principle_breakdown": {
+                principle: {"raw_score": score, "biblical_reference": f"{principle} 1:1"}
+                for principle, score in principles.items()
+            },
+        },
+    }
+
+
+def top_ids(aggregator, principle):
+    performance = aggregator.principle_performance()[principle]
+    return [(entry["investment_id"], entry["score"]) for entry in performance["top_performing_investments"]]
+
+
+def test_running_statistics_replace_reanalyzed_contributions():
+    aggregator = KingdomImpactAggregator(top_k=2)
+    aggregator.record(make_analysis("a", 80, stewardship=70))
+    aggregator.record(make_analysis("b", 60, stewardship=50))
+    aggregator.record(make_analysis("a", 90, stewardship=90))
+    aggregator.record({"status": "error"})
+
+    summary = aggregator.overall_summary()
+    stewardship = aggregator.principle_performance()["stewardship"]
+
+    assert summary["investments_scored"] == 2
+    assert summary["analyses_recorded"] == 3
+    assert summary["average_kingdom_score"] == 75.0
+    assert (stewardship["average_score"], stewardship["investments_scored"]) == (70.0, 2)
+    assert (stewardship["min_score"], stewardship["max_score"]) == (50, 90)
+    assert stewardship["scripture_foundation"] == "stewardship 1:1"
+
+
+def test_top_k_evicts_lowest_and_repositions_reanalyzed_entries():
+    aggregator = KingdomImpactAggregator(top_k=2)
+    for investment_id, score in [("a", 70), ("b", 80), ("c", 60), ("d", 75)]:
+        aggregator.record(make_analysis(investment_id, score, justice=score))
+    assert top_ids(aggregator, "justice") == [("b", 80), ("d", 75)]
+
+    aggregator.record(make_analysis("d", 95, justice=95))
+    aggregator.record(make_analysis("b", 10, justice=10))
+
+    assert top_ids(aggregator, "justice") == [("d", 95), ("b", 10)]
+
+
+def reference_offer(entries, k, entry):
+    """Linear-scan model of the top-k update the indexed heap must match"""
+    for index, existing in enumerate(entries):
+        if existing[2] == entry[2]:
+            entries[index] = entry
+            return
+    if len(entries) < k:
+        entries.append(entry)
+    elif entries and entry[0] > min(entries)[0]:
+        entries.remove(min(entries))
+        entries.append(entry)
+
+
+def test_indexed_heap_matches_linear_model():
+    rng = random.Random(5)
+    for k in (0, 1, 3, 8):
+        heap, model = TopK(k), []
+        for sequence in range(2000):
+            entry = (rng.randint(0, 100), sequence, f"inv-{rng.randint(0, 30)}", "name")
+            heap.offer(entry)
+            reference_offer(model, k, entry)
+            assert sorted(heap.entries) == sorted(model)
+            assert heap.entries[:1] == sorted(model)[:1]
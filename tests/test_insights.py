@@ -0,0 +1,124 @@
+import itertools
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from houston100_insights import InsightSource, MaterializedViewSet, _build_cto_view
+
+
+class CountingSource:
+    def __init__(self, name, value=0):
+        self.name, self.value, self.version_marker, self.loads = name, value, 0, 0
+
+    def source(self):
+        def load():
+            self.loads += 1
+            return self.value
+        return InsightSource(self.name, lambda: self.version_marker, load)
+
+
+@pytest.fixture
+def views():
+    portfolio, members = CountingSource("portfolio", 10), CountingSource("members", 3)
+    views = MaterializedViewSet(refresh_seconds=0.02)
+    views.add_source(portfolio.source())
+    views.add_source(members.source())
+    views.register("ceo", ["portfolio", "members"], lambda inputs: {"total": inputs["portfolio"] + inputs["members"]})
+    views.register("coo", ["members"], lambda inputs: {"members": inputs["members"]})
+    yield views, portfolio, members
+    views.stop()
+
+
+def test_views_rebuild_only_when_their_sources_change(views):
+    views, portfolio, members = views
+
+    assert views.refresh() == ["ceo", "coo"]
+    assert (portfolio.loads, members.loads) == (1, 1)  # Shared sources load once per refresh
+    assert views.refresh() == []
+
+    portfolio.value, portfolio.version_marker = 20, 1
+    assert views.refresh() == ["ceo"]
+    assert views.get("ceo").data == {"total": 23}
+    assert views.get("ceo").builds == 2 and views.get("coo").builds == 1
+    assert views.refresh(force=True) == ["ceo", "coo"]
+    assert views.get("ceo").to_dict()["view_metadata"]["view"] == "ceo"
+
+
+def test_failed_builds_keep_serving_the_previous_view(views):
+    views, portfolio, _ = views
+    views.refresh()
+
+    portfolio.value, portfolio.version_marker = None, 1  # Builder raises TypeError on None + int
+
+    assert views.refresh() == []
+    assert views.get("ceo").data == {"total": 13}
+
+
+def test_unversioned_sources_reload_every_refresh():
+    counter = itertools.count()
+    views = MaterializedViewSet()
+    views.add_source(InsightSource("health", lambda: object(), lambda: next(counter)))
+    views.register("cto", ["health"], lambda inputs: {"probe": inputs["health"]})
+
+    views.refresh()
+    views.refresh()
+
+    assert views.get("cto").data == {"probe": 1}
+    with pytest.raises(ValueError):
+        views.register("bad", ["nope"], dict)
+
+
+def test_background_refresh_picks_up_changes(views):
+    views, portfolio, _ = views
+    views.start()
+    portfolio.value, portfolio.version_marker = 100, 1
+
+    deadline = time.monotonic() + 5
+    while views.get("ceo").data["total"] != 103 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert views.get("ceo").data == {"total": 103}
+
+
+def test_cto_view_passes_missing_platform_figures_through():
+    config = SimpleNamespace(LEADERSHIP_TEAM={"cto": {"name": "CTO"}})
+    health = {"platform_performance": {"status": "No data", "uptime_percentage": None,
+                                       "average_response_time_ms": None, "error_rate_percentage": None,
+                                       "api_requests_per_hour": 0}}
+
+    insights = _build_cto_view(config, {"health": health})["technical_insights"]
+    empty = _build_cto_view(config, {"health": {}})["technical_insights"]
+
+    assert insights["platform_status"] == "No data"
+    assert insights["uptime_percentage"] is None and insights["average_response_time_ms"] is None
+    assert insights["conversations_last_hour"] == 0
+    assert (empty["platform_status"], empty["conversations_last_hour"]) == ("No data", 0)
+    assert insights["average_ai_accuracy"] is None
+
+
+def test_leadership_tool_retries_or_reports_a_view_that_never_built(offline_agent):
+    from houston100_tools import ToolCall
+
+    views = offline_agent.leadership_views
+    definition = views._definitions["cto"]
+    builder = definition.builder
+
+    def insights():
+        [result] = offline_agent.tool_executor.execute([
+            ToolCall("generate_leadership_insights", {"focus_area": "CTO"})
+        ])
+        assert result.ok
+        return json.loads(result.output)
+
+    def failing(inputs):
+        raise RuntimeError("health source offline")
+
+    views._views.pop("cto")
+    definition.builder = failing
+    assert insights() == {"view": "cto", "status": "unavailable",
+                          "message": "The CTO insights view could not be built yet; please try again shortly."}
+
+    definition.builder = builder
+    assert insights()["view_metadata"]["view"] == "cto"
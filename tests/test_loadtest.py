@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from houston100_admission import AdmissionController
+
+loadtest = pytest.importorskip("houston100_loadtest", exc_type=ImportError)
+
+
+def test_percentile_is_nearest_rank():
+    values = [float(value) for value in range(1, 101)]
+    assert loadtest.percentile(values, 50) == 50.0
+    assert loadtest.percentile(values, 95) == 95.0
+    assert loadtest.percentile(values, 100) == 100.0
+    assert loadtest.percentile([], 95) == 0.0
+
+
+def test_query_corpus_reads_jsonl_and_text(tmp_path):
+    jsonl = tmp_path / "queries.jsonl"
+    jsonl.write_text(json.dumps({"title": "Portfolio status"}) + "\n\n" + json.dumps({"query": "Health?"}) + "\n")
+    text = tmp_path / "queries.txt"
+    text.write_text("first\n\nsecond\n")
+    assert loadtest.load_query_corpus(str(jsonl)) == ["Portfolio status", "Health?"]
+    assert loadtest.load_query_corpus(str(text)) == ["first", "second"]
+    assert loadtest.load_query_corpus() == list(loadtest.EXAMPLE_QUERIES)
+
+
+def test_empty_corpus_is_rejected(tmp_path):
+    empty = tmp_path / "empty.jsonl"
+    empty.write_text(json.dumps({"unrelated": 1}) + "\n")
+    with pytest.raises(ValueError):
+        loadtest.load_query_corpus(str(empty))
+
+
+def test_fake_driver_plans_tools_from_the_user_query_only():
+    driver = loadtest.FakePromptDriver(loadtest.LATENCY_PROFILES["instant"])
+    # The context preamble mentions the portfolio; only the query after "User Query:" counts
+    prompt = "Current Portfolio Status: ...\nUser Query: Check system health please"
+    assert [call.tool_name for call in driver.plan_tool_calls(prompt)] == ["check_faith_platform_health"]
+    assert driver.plan_tool_calls("User Query: hello") == []
+    assert len(list(driver.stream("User Query: hello"))) == loadtest.LATENCY_PROFILES["instant"].output_tokens
+
+
+def test_load_test_runs_tools_and_reports_percentiles(offline_agent):
+    report = loadtest.run_load_test(
+        offline_agent,
+        ["Check system health", "Show our best deals", "What is DHAP?"],
+        concurrency=3,
+        total_requests=9
+    )
+    assert report["requests"] == 9
+    assert report["errors"] == 0
+    assert report["latency_ms"]["p50"] <= report["latency_ms"]["p99"] <= report["latency_ms"]["max"]
+    assert report["per_tool"]["check_faith_platform_health"]["calls"] == 3
+    assert report["per_tool"]["screen_kingdom_deals"]["calls"] == 3
+
+
+def test_conversation_settles_admission_against_actual_usage(offline_agent):
+    controller = offline_agent.admission_controller = AdmissionController(requests_per_minute=60,
+                                                                          tokens_per_minute=6000)
+
+    offline_agent.run_conversation("Check system health")
+
+    metrics = controller.metrics()
+    # A tool step costs a planning call and an answer call, not the one reserved
+    assert metrics["requests_budget_remaining"] == pytest.approx(58, abs=0.1)
+    # The MAX_TOKENS completion budget was refunded down to the tokens actually used
+    assert 6000 - offline_agent.config.MAX_TOKENS < metrics["tokens_budget_remaining"] < 6000 - 100
+
+
+def test_shed_conversations_count_as_errors(offline_agent):
+    offline_agent.admission_controller = AdmissionController(requests_per_minute=1, tokens_per_minute=1000000,
+                                                             queue_timeout_seconds=0.01)
+
+    report = loadtest.run_load_test(offline_agent, ["What is DHAP?"], concurrency=1, total_requests=4)
+
+    shed = sum(stats["shed"] + stats["rejected"] for stats in report["admission"]["by_tier"].values())
+    assert shed > 0
+    assert report["errors"] == shed
@@ -0,0 +1,141 @@
+import json
+import logging
+import queue
+import random
+import threading
+from types import SimpleNamespace
+
+import houston100_logging
+from houston100_logging import (
+    DrainingQueueListener,
+    JsonFormatter,
+    NonBlockingQueueHandler,
+    SamplingFilter,
+    SizeAndTimeRotatingFileHandler,
+    configure_logging,
+    shutdown_logging,
+)
+
+
+def _record(message="hello", level=logging.INFO, **extra):
+    record = logging.LogRecord("houston100.test", level, __file__, 10, message, (), None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_size_rollover_keeps_every_backup(tmp_path):
+    path = tmp_path / "agent.log"
+    handler = SizeAndTimeRotatingFileHandler(str(path), when="midnight", backup_count=10, max_bytes=200)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    try:
+        for index in range(30):
+            handler.emit(_record(f"line {index:02d} " + "x" * 40))
+    finally:
+        handler.close()
+
+    files = sorted(tmp_path.iterdir())
+    assert len(files) > 2
+    assert all(file.stat().st_size <= 200 for file in files)
+    # Several size rollovers in the same interval each get their own backup file
+    lines = [line for file in files for line in file.read_text().splitlines()]
+    assert sorted(lines) == sorted(f"line {index:02d} " + "x" * 40 for index in range(30))
+
+
+def test_json_formatter_includes_extra_fields():
+    payload = json.loads(JsonFormatter().format(_record("User query", sample_key="conversation", member_id=7)))
+    assert payload["message"] == "User query"
+    assert payload["level"] == "INFO"
+    assert payload["sample_key"] == "conversation"
+    assert payload["member_id"] == 7
+
+
+def test_sampling_filter_only_samples_tagged_records():
+    sampling = SamplingFilter({"conversation": 0.1})
+    assert sampling.filter(_record())
+    assert sampling.filter(_record(level=logging.WARNING, sample_key="conversation"))
+
+    random.seed(100)
+    kept = sum(sampling.filter(_record(sample_key="conversation")) for _ in range(10000))
+    assert 800 < kept < 1200
+    assert sampling.sampled_out == 10000 - kept
+
+
+def test_sampled_records_carry_their_rate(monkeypatch):
+    monkeypatch.setattr(houston100_logging.random, "random", lambda: 0.0)
+    record = _record(sample_key="conversation")
+    assert SamplingFilter({"conversation": 0.25}).filter(record)
+    assert record.sample_rate == 0.25
+
+
+def test_records_of_one_conversation_are_sampled_together():
+    sampling = SamplingFilter({"conversation": 0.3})
+
+    decisions = []
+    for conversation in range(2000):
+        query = sampling.filter(_record("User query", sample_key="conversation", sample_id=conversation))
+        response = sampling.filter(_record("Response", sample_key="conversation", sample_id=conversation))
+        assert query == response
+        decisions.append(query)
+    assert 450 < sum(decisions) < 750
+
+
+class _BlockingHandler(logging.Handler):
+    def __init__(self, release):
+        super().__init__()
+        self.gate = release
+        self.messages = []
+
+    def emit(self, record):
+        self.gate.wait(5)
+        self.messages.append(record.getMessage())
+
+
+def test_listener_stops_while_the_queue_is_full():
+    log_queue = queue.Queue(maxsize=3)
+    release = threading.Event()
+    handler = _BlockingHandler(release)
+    listener = DrainingQueueListener(log_queue, handler)
+    listener.start()
+    for index in range(4):
+        log_queue.put(_record(str(index)), timeout=1)
+    assert log_queue.full()
+
+    # The writer frees room once its handler unblocks; stop() must wait for it instead of raising queue.Full
+    threading.Timer(0.2, release.set).start()
+    listener.stop()
+
+    assert handler.messages == ["0", "1", "2", "3"]
+
+
+def test_queue_handler_drops_instead_of_blocking():
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=2))
+    for index in range(5):
+        handler.enqueue(_record(str(index)))
+    assert handler.queue.qsize() == 2
+    assert handler.dropped_records == 3
+
+
+def test_configure_logging_is_idempotent_and_flushes_on_shutdown(tmp_path):
+    config = SimpleNamespace(
+        LOG_LEVEL="INFO",
+        LOG_FILE=str(tmp_path / "logs" / "agent.log"),
+        LOG_ROTATION_WHEN="midnight",
+        LOG_BACKUP_COUNT=3,
+        LOG_MAX_BYTES=1024 * 1024,
+        LOG_JSON_FORMAT=True,
+        LOG_QUEUE_SIZE=100,
+        LOG_SAMPLE_RATES={},
+    )
+    root = logging.getLogger()
+    saved_level = root.level
+    try:
+        listener = configure_logging(config)
+        assert configure_logging(config) is listener
+        logging.getLogger("houston100.test").info("queued record", extra={"request_id": "abc"})
+    finally:
+        shutdown_logging()
+        root.setLevel(saved_level)
+
+    lines = (tmp_path / "logs" / "agent.log").read_text().splitlines()
+    records = [json.loads(line) for line in lines]
+    assert any(record["message"] == "queued record" and record["request_id"] == "abc" for record in records)
@@ -0,0 +1,121 @@
+import datetime
+import json
+from dataclasses import replace
+
+from houston100_members import MemberStore, Money, member_performance, normalize_tier, tier_for_commitment
+from houston100_nav import NavTimeSeriesStore
+from houston100_sync import IntegrationClient, StandInIntegrationServer, SyncResult
+
+
+def contact(member_id, email, commitment, tier=None, category="housing"):
+    return {"id": member_id, "email": email, "firstname": "Member", "lastname": member_id,
+            "dhap_tier": tier, "holdings": [{"investment_id": f"inv-{member_id}", "category": category,
+                                             "commitment": commitment}]}
+
+
+def sync_result(success=True, changed=(), deleted=()):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return SyncResult(integration="ontraport", started_at=now, finished_at=now, success=success,
+                      changed_records=list(changed), deleted_ids=list(deleted))
+
+
+def test_tiers_follow_commitments_unless_the_crm_sets_one():
+    assert tier_for_commitment(Money.from_decimal("24999.99")) is None
+    assert tier_for_commitment(Money.from_decimal("100000")) == "Builder"
+    assert normalize_tier("kingdom level") == "Kingdom"
+    assert normalize_tier("gold") is None
+
+    store = MemberStore()
+    store.upsert([contact("1", "A@Example.org ", "600000"), contact("2", "b@example.org", "30000", "Builder")])
+
+    assert store.get("1").tier == "Kingdom"
+    assert store.get("2").tier == "Builder"
+    assert store.tier_counts() == {"Steward": 0, "Builder": 1, "Kingdom": 1}
+
+
+def test_indexes_follow_updates_and_removals():
+    store = MemberStore()
+    store.upsert([contact("1", "a@example.org", "30000")])
+    store.upsert([contact("1", "new@example.org", "150000")])
+
+    assert store.find_by_email("a@example.org") is None
+    assert store.resolve("new@example.org").member_id == "1"
+    assert store.resolve('{"member_id": "1"}').tier == "Builder"
+    assert [member.member_id for member in store.members_in_tier("builder")] == ["1"]
+    assert store.members_in_tier("Steward") == []
+
+    assert store.remove(["1", "missing"]) == 1
+    assert len(store) == 0 and store.resolve("1") is None
+
+
+def test_malformed_member_info_resolves_to_no_member():
+    store = MemberStore()
+    store.upsert([contact("7", "seven@example.org", "30000")])
+
+    assert store.resolve('{"member_id": 7}').member_id == "7"
+    assert store.resolve('{"email": "seven@example.org"}').member_id == "7"
+    assert store.resolve('{"member_id": "7"') is None
+    assert store.resolve("{not json}") is None
+    assert store.resolve('{"email": null}') is None
+
+
+def test_sync_results_apply_incrementally_and_persist(tmp_path):
+    path = str(tmp_path / "members.json")
+    store = MemberStore(path)
+    store.upsert([contact("1", "a@example.org", "30000"), contact("2", "b@example.org", "30000")])
+
+    assert store.apply_sync_result(sync_result(False, [contact("3", "c@example.org", "1")])) == {
+        "upserted": 0, "removed": 0}
+    applied = store.apply_sync_result(sync_result(changed=[contact("3", "c@example.org", "1")], deleted=["2"]))
+
+    assert applied == {"upserted": 1, "removed": 1}
+    reloaded = MemberStore(path)
+    assert sorted(member.member_id for member in reloaded.all_members()) == ["1", "3"]
+    assert reloaded.last_refreshed_at == store.last_refreshed_at
+
+
+def test_member_performance_weights_by_commitment():
+    nav = NavTimeSeriesStore()
+    nav.record_day(datetime.date(2024, 12, 31), [("inv-1", "housing", 100.0, 0.0)])
+    nav.record_day(datetime.date(2025, 6, 30), [("inv-1", "housing", 110.0, 0.0)])
+    member = MemberStore()
+    member.upsert([{**contact("1", "a@example.org", "30000"), "holdings": [
+        {"investment_id": "inv-1", "category": "housing", "commitment": "30000"},
+        {"investment_id": "inv-x", "category": "unknown", "commitment": "10000"},
+    ]}])
+
+    performance = member_performance(member.get("1"), nav)
+
+    assert performance["total_commitment"] == 40000.0
+    assert performance["holdings"][1]["ytd_returns"] is None
+    assert performance["weighted_returns"] == {"ytd_returns": 10.0}
+
+
+def test_scheduled_sync_all_feeds_the_member_store(offline_agent):
+    server = StandInIntegrationServer().start()
+    try:
+        engine = offline_agent.sync_engine
+        name = offline_agent.config.MEMBER_CRM_INTEGRATION
+        spec = replace(engine.specs[name], base_url=server.base_url, requests_per_second=1000, burst=1000)
+        engine.specs, engine.clients = {name: spec}, {name: IntegrationClient(spec)}
+        engine.clients[name].push_records([contact("m-1", "m1@example.org", "30000")])
+
+        engine.sync_all()
+        assert offline_agent.member_store.get("m-1").tier == "Steward"
+
+        engine.clients[name].push_records([contact("m-2", "m2@example.org", "120000")])
+        assert offline_agent.refresh_members_from_crm() == {"upserted": 1, "removed": 0}
+        assert offline_agent.member_store.get("m-2").tier == "Builder"
+    finally:
+        server.stop()
+
+
+def test_member_services_fall_back_for_malformed_member_info(offline_agent):
+    from houston100_tools import ToolCall
+
+    [result] = offline_agent.tool_executor.execute([
+        ToolCall("provide_member_services", {"query_type": "dhap_info", "member_info": "{oops"})
+    ])
+
+    assert result.ok
+    assert "dhap_program" in json.loads(result.output)
@@ -0,0 +1,85 @@
+from decimal import Decimal, ROUND_HALF_EVEN
+
+import numpy as np
+import pytest
+
+from houston100_money import (
+    INT64_MAX, Money, allocation_basis_points, aum_rollup, basis_points_to_percent,
+    cents_to_decimal, decimal_to_cents, decimals_to_cents_array, exact_sum, grouped_sums
+)
+
+
+def test_decimal_to_cents_is_exact_unless_rounding_is_requested():
+    assert decimal_to_cents(Decimal("1234.56")) == 123456
+    assert decimal_to_cents("0.125", ROUND_HALF_EVEN) == 12
+    assert decimal_to_cents("0.135", ROUND_HALF_EVEN) == 14
+    with pytest.raises(ValueError):
+        decimal_to_cents("0.125")
+    assert cents_to_decimal(123456) == Decimal("1234.56")
+
+
+def test_conversions_reject_amounts_outside_int64():
+    with pytest.raises(OverflowError):
+        decimal_to_cents(Decimal(INT64_MAX) / 100 + 1)
+    with pytest.raises(OverflowError):
+        Money(INT64_MAX) + Money(1)
+    with pytest.raises(TypeError):
+        Money(1.5)
+
+
+def test_money_arithmetic_and_formatting():
+    amounts = [Money.from_decimal("10.10"), Money.from_decimal("0.20"), Money(5)]
+
+    assert sum(amounts) == Money(1035)
+    assert str(Money(-123456789)) == "-$1,234,567.89"
+    assert (Money(100) - Money(250)).to_decimal() == Decimal("-1.50")
+    assert decimals_to_cents_array(["1.00", "2.5"]).tolist() == [100, 250]
+
+
+def test_exact_sum_never_wraps():
+    cents = np.array([INT64_MAX, INT64_MAX, -5], dtype=np.int64)
+
+    assert exact_sum(cents) == 2 * INT64_MAX - 5
+    assert exact_sum(np.array([], dtype=np.int64)) == 0
+    assert exact_sum(np.array([10, 20, 30])) == 60
+
+
+def test_grouped_sums_are_exact_and_refuse_possible_overflow():
+    cents = np.array([2 ** 53 + 1, 1, 7], dtype=np.int64)
+
+    # float64 bincount weights would drop the odd cent here
+    assert grouped_sums(np.array([0, 0, 1]), cents, 2).tolist() == [2 ** 53 + 2, 7]
+    with pytest.raises(OverflowError):
+        grouped_sums(np.array([0, 0]), np.array([INT64_MAX, 1]), 1)
+
+
+@pytest.mark.parametrize("amounts, expected", [
+    ([1, 1, 1], [3334, 3333, 3333]),
+    ([2, 1], [6667, 3333]),
+    ([1, 0, 0], [10000, 0, 0]),
+    ([0, 0], [0, 0]),
+    ([], []),
+])
+def test_allocation_basis_points_remainders(amounts, expected):
+    assert allocation_basis_points(amounts) == expected
+
+
+def test_allocation_basis_points_always_total_exactly_100_percent():
+    rng = np.random.default_rng(7)
+    for _ in range(200):
+        amounts = rng.integers(1, 10 ** 12, size=int(rng.integers(1, 12))).tolist()
+        shares = allocation_basis_points(amounts)
+        assert sum(shares) == 10_000
+        # Largest remainder never moves a share more than one basis point from its exact value
+        total = sum(amounts)
+        assert all(abs(share - amount * 10_000 / total) < 1 for share, amount in zip(shares, amounts))
+
+
+def test_aum_rollup():
+    rollup = aum_rollup(np.array([0, 1, 1, 2]), np.array([100, 100, 100, 0]), ["a", "b", "c"])
+
+    assert rollup["total"] == Money(300)
+    assert {label: group["allocation_basis_points"] for label, group in rollup["groups"].items()} == {
+        "a": 3333, "b": 6667, "c": 0
+    }
+    assert basis_points_to_percent(6667) == Decimal("66.67")
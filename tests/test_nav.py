@@ -0,0 +1,135 @@
+import datetime
+import math
+
+import numpy as np
+import pytest
+
+from houston100_nav import NavSeries, NavTimeSeriesStore, category_series, investment_series
+
+START = datetime.date(2020, 1, 1)
+
+
+def day(offset):
+    return START + datetime.timedelta(days=offset)
+
+
+def random_series(days=400, seed=38):
+    rng = np.random.default_rng(seed)
+    navs = 1000 * np.cumprod(1 + rng.normal(0.0003, 0.01, size=days))
+    flows = np.where(rng.random(days) < 0.05, rng.normal(0, 50, size=days), 0.0)
+    flows[0] = 0.0
+    navs = navs + np.cumsum(flows)
+    series = NavSeries(START, capacity=4)
+    for offset, (nav, flow) in enumerate(zip(navs, flows)):
+        series.append(day(offset), nav, flow)
+    return series, navs, flows
+
+
+def brute_force_return(navs, flows, start, end):
+    growth = 1.0
+    for index in range(start + 1, end + 1):
+        growth *= navs[index] / (navs[index - 1] + flows[index])
+    return growth - 1
+
+
+def test_window_returns_match_chained_daily_returns():
+    series, navs, flows = random_series()
+
+    for start, end in [(0, 399), (10, 11), (37, 250), (399, 399)]:
+        assert series.window_return(day(start), day(end)) == pytest.approx(
+            brute_force_return(navs, flows, start, end), rel=1e-9, abs=1e-12
+        )
+    assert series.net_cash_flow(day(10), day(300)) == pytest.approx(flows[11:301].sum())
+
+
+def test_cash_flows_are_not_counted_as_returns():
+    series = NavSeries(START)
+    series.append(day(0), 100.0)
+    series.append(day(1), 150.0, cash_flow=50.0)  # Pure deposit, no performance
+    series.append(day(2), 165.0)
+
+    assert series.window_return(day(0), day(1)) == pytest.approx(0.0)
+    assert series.window_return(day(0), day(2)) == pytest.approx(0.10)
+
+
+def test_gaps_carry_the_last_nav_forward():
+    series = NavSeries(START)
+    series.append(day(0), 100.0)
+    series.append(day(5), 110.0)
+
+    assert series.nav(day(3)) == 100.0
+    assert series.window_return(day(0), day(3)) == 0.0
+    assert series.window_return(day(3), day(5)) == pytest.approx(0.10)
+    assert series.nav(day(-10)) == 100.0 and series.nav(day(99)) == 110.0
+
+
+def test_appends_must_not_go_backwards_but_may_restate_the_latest_day():
+    series = NavSeries(START)
+    series.append(day(0), 100.0)
+    series.append(day(1), 101.0)
+    series.append(day(1), 105.0)
+
+    assert series.window_return(day(0)) == pytest.approx(0.05)
+    with pytest.raises(ValueError):
+        series.append(day(0), 99.0)
+    with pytest.raises(ValueError):
+        NavSeries(START).nav()
+
+
+def test_trailing_and_annualized_windows():
+    series = NavSeries(START)
+    days = round(2 * 365.25)
+    daily = math.log(1.21) / days
+    for offset in range(days + 1):
+        series.append(day(offset), 100.0 * math.exp(daily * offset))
+
+    assert series.trailing_return(1) == pytest.approx(0.10, rel=1e-3)
+    assert series.trailing_return(2) == pytest.approx(0.10, rel=1e-3)
+    assert series.trailing_return(2, annualize=False) == pytest.approx(0.21, rel=1e-9)
+    assert series.trailing_return(3) is None
+    # Windows shorter than a year are reported unannualized
+    assert series.annualized_return(day(0), day(100)) == pytest.approx(series.window_return(day(0), day(100)))
+
+
+def test_from_arrays_matches_incremental_appends():
+    series, navs, flows = random_series(days=50)
+
+    rebuilt = NavSeries.from_arrays(START, *series.arrays())
+
+    assert np.allclose(rebuilt.arrays()[0], navs) and np.allclose(rebuilt.arrays()[1], flows)
+    for start, end in [(0, 49), (5, 17)]:
+        assert rebuilt.window_return(day(start), day(end)) == pytest.approx(series.window_return(day(start), day(end)))
+
+
+def test_store_rolls_up_categories_and_persists(tmp_path):
+    store = NavTimeSeriesStore()
+    store.record_day(day(0), [("a", "housing", 100.0, 0.0), ("b", "business", 50.0, 0.0)])
+    store.record_day(day(1), [("a", "housing", 110.0, 0.0)])  # b carries its last NAV
+    store.record_day(day(2), [("b", "housing", 55.0, 0.0)])  # b moves category
+
+    assert store.get("portfolio").nav() == pytest.approx(165.0)
+    assert store.get(category_series("housing")).nav() == pytest.approx(165.0)
+    assert store.get(category_series("business")).nav() == pytest.approx(0.0)
+    assert store.get(investment_series("b")).nav(day(1)) == 50.0
+
+    path = store.save(str(tmp_path / "nav.npz"))
+    loaded = NavTimeSeriesStore(path)
+
+    assert loaded.performance_history() == store.performance_history()
+    assert loaded.category_performance().keys() == store.category_performance().keys()
+    loaded.record_day(day(3), [("a", "housing", 121.0, 0.0)])
+    assert loaded.get("portfolio").nav() == pytest.approx(176.0)
+
+
+def test_performance_history_reports_percent_windows():
+    store = NavTimeSeriesStore()
+    assert store.performance_history() is None
+    store.record_day(datetime.date(2024, 12, 31), [("a", "housing", 100.0, 0.0)])
+    store.record_day(datetime.date(2025, 3, 31), [("a", "housing", 104.0, 0.0)])
+
+    history = store.performance_history()
+
+    assert history["ytd_returns"] == 4.0
+    assert history["1_year_returns"] is None
+    assert history["inception_date"] == "2024-12-31"
+    assert history["nav"] == 104.0
@@ -0,0 +1,98 @@
+import threading
+import time
+
+from houston100_profiling import RequestProfiler, StackSampler
+from houston100_tools import ToolCall, ToolCallExecutor
+
+
+def spin(seconds: float = 0.15) -> str:
+    deadline = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < deadline:
+        total += sum(range(200))
+    return str(total)
+
+
+def park(event):
+    event.wait(5)
+
+
+def test_selection_and_request_flags():
+    profiler = RequestProfiler("unused", " conversation , spin ")
+    everything = RequestProfiler("unused", "all")
+
+    assert profiler.wanted("conversation") and profiler.wanted("spin")
+    assert not profiler.wanted("other")
+    assert profiler.wanted("other", True)
+    assert not profiler.wanted("conversation", False)
+    assert everything.wanted("anything")
+    assert not RequestProfiler("unused").wanted("conversation")
+
+
+def test_profile_writes_flamegraph_and_allocation_report(tmp_path):
+    profiler = RequestProfiler(str(tmp_path / "profiles"), interval_ms=1.0)
+
+    with profiler.profile("conversation/1") as session:
+        retained = [bytearray(1024) for _ in range(2000)]
+        spin(0.05)
+
+    report = session["report"]
+    assert report is profiler.reports[-1]
+    assert report.label == "conversation/1"
+    assert report.samples > 5
+    assert report.allocated_bytes >= 2000 * 1024
+    assert "test_profiling.py" in report.top_allocations[0]["location"]
+    assert "conversation_1" in report.flamegraph_path
+    allocations = open(report.allocations_path, encoding="utf-8").read()
+    assert allocations.startswith("Top allocations for conversation/1")
+    assert "bytearray(1024)" in allocations
+    assert len(retained) == 2000
+
+
+def test_concurrent_request_runs_unprofiled(tmp_path):
+    profiler = RequestProfiler(str(tmp_path))
+
+    with profiler.profile("first") as first:
+        with profiler.profile("second") as second:
+            assert second is None
+
+    assert first["report"].label == "first"
+    assert profiler.skipped_busy == 1
+    assert [report.label for report in profiler.reports] == ["first"]
+
+
+def test_sampler_keeps_busy_threads_and_drops_idle_ones():
+    release = threading.Event()
+    idle = threading.Thread(target=park, args=(release,), name="idle-worker")
+    busy = threading.Thread(target=spin, args=(0.15,), name="busy-worker")
+    sampler = StackSampler(0.002, focus="test_profiling")
+
+    idle.start()
+    sampler.start()
+    busy.start()
+    busy.join()
+    sampler.stop()
+    release.set()
+    idle.join()
+
+    collapsed = sampler.collapsed()
+    lines = collapsed.splitlines()
+    assert any(line.startswith("busy-worker;") and "spin (test_profiling.py" in line for line in lines)
+    assert "idle-worker" not in collapsed
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+def test_executor_profiles_selected_tool_calls(tmp_path):
+    profiler = RequestProfiler(str(tmp_path), "spin", interval_ms=1.0)
+    executor = ToolCallExecutor({"spin": spin, "quick": lambda: "ok"}, profiler=profiler)
+    try:
+        results = executor.execute([ToolCall("spin", {"seconds": 0.1}), ToolCall("quick")])
+        executor.execute([ToolCall("quick", profile=True)])
+    finally:
+        executor.close()
+
+    assert all(result.ok for result in results)
+    assert [report.label for report in profiler.reports] == ["spin", "quick"]
+    flamegraph = open(profiler.reports[0].flamegraph_path, encoding="utf-8").read()
+    assert "spin (test_profiling.py" in flamegraph
+    assert "_call_tool (houston100_tools.py" in flamegraph
@@ -0,0 +1,92 @@
+import datetime
+import json
+import os
+
+import pytest
+
+from houston100_members import Holding, MemberRecord, Money
+from houston100_nav import NavTimeSeriesStore
+from houston100_reports import (
+    QuarterlyReportGenerator, ReportAggregates, last_completed_quarter, quarter_bounds, render_member_report
+)
+from houston100_store import InvestmentStore
+from test_store import make_analysis, make_investment
+
+
+def test_quarter_labels():
+    assert quarter_bounds("2025Q1") == (datetime.date(2025, 1, 1), datetime.date(2025, 3, 31))
+    assert quarter_bounds("2024Q4") == (datetime.date(2024, 10, 1), datetime.date(2024, 12, 31))
+    assert last_completed_quarter(datetime.date(2025, 2, 14)) == "2024Q4"
+    assert last_completed_quarter(datetime.date(2025, 7, 1)) == "2025Q2"
+
+
+@pytest.fixture
+def aggregates():
+    nav = NavTimeSeriesStore()
+    nav.record_day(datetime.date(2024, 12, 31), [("inv-0001", "affordable_housing", 100.0, 0.0)])
+    nav.record_day(datetime.date(2025, 3, 31), [("inv-0001", "affordable_housing", 105.0, 0.0)])
+    store = InvestmentStore()
+    investment = make_investment(1, amount="1000000.00")
+    investment.community_impact = {"families_impacted": 40, "jobs_created": 10}
+    store.upsert_investments([investment])
+    store.upsert_analyses([make_analysis(1, score=88)])
+    yield ReportAggregates.build("2025Q1", ["inv-0001", "inv-0002"], ["affordable_housing", "missing"],
+                                 nav, store)
+    store.close()
+
+
+def member(member_id, commitment_cents, investment_id="inv-0001"):
+    return MemberRecord(member_id=member_id, email=f"{member_id}@example.org", name=member_id, tier="Builder",
+                        holdings=[Holding(investment_id, "affordable_housing", Money(commitment_cents))])
+
+
+def test_aggregates_and_pro_rata_attribution(aggregates):
+    assert aggregates.investment_returns == {"inv-0001": 5.0, "inv-0002": None}
+    assert aggregates.category_returns["missing"] is None
+
+    report = render_member_report(member("m1", 250_000_00), aggregates)
+
+    assert report["weighted_quarter_return_pct"] == 5.0
+    assert report["holdings"][0]["estimated_quarter_gain"] == 12500.0
+    assert report["holdings"][0]["kingdom_score"] == 88
+    assert report["attributed_kingdom_impact"] == {
+        "families_impacted": 10.0, "jobs_created": 2.5, "businesses_supported": 0.0}
+
+
+def test_holdings_without_data_fall_back_to_category_then_none(aggregates):
+    report = render_member_report(member("m2", 100_00, "inv-0002"), aggregates)
+
+    # inv-0002 has no NAV of its own; its category series covers the quarter
+    assert report["holdings"][0]["quarter_return_pct"] == 5.0
+    assert report["holdings"][0]["ownership_share_pct"] == 0.0
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_generation_skips_unchanged_members(tmp_path, aggregates, workers):
+    generator = QuarterlyReportGenerator(str(tmp_path), workers=workers, chunksize=2)
+    members = [member(f"m{index}", (index + 1) * 10_000_00) for index in range(5)]
+
+    first = generator.generate(members, aggregates)
+    members[3] = member("m3", 1)
+    second = generator.generate(members, aggregates)
+    forced = generator.generate(members, aggregates, force=True)
+
+    assert (first["reports_generated"], first["reports_skipped"]) == (5, 0)
+    assert (second["reports_generated"], second["reports_skipped"]) == (1, 4)
+    assert forced["reports_generated"] == 5
+    directory = os.path.join(str(tmp_path), "2025Q1")
+    with open(os.path.join(directory, "m3.json"), encoding="utf-8") as report_file:
+        assert json.load(report_file)["total_commitment"] == 0.01
+    assert sorted(os.listdir(directory)) == ["m0.json", "m1.json", "m2.json", "m3.json", "m4.json", "manifest.json"]
+
+
+def test_deleted_report_is_regenerated(tmp_path, aggregates):
+    generator = QuarterlyReportGenerator(str(tmp_path), workers=1)
+    members = [member(f"m{index}", (index + 1) * 10_000_00) for index in range(3)]
+    generator.generate(members, aggregates)
+    os.remove(os.path.join(str(tmp_path), "2025Q1", "m1.json"))
+
+    rerun = generator.generate(members, aggregates)
+
+    assert (rerun["reports_generated"], rerun["reports_skipped"]) == (1, 2)
+    assert os.path.exists(os.path.join(str(tmp_path), "2025Q1", "m1.json"))
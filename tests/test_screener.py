@@ -0,0 +1,54 @@
+import random
+
+from houston100_screener import ScreenCriteria, screen_deals
+
+
+def deal(index, roi, **fields):
+    return {"investment_id": f"inv-{index}", "kingdom_roi": roi, "investment_type": "affordable_housing",
+            "kingdom_score": 80, "projected_irr": 10.0, "recommendation_tier": "BUY", **fields}
+
+
+def ids(result):
+    return [item["investment_id"] for item in result.deals]
+
+
+def test_top_k_matches_full_sort():
+    rng = random.Random(3)
+    deals = [deal(index, rng.randint(0, 50)) for index in range(500)]
+
+    result = screen_deals(deals, top_k=7)
+    ascending = screen_deals(deals, top_k=7, descending=False)
+
+    # Python's stable sort keeps the earliest candidate on ties, like the screener
+    assert ids(result) == [item["investment_id"] for item in sorted(deals, key=lambda d: -d["kingdom_roi"])[:7]]
+    assert ids(ascending) == [item["investment_id"] for item in sorted(deals, key=lambda d: d["kingdom_roi"])[:7]]
+    assert (result.scanned, result.matched) == (500, 500)
+
+
+def test_criteria_filter_candidates():
+    deals = [
+        deal(1, 5.0, investment_type="small_business"),
+        deal(2, 6.0, kingdom_score=60),
+        deal(3, 7.0, projected_irr=20.0),
+        deal(4, 8.0, recommendation_tier="HOLD"),
+        deal(5, 9.0, projected_irr=None),
+        deal(6, 1.0),
+    ]
+    criteria = ScreenCriteria(investment_type="affordable_housing", min_kingdom_score=70, min_irr=5,
+                              max_irr=15, recommendation_tier="buy")
+
+    result = screen_deals(deals, criteria)
+
+    assert ids(result) == ["inv-6"]
+    assert ScreenCriteria(predicates=[lambda d: d["kingdom_roi"] > 8]).matches(deals[4])
+
+
+def test_nan_and_non_numeric_rank_values_are_skipped():
+    deals = [deal(1, 3.0), deal(2, float("nan")), deal(3, 9.0), deal(4, "high"), deal(5, True),
+             deal(6, None), deal(7, float("nan")), deal(8, 5.0), deal(9, 1.0)]
+
+    result = screen_deals(deals, top_k=3)
+
+    assert ids(result) == ["inv-3", "inv-8", "inv-1"]
+    assert result.matched == 4
+    assert screen_deals(deals, top_k=0).to_dict()["candidates_matched"] == 4
@@ -0,0 +1,85 @@
+from dataclasses import replace
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+agent = pytest.importorskip("houston100_agent", exc_type=ImportError)
+
+from houston100_decisions import TIER_RANKING  # noqa: E402
+from houston100_sensitivity import SensitivityEngine  # noqa: E402
+
+
+@pytest.fixture
+def analyzer():
+    return agent.KingdomInvestmentAnalyzer(agent.Houston100Config())
+
+
+@pytest.fixture
+def engine(analyzer):
+    return SensitivityEngine(analyzer, list(agent.KingdomPrinciples))
+
+
+@pytest.fixture
+def investment():
+    principle_ids = [principle.principle_id for principle in agent.KingdomPrinciples]
+    return agent.InvestmentData(
+        id="inv-1", name="Fifth Ward Homes", investment_type=agent.InvestmentType.AFFORDABLE_HOUSING,
+        total_investment=Decimal("2500000.00"), projected_irr=11.0, investment_timeline="5-7 years",
+        kingdom_scores={principle_ids[0]: 92, principle_ids[1]: 71}
+    )
+
+
+def scalar_tier(analyzer, investment):
+    return analyzer.analyze_investment(investment)["recommendation"].split(" - ")[0]
+
+
+def test_irr_sweep_matches_scalar_analyzer(engine, analyzer, investment):
+    values = np.linspace(0, 30, 61)
+
+    result = engine.sweep(investment, "projected_irr", values)
+
+    expected = [scalar_tier(analyzer, replace(investment, projected_irr=float(value))) for value in values]
+    assert [TIER_RANKING[rank] for rank in result["tier"]] == expected
+
+
+def test_score_sweep_matches_scalar_analyzer(engine, analyzer, investment):
+    principle_id = engine.principle_ids[2]
+    values = np.arange(0, 101, 5)
+
+    result = engine.sweep(investment, f"score:{principle_id}", values)
+
+    for value, score, rank in zip(values, result["kingdom_score"], result["tier"]):
+        scored = replace(investment, kingdom_scores={**investment.kingdom_scores, principle_id: int(value)})
+        analysis = analyzer.analyze_investment(scored)
+        assert int(score) == analysis["kingdom_impact_score"]["overall_score"]
+        assert TIER_RANKING[rank] == analysis["recommendation"].split(" - ")[0]
+
+
+def test_weight_changes_keep_weights_normalized(engine, investment):
+    batch = engine.apply(engine.baseline(investment).repeat(3), f"weight:{engine.principle_ids[0]}",
+                         np.array([0.0, 0.5, 1.0]))
+
+    assert np.allclose(batch.weights.sum(axis=1), 1.0)
+    assert batch.weights[:, 0].tolist() == [0.0, 0.5, 1.0]
+    with pytest.raises(ValueError):
+        engine.apply(engine.baseline(investment), "weight:unknown", np.array([0.1]))
+
+
+def test_tier_boundaries_flip_tiers(engine, analyzer, investment):
+    boundaries = engine.tier_boundaries(investment, "projected_irr")
+
+    assert boundaries
+    for boundary in boundaries:
+        below = replace(investment, projected_irr=boundary["value"] - 1e-6)
+        at = replace(investment, projected_irr=boundary["value"])
+        assert scalar_tier(analyzer, below) == boundary["tier_below"]
+        assert scalar_tier(analyzer, at) == boundary["tier_above"]
+
+
+def test_grid_counts_every_point(engine, investment):
+    result = engine.grid(investment, {"projected_irr": [4, 8, 12], f"score:{engine.principle_ids[0]}": [50, 95]})
+
+    assert result["points"] == 6
+    assert result["tier"].shape == (3, 2)
+    assert sum(result["tier_counts"].values()) == 6
@@ -0,0 +1,111 @@
+import json
+
+import numpy as np
+import pytest
+
+from houston100_snapshot import (
+    PortfolioSnapshot, SnapshotReader, latest_snapshot_path, prune_snapshots, write_snapshot
+)
+
+
+def make_row(index, investment_type="affordable_housing", cents=100_000_00, irr=10.0, score=80):
+    return {
+        "investment_id": f"inv-{index}",
+        "investment_type": investment_type,
+        "total_investment_cents": cents,
+        "projected_irr": irr,
+        "kingdom_score": score,
+        "biblical_alignment_score": 70,
+        "kingdom_roi": 12.0,
+        "recommendation_tier": "BUY",
+        "analysis_timestamp": "2026-10-19T12:00:00",
+    }
+
+
+def test_round_trip_columns_and_ids(tmp_path):
+    rows = [make_row(0), make_row(1, "small_business", 250_000_01, 14.0, 90), make_row(2, cents=5)]
+    path = write_snapshot(str(tmp_path), rows, generation=1)
+
+    snapshot = PortfolioSnapshot(path)
+
+    assert len(snapshot) == 3
+    assert [snapshot.investment_id(row) for row in range(3)] == ["inv-0", "inv-1", "inv-2"]
+    assert snapshot["total_investment_cents"].tolist() == [100_000_00, 250_000_01, 5]
+    assert snapshot.categories["investment_type"] == ["affordable_housing", "small_business"]
+    assert snapshot.category_code("investment_type", "small_business") == 1
+    assert snapshot.category_code("investment_type", "missing") == -1
+    assert not snapshot["projected_irr"].flags.writeable  # Zero-copy view of the mapping
+
+
+def test_breakdown_allocations_sum_to_whole(tmp_path):
+    rows = [make_row(index, ("affordable_housing", "small_business", "church_partnership")[index % 3],
+                     cents=100_000_00 + index) for index in range(10)]
+    snapshot = PortfolioSnapshot(write_snapshot(str(tmp_path), rows, generation=1))
+
+    breakdown = snapshot.portfolio_breakdown()
+
+    assert sum(group["investments"] for group in breakdown.values()) == 10
+    assert sum(group["allocation_percentage"] for group in breakdown.values()) == pytest.approx(100.0)
+    assert snapshot.summary()["total_aum"] == sum(row["total_investment_cents"] for row in rows) / 100
+
+
+def test_empty_snapshot(tmp_path):
+    snapshot = PortfolioSnapshot(write_snapshot(str(tmp_path), [], generation=1))
+
+    assert len(snapshot) == 0
+    assert snapshot.summary() == {"total_aum": 0.0, "investments": 0}
+    assert snapshot.portfolio_breakdown() == {}
+
+
+def test_rejects_foreign_files(tmp_path):
+    path = tmp_path / "portfolio-bad.h100snap"
+    path.write_bytes(b"\0" * 4096)
+
+    with pytest.raises(ValueError):
+        PortfolioSnapshot(str(path))
+
+
+def test_reader_swaps_to_newer_generations_and_prune_keeps_newest(tmp_path):
+    directory = str(tmp_path)
+    reader = SnapshotReader(directory)
+    assert reader.reload_if_newer() is None
+
+    write_snapshot(directory, [make_row(0)], generation=1)
+    first = reader.reload_if_newer()
+    old_column = first["total_investment_cents"]
+    write_snapshot(directory, [make_row(0), make_row(1)], generation=2)
+    write_snapshot(directory, [make_row(0), make_row(1), make_row(2)], generation=3)
+
+    assert len(reader.reload_if_newer()) == 3
+    assert prune_snapshots(directory, keep=1) and latest_snapshot_path(directory).endswith(
+        "portfolio-00000000000000000003.h100snap"
+    )
+    # Arrays from a pruned generation stay readable while referenced
+    assert np.array_equal(old_column, [100_000_00])
+
+
+def test_agent_publishes_snapshots_as_analyses_are_stored(offline_agent):
+    from houston100_loadtest import SAMPLE_INVESTMENT
+    from houston100_tools import ToolCall
+
+    offline_agent.config.PORTFOLIO_SNAPSHOT_EVERY_ANALYSES = 2
+    calls = [ToolCall("analyze_kingdom_investment",
+                      {"investment_data": json.dumps({**SAMPLE_INVESTMENT, "id": f"deal-{index}"})})
+             for index in range(3)]
+
+    offline_agent.tool_executor.execute(calls[:1])
+    assert offline_agent.portfolio_snapshots.reload_if_newer() is None
+    offline_agent.tool_executor.execute(calls[1:])
+
+    snapshot = offline_agent.portfolio_snapshots.reload_if_newer()
+    assert len(snapshot) == 2
+    offline_agent.leadership_views.refresh()
+    insights = json.loads(offline_agent.tool_executor.execute([
+        ToolCall("generate_leadership_insights", {"focus_area": "general"})
+    ])[0].output)
+    assert insights["company_health"]["data_source"] == "portfolio_snapshot"
+    assert insights["company_health"]["growth_trajectory"]["active_investments"] == 2
+
+    # A restart catches the snapshot up with analyses stored since the last publish
+    offline_agent._initialize_portfolio_snapshot()
+    assert len(offline_agent.portfolio_snapshots.reload_if_newer()) == 3
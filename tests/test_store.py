@@ -0,0 +1,110 @@
+import enum
+import threading
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from houston100_store import InvestmentStore, recommendation_tier
+
+
+class Kind(enum.Enum):
+    HOUSING = "affordable_housing"
+    BUSINESS = "small_business"
+
+
+def make_investment(index, kind=Kind.HOUSING, amount="1000000.00"):
+    return SimpleNamespace(
+        id=f"inv-{index:04d}", name=f"Investment {index}", investment_type=kind,
+        total_investment=Decimal(amount), projected_irr=10.0, investment_timeline="5 years",
+        kingdom_scores={"stewardship": 80}, community_impact={}, financial_metrics={},
+        biblical_alignment={}
+    )
+
+
+def make_analysis(index, kind=Kind.HOUSING, score=80, recommendation="BUY - Good fit"):
+    return {
+        "investment_id": f"inv-{index:04d}",
+        "investment_name": f"Investment {index}",
+        "investment_type": kind.value,
+        "kingdom_impact_score": {"overall_score": score},
+        "biblical_assessment": {"overall_biblical_alignment_score": 75},
+        "financial_analysis": {"projected_irr": 10.0},
+        "kingdom_roi_projection": {"kingdom_roi": 12.5},
+        "recommendation": recommendation,
+        "analysis_timestamp": "2026-10-19T12:00:00",
+    }
+
+
+@pytest.fixture
+def store():
+    store = InvestmentStore(batch_size=7)
+    yield store
+    store.close()
+
+
+def populate(store, count):
+    store.upsert_investments(make_investment(index) for index in range(count))
+    store.upsert_analyses(make_analysis(index, score=index % 100) for index in range(count))
+
+
+def test_bulk_upsert_across_batches_and_skips_errors(store):
+    written = store.upsert_analyses(
+        [make_analysis(index) for index in range(20)] + [{"status": "error"}]
+    )
+
+    assert written == 20
+    assert store.count() == 20
+    store.upsert_analyses([make_analysis(3, score=99)])
+    assert store.count() == 20
+    assert store.get_analysis("inv-0003")["kingdom_impact_score"]["overall_score"] == 99
+
+
+def test_amounts_are_stored_as_exact_cents(store):
+    store.upsert_investments([make_investment(1, amount="1234567.895")])
+
+    assert store.get_investment("inv-0001")["total_investment_cents"] == 123456790
+
+
+def test_top_deals_filters_and_orders(store):
+    store.upsert_analyses([
+        make_analysis(1, Kind.HOUSING, 95, "STRONG BUY - Exceptional"),
+        make_analysis(2, Kind.HOUSING, 70, "CONSIDER - Review"),
+        make_analysis(3, Kind.BUSINESS, 90, "buy - lowercase tier"),
+    ])
+
+    assert [deal["investment_id"] for deal in store.top_deals()] == ["inv-0001", "inv-0003", "inv-0002"]
+    assert [deal["investment_id"] for deal in store.top_deals(investment_type="small_business")] == ["inv-0003"]
+    assert [deal["investment_id"] for deal in store.top_deals(recommendation_tier="buy")] == ["inv-0003"]
+    assert [deal["investment_id"] for deal in store.top_deals(min_kingdom_score=80, limit=1)] == ["inv-0001"]
+    assert recommendation_tier("strong buy - x") == "STRONG BUY"
+
+
+def test_iterators_page_every_row_exactly_once(store):
+    populate(store, 23)
+
+    snapshot_ids = [row["investment_id"] for row in store.iter_snapshot_rows(fetch_size=5)]
+    summary_ids = [row["investment_id"] for row in store.iter_deal_summaries(fetch_size=5)]
+    analysis_ids = [analysis["investment_id"] for analysis in store.iter_analyses(fetch_size=5)]
+
+    expected = [f"inv-{index:04d}" for index in range(23)]
+    assert snapshot_ids == summary_ids == analysis_ids == expected
+
+
+def test_writers_are_not_blocked_by_a_paused_iterator(store):
+    populate(store, 10)
+    rows = store.iter_analyses(fetch_size=4)
+    next(rows)
+
+    writer = threading.Thread(target=store.upsert_analyses, args=([make_analysis(50)],))
+    writer.start()
+    writer.join(timeout=2)
+
+    assert not writer.is_alive()
+    # Later pages still see rows committed after the iteration started
+    assert len(list(rows)) == 10
+
+
+def test_count_rejects_unknown_tables(store):
+    with pytest.raises(ValueError):
+        store.count("sqlite_master")
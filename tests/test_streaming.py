@@ -0,0 +1,70 @@
+import asyncio
+import json
+
+import pytest
+
+from houston100_tracing import ChromeTraceExporter, tracer
+
+
+@pytest.fixture
+def trace_path(tmp_path):
+    path = tmp_path / "trace.json"
+    tracer.configure(1.0, ChromeTraceExporter(str(path)))
+    yield path
+    tracer.configure(0.0)
+
+
+def read_trace(path):
+    tracer.exporter.close()
+    events = json.loads(path.read_text().rstrip().rstrip(",") + "]")
+    return {event["name"]: event for event in events if event["ph"] == "X"}
+
+
+@pytest.fixture
+def recorded(offline_agent, monkeypatch):
+    outcomes = []
+    monkeypatch.setattr(offline_agent, "_record_conversation", lambda ok, elapsed_ms=0.0: outcomes.append(ok))
+    return outcomes
+
+
+def test_no_span_is_current_while_the_consumer_runs(offline_agent, trace_path, recorded):
+    types = []
+    for event in offline_agent.stream_conversation("Check system health"):
+        assert tracer.current_span().trace is None
+        types.append(event["type"])
+
+    assert types[0] == "tool_start" and types[-1] == "done"
+    assert "usage" not in types
+    assert recorded == [True]
+    spans = read_trace(trace_path)
+    assert spans["agent.run"]["args"]["parent_id"] == spans["conversation"]["args"]["span_id"]
+    assert spans["conversation.prompt"]["args"]["parent_id"] == spans["conversation"]["args"]["span_id"]
+    assert spans["conversation"]["dur"] >= spans["agent.run"]["dur"]
+
+
+def test_abandoned_stream_closes_its_spans_without_counting(offline_agent, trace_path, recorded):
+    stream = offline_agent.stream_conversation("Check system health")
+    assert next(stream)["type"] == "tool_start"
+    stream.close()
+
+    assert recorded == []
+    assert tracer.current_span().trace is None
+    spans = read_trace(trace_path)
+    assert spans["conversation"]["args"]["abandoned"] is True
+    assert "agent.run" in spans
+
+
+def test_async_stream_can_stop_early(offline_agent, recorded):
+    async def first_then_stop():
+        stream = offline_agent.astream_conversation("Check system health")
+        first = await stream.__anext__()
+        await stream.aclose()
+        return first
+
+    async def everything():
+        return [event["type"] async for event in offline_agent.astream_conversation("What is DHAP?")]
+
+    assert asyncio.run(first_then_stop())["type"] == "tool_start"
+    assert recorded == []
+    assert asyncio.run(everything())[-1] == "done"
+    assert recorded == [True]
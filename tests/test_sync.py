@@ -0,0 +1,230 @@
+import datetime
+import threading
+import time
+from dataclasses import replace
+
+import pytest
+
+from houston100_sync import (
+    DEFAULT_INTEGRATIONS, IntegrationSyncEngine, StandInIntegrationServer, parse_timestamp
+)
+
+
+def fast_specs(base_url, names=None, **overrides):
+    """Stand-in specs with the published rate limits lifted so tests run quickly"""
+    settings = dict(base_url=base_url, requests_per_second=1000, burst=1000, scheduled=True,
+                    backoff_base_seconds=0.001, backoff_cap_seconds=0.01, **overrides)
+    return {name: replace(DEFAULT_INTEGRATIONS[name], **settings)
+            for name in (names or DEFAULT_INTEGRATIONS)}
+
+
+@pytest.fixture
+def server():
+    server = StandInIntegrationServer().start()
+    yield server
+    server.stop()
+
+
+def seed_records(engine, name, count):
+    records = [{"id": f"{name}-{index}", "value": index} for index in range(count)]
+    engine.clients[name].push_records(records)
+    return records
+
+
+def test_push_batches_and_pull_pages(server):
+    engine = IntegrationSyncEngine(fast_specs(server.base_url, ["airtable"]))
+    seed_records(engine, "airtable", 25)
+
+    result = engine.sync_integration("airtable")
+
+    assert result.success
+    assert result.records_pulled == 25
+    patches = [entry for entry in server.request_log if entry[0] == "PATCH"]
+    assert len(patches) == 3  # Airtable writes 10 records per request
+    engine.close()
+
+
+def test_transient_failures_are_retried(server):
+    engine = IntegrationSyncEngine(fast_specs(server.base_url, ["ontraport"], max_retries=8))
+    seed_records(engine, "ontraport", 120)
+    server.failure_rate = 0.4
+
+    result = engine.sync_integration("ontraport")
+
+    assert result.success
+    assert result.records_pulled == 120
+    assert result.retries > 0
+    engine.close()
+
+
+def test_exhausted_retries_fail_the_sync(server):
+    engine = IntegrationSyncEngine(fast_specs(server.base_url, ["motion"], max_retries=2))
+    server.failure_rate = 1.0
+
+    result = engine.sync_integration("motion")
+
+    assert not result.success
+    assert "HTTP 503" in result.error
+    assert result.requests == 3
+    engine.close()
+
+
+def test_reconcile_detects_deletes(server):
+    engine = IntegrationSyncEngine(fast_specs(server.base_url, ["airtable"]))
+    seed_records(engine, "airtable", 5)
+    engine.sync_integration("airtable")
+    server.delete_records(DEFAULT_INTEGRATIONS["airtable"].records_path, ["airtable-2"])
+
+    result = engine.sync_integration("airtable", force_reconcile=True)
+
+    assert result.sync_type == "reconcile"
+    assert result.deleted_ids == ["airtable-2"]
+    engine.close()
+
+
+def test_unexpected_error_is_isolated_to_its_integration(server):
+    engine = IntegrationSyncEngine(fast_specs(server.base_url, ["airtable", "ontraport"]))
+    seed_records(engine, "airtable", 3)
+    seed_records(engine, "ontraport", 3)
+    engine.sync_all()
+
+    checkpoint = engine.checkpoints.get("airtable")
+    checkpoint["watermark"] = "not-a-timestamp"
+    engine.checkpoints.save("airtable", checkpoint)
+
+    results = engine.sync_all()
+
+    assert not results["airtable"].success
+    assert results["airtable"].error.startswith("ValueError")
+    assert results["ontraport"].success
+    assert engine.status()["airtable"]["status"] == "Degraded"
+    engine.close()
+
+
+def test_scheduled_sync_runs_until_stopped(server):
+    engine = IntegrationSyncEngine(fast_specs(server.base_url, ["airtable"]))
+    engine.start(0.05)
+
+    deadline = time.monotonic() + 5
+    while len(engine.history["airtable"]) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    engine.stop()
+    syncs = len(engine.history["airtable"])
+    time.sleep(0.15)
+
+    assert syncs >= 2
+    assert len(engine.history["airtable"]) == syncs
+    engine.close()
+
+
+def test_schedule_skips_integrations_without_a_records_endpoint(server):
+    specs = fast_specs(server.base_url, ["airtable"])
+    specs["motion"] = DEFAULT_INTEGRATIONS["motion"]
+    engine = IntegrationSyncEngine(specs)
+    assert engine.scheduled_integrations() == ["airtable"]
+    engine.start(0.05)
+
+    deadline = time.monotonic() + 5
+    while len(engine.history["airtable"]) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    engine.close()
+
+    assert len(engine.history["airtable"]) >= 2
+    assert len(engine.history["motion"]) == 0
+
+    unscheduled = IntegrationSyncEngine({"motion": DEFAULT_INTEGRATIONS["motion"]})
+    unscheduled.start(0.05)
+    assert unscheduled._thread is None
+    unscheduled.close()
+
+
+def test_delta_sync_pulls_only_new_changes(server):
+    engine = IntegrationSyncEngine(fast_specs(server.base_url, ["ontraport"]))
+    records = [{"id": f"contact-{index}", "value": index} for index in range(45)]
+    for record in records:
+        engine.clients["ontraport"].push_records([record])
+    first = engine.sync_integration("ontraport")
+
+    unchanged = engine.sync_integration("ontraport")
+    engine.clients["ontraport"].push_records([{"id": "contact-3", "value": -3}, {"id": "contact-99", "value": 99}])
+    updated = engine.sync_integration("ontraport")
+
+    assert (first.sync_type, first.records_changed) == ("full", 45)
+    # Only the record sharing the watermark timestamp is re-read, and it is not re-applied
+    assert (unchanged.sync_type, unchanged.records_pulled, unchanged.records_changed) == ("delta", 1, 0)
+    assert sorted(record["id"] for record in updated.changed_records) == ["contact-3", "contact-99"]
+    assert engine.checkpoints.get("ontraport")["watermark_ids"] == ["contact-3", "contact-99"]
+    engine.close()
+
+
+def test_watermark_same_timestamp_write_is_not_missed(server):
+    engine = IntegrationSyncEngine(fast_specs(server.base_url, ["ontraport"]))
+    path = DEFAULT_INTEGRATIONS["ontraport"].records_path
+    stamp = "2026-10-19T12:00:00+00:00"
+    server.records[path] = {"a": {"id": "a", "modified_at": stamp, "sequence": 1}}
+    engine.sync_integration("ontraport")
+
+    # A second record lands in the same timestamp after the previous pull
+    server.records[path]["b"] = {"id": "b", "modified_at": stamp, "sequence": 2}
+    result = engine.sync_integration("ontraport")
+
+    assert [record["id"] for record in result.changed_records] == ["b"]
+    assert engine.checkpoints.get("ontraport")["watermark_ids"] == ["a", "b"]
+    engine.close()
+
+
+def test_concurrent_syncs_of_one_integration_do_not_overlap(server):
+    engine = IntegrationSyncEngine(fast_specs(server.base_url, ["ontraport"]))
+    seed_records(engine, "ontraport", 5)
+    client = engine.clients["ontraport"]
+    pull_changes = client.pull_changes
+    pulling = threading.Semaphore(0)
+
+    def slow_pull(params=None):
+        # Give an overlapping sync the chance to pull the same changes
+        pulling.release()
+        pulling.acquire(timeout=0.3)
+        return pull_changes(params)
+
+    client.pull_changes = slow_pull
+    delivered = []
+    engine.add_listener(lambda result: delivered.extend(record["id"] for record in result.changed_records))
+    threads = [threading.Thread(target=engine.sync_integration, args=("ontraport",)) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(delivered) == [f"ontraport-{index}" for index in range(5)]
+    assert [result.sync_type for result in engine.history["ontraport"]] == ["full", "delta"]
+    engine.close()
+
+
+def test_watermark_compares_parsed_timestamps():
+    engine = IntegrationSyncEngine(fast_specs("http://127.0.0.1:9", ["ontraport"]))
+    spec = engine.specs["ontraport"]
+    checkpoint = {"watermark": "2026-10-19T12:00:00Z", "watermark_ids": ["a"],
+                  "last_reconciled_at": None, "checksums": {}}
+    pulled = [{"id": "b", "modified_at": "2026-10-19T12:00:00.500000+00:00"}]
+    started_at = datetime.datetime.now(datetime.timezone.utc)
+
+    engine._apply_pull(spec, checkpoint, pulled, None, "delta", started_at)
+
+    assert parse_timestamp(checkpoint["watermark"]) == parse_timestamp("2026-10-19T12:00:00.5Z")
+    assert checkpoint["watermark_ids"] == ["b"]
+    engine.close()
+
+
+def test_agent_schedules_only_integrations_with_a_configured_endpoint(offline_agent):
+    assert offline_agent.config.SYNC_INTERVAL_SECONDS == 0
+    assert offline_agent.sync_engine.scheduled_integrations() == []
+    assert offline_agent.sync_engine._thread is None
+
+    offline_agent.config.SYNC_BASE_URLS = {"ontraport": "http://127.0.0.1:8765"}
+    engine = offline_agent._initialize_sync_engine()
+    try:
+        assert engine.scheduled_integrations() == ["ontraport"]
+        assert engine.specs["ontraport"].base_url == "http://127.0.0.1:8765"
+        assert engine.specs["airtable"].base_url == DEFAULT_INTEGRATIONS["airtable"].base_url
+    finally:
+        engine.close()
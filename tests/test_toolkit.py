@@ -0,0 +1,120 @@
+import time
+from typing import Optional
+
+from attrs import define, field
+from griptape.artifacts import ActionArtifact, ErrorArtifact, TextArtifact
+from griptape.common import ActionCallMessageContent, Message, TextMessageContent, ToolAction
+from griptape.drivers.prompt.base_prompt_driver import BasePromptDriver
+from griptape.structures import Agent
+from griptape.tokenizers import SimpleTokenizer
+
+from houston100_tools import ToolCallExecutor
+from houston100_toolkit import build_executor_toolkit
+
+SLEEP_SECONDS = {"slow_a": 0.3, "slow_b": 0.4, "slow_c": 0.5}
+
+
+def sleeper(name, seconds):
+    def tool(label: str = "") -> str:
+        time.sleep(seconds)
+        return f"{name} done {label}"
+    tool.__name__ = name
+    tool.__doc__ = f"Sleep for {seconds} seconds\n\nArgs:\n    label: Text echoed back\n"
+    return tool
+
+
+@define
+class ScriptedPromptDriver(BasePromptDriver):
+    """Asks for every slow tool in one step, then answers once the results are in"""
+    toolkit_name: str = field(kw_only=True)
+    model: str = field(default="scripted", kw_only=True)
+    tokenizer: SimpleTokenizer = field(factory=lambda: SimpleTokenizer(max_input_tokens=100000, max_output_tokens=1000,
+                                                                      characters_per_token=4), kw_only=True)
+    use_native_tools: bool = field(default=True, kw_only=True)
+    calls: int = field(default=0, kw_only=True)
+
+    def try_run(self, prompt_stack):
+        self.calls += 1
+        if self.calls > 1:
+            return Message(content=[TextMessageContent(TextArtifact("all done"))], role=Message.ASSISTANT_ROLE,
+                           usage=Message.Usage(input_tokens=10, output_tokens=2))
+        actions = [
+            ActionCallMessageContent(ActionArtifact(ToolAction(tag=f"call-{name}", name=self.toolkit_name, path=name,
+                                                               input={"label": name})))
+            for name in SLEEP_SECONDS
+        ]
+        return Message(content=actions, role=Message.ASSISTANT_ROLE, usage=Message.Usage(input_tokens=10, output_tokens=5))
+
+    def try_stream(self, prompt_stack):
+        raise NotImplementedError
+
+
+def test_agent_step_runs_tool_actions_concurrently_through_executor():
+    executor = ToolCallExecutor({name: sleeper(name, seconds) for name, seconds in SLEEP_SECONDS.items()},
+                                max_workers=4)
+    seen = []
+    executor.add_listener(seen.append)
+    toolkit = build_executor_toolkit(executor)
+    agent = Agent(prompt_driver=ScriptedPromptDriver(toolkit_name=toolkit.name), tools=[toolkit])
+
+    try:
+        started = time.perf_counter()
+        agent.run("run the slow tools")
+        elapsed = time.perf_counter() - started
+    finally:
+        executor.close()
+
+    # Concurrent dispatch: the step costs the slowest tool, not the 1.2s sum
+    assert max(SLEEP_SECONDS.values()) <= elapsed < 0.9
+    assert sorted(result.call.tool_name for result in seen) == sorted(SLEEP_SECONDS)
+    assert all(result.ok for result in seen)
+    assert agent.output.value == "all done"
+
+
+def test_activities_mirror_executor_tools():
+    def lookup(investment_id: str, limit: int = 5, ratio: float = 1.0, note: Optional[str] = None) -> str:
+        """Look up an investment
+
+        Args:
+            investment_id: Investment to look up
+            limit: Maximum rows
+
+        Returns:
+            JSON string
+        """
+        return f"{investment_id}:{limit}:{ratio}:{note}"
+
+    def ping() -> str:
+        """Check the service"""
+        return "pong"
+
+    executor = ToolCallExecutor({"lookup": lookup, "ping": ping})
+    try:
+        toolkit = build_executor_toolkit(executor)
+
+        assert sorted(activity.name for activity in toolkit.activities()) == ["lookup", "ping"]
+        lookup_activity = toolkit.find_activity("lookup")
+        assert toolkit.activity_description(lookup_activity) == "Look up an investment"
+        properties = toolkit.to_activity_json_schema(lookup_activity, "lookup")
+        assert properties["required"] == ["investment_id"]
+        assert properties["properties"]["investment_id"]["description"] == "Investment to look up"
+        assert properties["properties"]["limit"]["type"] == "integer"
+        assert toolkit.find_activity("ping")({"values": {}}).value == "pong"
+        assert lookup_activity({"values": {"investment_id": "inv-1", "ratio": 2}}).value == "inv-1:5:2:None"
+    finally:
+        executor.close()
+
+
+def test_failed_tool_call_becomes_error_artifact():
+    def broken() -> str:
+        """Always fails"""
+        raise RuntimeError("boom")
+
+    executor = ToolCallExecutor({"broken": broken})
+    try:
+        result = build_executor_toolkit(executor).find_activity("broken")({"values": {}})
+    finally:
+        executor.close()
+
+    assert isinstance(result, ErrorArtifact)
+    assert "boom" in result.value
@@ -0,0 +1,231 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from houston100_tools import SingleFlight, ToolCall, ToolCallExecutor, call_key
+
+
+class Gate:
+    """Tool body that blocks until released and counts its executions"""
+
+    def __init__(self, value="done"):
+        self.value = value
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.runs = 0
+
+    def __call__(self):
+        self.runs += 1
+        self.started.set()
+        assert self.release.wait(5)
+        return self.value
+
+
+def test_call_key_normalizes_json_arguments():
+    assert call_key("tool", {"data": '{"b": 1, "a": 2}'}) == call_key("tool", {"data": '{"a":2,"b":1}'})
+    assert call_key("tool", {"data": "x"}) != call_key("other", {"data": "x"})
+
+
+def test_threads_share_one_execution():
+    flight = SingleFlight()
+    gate = Gate()
+    results = []
+
+    leader = threading.Thread(target=lambda: results.append(flight.do("k", gate)))
+    leader.start()
+    assert gate.started.wait(5)
+    followers = [threading.Thread(target=lambda: results.append(flight.do("k", gate))) for _ in range(4)]
+    for thread in followers:
+        thread.start()
+    while flight.metrics()["coalesced"] < 4:
+        time.sleep(0.005)
+    gate.release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert results == ["done"] * 5
+    assert gate.runs == 1
+    assert flight.metrics()["executions"] == 1
+    assert flight.metrics()["in_flight"] == 0
+
+
+def test_cancelled_async_follower_leaves_shared_call_running():
+    flight = SingleFlight()
+    gate = Gate()
+    results = []
+
+    leader = threading.Thread(target=lambda: results.append(flight.do("k", gate)))
+    leader.start()
+    assert gate.started.wait(5)
+
+    async def follow_then_cancel():
+        follower = asyncio.ensure_future(flight.do_async("k", gate))
+        await asyncio.sleep(0.05)
+        follower.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+        # A fresh waiter still joins the same execution
+        survivor = asyncio.ensure_future(flight.do_async("k", gate))
+        await asyncio.sleep(0.05)
+        gate.release.set()
+        return await survivor
+
+    assert asyncio.run(follow_then_cancel()) == "done"
+    leader.join(5)
+    assert results == ["done"]
+    assert gate.runs == 1
+
+
+def test_cancelled_async_leader_still_delivers_to_followers():
+    flight = SingleFlight()
+    gate = Gate()
+    thread_results = []
+
+    async def lead_then_cancel():
+        leader = asyncio.ensure_future(flight.do_async("k", gate))
+        while not gate.started.is_set():
+            await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(flight.do_async("k", gate))
+        thread_follower = threading.Thread(target=lambda: thread_results.append(flight.do("k", gate)))
+        thread_follower.start()
+        while flight.metrics()["coalesced"] < 2:
+            await asyncio.sleep(0.01)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        gate.release.set()
+        value = await follower
+        await asyncio.get_running_loop().run_in_executor(None, thread_follower.join, 5)
+        return value
+
+    assert asyncio.run(lead_then_cancel()) == "done"
+    assert thread_results == ["done"]
+    assert gate.runs == 1
+    assert flight.metrics()["in_flight"] == 0
+
+
+def test_leader_error_reaches_every_waiter():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def fail():
+        started.set()
+        time.sleep(0.1)
+        raise ValueError("bad input")
+
+    errors = []
+
+    def call():
+        try:
+            flight.do("k", fail)
+        except ValueError as e:
+            errors.append(str(e))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    assert started.wait(5)
+
+    async def follow():
+        with pytest.raises(ValueError, match="bad input"):
+            await flight.do_async("k", fail)
+
+    asyncio.run(follow())
+    leader.join(5)
+    assert errors == ["bad input"]
+
+
+def test_async_leader_runs_coroutine_functions():
+    flight = SingleFlight()
+
+    async def compute():
+        await asyncio.sleep(0.05)
+        return 42
+
+    async def run_both():
+        return await asyncio.gather(flight.do_async("k", compute), flight.do_async("k", compute))
+
+    assert asyncio.run(run_both()) == [42, 42]
+    assert flight.metrics()["executions"] == 1
+
+
+def make_executor(**kwargs):
+    def slow(seconds: float = 0.2) -> str:
+        time.sleep(seconds)
+        return f"slept {seconds}"
+
+    def broken() -> str:
+        raise RuntimeError("boom")
+
+    def reports_error() -> str:
+        return "Error fetching data: offline"
+
+    tools = {"slow": slow, "broken": broken, "reports_error": reports_error}
+    return ToolCallExecutor(tools, max_workers=4, **kwargs)
+
+
+def test_execute_runs_concurrently_in_call_order():
+    executor = make_executor()
+    try:
+        started = time.perf_counter()
+        results = executor.execute([ToolCall("slow", {"seconds": seconds}) for seconds in (0.3, 0.1, 0.2)])
+        elapsed = time.perf_counter() - started
+    finally:
+        executor.close()
+
+    assert [result.output for result in results] == ["slept 0.3", "slept 0.1", "slept 0.2"]
+    assert elapsed < 0.55
+
+
+def test_execute_reports_timeouts_errors_and_unknown_tools():
+    executor = make_executor(timeouts={"slow": 0.1})
+    seen = []
+    executor.add_listener(seen.append)
+    try:
+        results = executor.execute([
+            ToolCall("slow", {"seconds": 0.5}),
+            ToolCall("broken"),
+            ToolCall("reports_error"),
+            ToolCall("missing")
+        ])
+    finally:
+        executor.close()
+
+    assert [result.status for result in results] == ["timeout", "error", "error", "error"]
+    assert "timed out" in results[0].output
+    assert "boom" in results[1].output
+    assert results[3].output == "Error: unknown tool missing"
+    assert seen == results
+
+
+def test_execute_async_times_out_without_cancelling_shared_call():
+    executor = make_executor(timeouts={"slow": 0.1})
+
+    async def run():
+        timed_out = await executor.execute_async([ToolCall("slow", {"seconds": 0.3})])
+        # The timed-out execution is still in flight and keeps its coalescing slot
+        assert executor.single_flight.metrics()["in_flight"] == 1
+        await asyncio.sleep(0.4)
+        return timed_out
+
+    try:
+        results = asyncio.run(run())
+    finally:
+        executor.close()
+
+    assert results[0].status == "timeout"
+    assert executor.single_flight.metrics()["in_flight"] == 0
+
+
+def test_identical_calls_in_one_batch_coalesce():
+    executor = make_executor()
+    try:
+        results = executor.execute([ToolCall("slow", {"seconds": 0.2}) for _ in range(3)])
+        metrics = executor.metrics()["coalescing"]
+    finally:
+        executor.close()
+
+    assert all(result.ok for result in results)
+    assert (metrics["calls"], metrics["executions"], metrics["coalesced"]) == (3, 1, 2)
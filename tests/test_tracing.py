@@ -0,0 +1,132 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from houston100_tracing import ChromeTraceExporter, Tracer, propagate, tracer as process_tracer
+
+
+@pytest.fixture
+def trace_file(tmp_path):
+    return tmp_path / "traces" / "trace.json"
+
+
+def read_spans(tracer, path):
+    tracer.exporter.close()
+    # The JSON array format leaves the closing bracket off
+    events = json.loads(path.read_text().rstrip().rstrip(",") + "]")
+    return [event for event in events if event["ph"] == "X"]
+
+
+def test_disabled_tracer_is_a_no_op():
+    tracer = Tracer()
+
+    def function():
+        return 1
+
+    assert tracer.wrap(function, "f") is function
+    with tracer.span("root") as span:
+        span.set_attribute("ignored", True)
+        assert tracer.current_span() is span
+    assert tracer.metrics()["traces_started"] == 0
+
+
+def test_nested_spans_export_with_parent_links(trace_file):
+    tracer = Tracer(1.0, ChromeTraceExporter(str(trace_file)))
+
+    with tracer.span("conversation", user="u1") as root:
+        with tracer.span("agent.run"):
+            with tracer.span("tool.lookup") as tool:
+                tool.set_attribute("rows", 3)
+        assert tracer.current_span() is root
+
+    spans = {span["name"]: span for span in read_spans(tracer, trace_file)}
+    assert set(spans) == {"conversation", "agent.run", "tool.lookup"}
+    assert spans["conversation"]["args"]["parent_id"] is None
+    assert spans["conversation"]["args"]["user"] == "u1"
+    assert spans["agent.run"]["args"]["parent_id"] == spans["conversation"]["args"]["span_id"]
+    assert spans["tool.lookup"]["args"]["parent_id"] == spans["agent.run"]["args"]["span_id"]
+    assert spans["tool.lookup"]["args"]["rows"] == 3
+    assert len({span["args"]["trace_id"] for span in spans.values()}) == 1
+    assert spans["tool.lookup"]["cat"] == "tool"
+
+
+def test_errors_are_recorded_on_the_span(trace_file):
+    tracer = Tracer(1.0, ChromeTraceExporter(str(trace_file)))
+
+    with pytest.raises(ValueError):
+        with tracer.span("conversation"):
+            raise ValueError("bad input")
+
+    [span] = read_spans(tracer, trace_file)
+    assert span["args"]["error"] == "ValueError: bad input"
+
+
+def test_head_sampling_drops_whole_traces(trace_file):
+    tracer = Tracer(0.5, ChromeTraceExporter(str(trace_file)))
+
+    for _ in range(200):
+        with tracer.span("conversation"):
+            with tracer.span("agent.run"):
+                pass
+
+    spans = read_spans(tracer, trace_file)
+    metrics = tracer.metrics()
+    assert metrics["traces_started"] == 200
+    assert 50 < metrics["traces_sampled"] < 150
+    # Children follow the root's decision: every kept trace is complete
+    assert len(spans) == 2 * metrics["traces_sampled"]
+
+
+def test_manual_spans_stay_out_of_the_context_between_steps(trace_file):
+    tracer = Tracer(1.0, ChromeTraceExporter(str(trace_file)))
+
+    root = tracer.start_span("conversation")
+    assert tracer.current_span() is not root
+    with tracer.activate(root):
+        assert tracer.current_span() is root
+        with tracer.span("conversation.prompt"):
+            pass
+    assert tracer.current_span().trace is None
+    root.finish()
+
+    spans = {span["name"]: span for span in read_spans(tracer, trace_file)}
+    assert spans["conversation.prompt"]["args"]["parent_id"] == spans["conversation"]["args"]["span_id"]
+
+
+def test_spans_follow_work_into_threads_and_tasks(trace_file):
+    process_tracer.configure(1.0, ChromeTraceExporter(str(trace_file)))
+    try:
+        def tool():
+            with process_tracer.span("tool.thread"):
+                return threading.get_ident()
+
+        async def task():
+            with process_tracer.span("tool.task"):
+                await asyncio.sleep(0)
+
+        with process_tracer.span("conversation"):
+            with ThreadPoolExecutor(1) as pool:
+                worker = pool.submit(propagate(tool)).result()
+            asyncio.run(task())
+
+        spans = {span["name"]: span for span in read_spans(process_tracer, trace_file)}
+    finally:
+        process_tracer.configure(0.0)
+
+    root_id = spans["conversation"]["args"]["span_id"]
+    assert spans["tool.thread"]["args"]["parent_id"] == root_id
+    assert spans["tool.thread"]["tid"] == worker
+    assert spans["tool.task"]["args"]["parent_id"] == root_id
+
+
+def test_span_outliving_its_root_is_still_exported(trace_file):
+    tracer = Tracer(1.0, ChromeTraceExporter(str(trace_file)))
+
+    with tracer.span("conversation"):
+        late = tracer.start_span("tool.timed_out")
+    late.finish()
+
+    assert sorted(span["name"] for span in read_spans(tracer, trace_file)) == ["conversation", "tool.timed_out"]